@@ -0,0 +1,86 @@
+"""
+Recall/latency trade-off of the candidate ANN index on a synthetic applicant pool.
+
+Candidates are drawn from a set of roles (each a small skill subset), embedded with the LSA embedder and
+indexed; JD-like queries are then answered exactly (every list probed) and with each --probes setting.
+
+    python -m benchmarks.ann                          # 20k candidates
+    python -m benchmarks.ann --candidates 200000 --probes 4 8 16 32
+"""
+import time
+import random
+import argparse
+
+import numpy as np
+
+from benchmarks.common import percentile, peak_rss_mb, save_json, load_json, compare
+from benchmarks.corpus import resume_lines
+from resumentor.ann import CandidateIndex
+from resumentor.skills import predefined_skills
+
+def make_pool(n: int, n_roles: int, rng: random.Random):
+    roles = [rng.sample(predefined_skills, 8) for _ in range(n_roles)]
+    texts = ("\n".join(resume_lines(rng.randint(10, 60), rng, skills=roles[i % n_roles])) for i in range(n))
+    return roles, texts
+
+def run(args):
+    rng = random.Random(args.seed)
+    roles, texts = make_pool(args.candidates, args.roles, rng)
+    start = time.perf_counter()
+    index = CandidateIndex.build(texts, [f"c{i}" for i in range(args.candidates)], dim=args.dim,
+                                 fit_sample=args.fit_sample, seed=args.seed)
+    report = {"build": {"candidates": len(index), "lists": index.ivf.n_lists,
+                        "seconds": round(time.perf_counter() - start, 2)}}
+    queries = index.embedder.transform(["\n".join(resume_lines(30, rng, skills=rng.choice(roles)))
+                                        for _ in range(args.queries)])
+    exact, _ = index.ivf.search(queries, args.k, index.ivf.n_lists)
+    for n_probe in args.probes:
+        samples, recalls = [], []
+        for query, truth in zip(queries, exact):
+            start = time.perf_counter()
+            rows, _ = index.ivf.search(query, args.k, n_probe)
+            samples.append(time.perf_counter() - start)
+            recalls.append(len(set(rows[0].tolist()) & set(truth.tolist())) / args.k)
+        report[f"probe_{n_probe}"] = {"recall": round(float(np.mean(recalls)), 3),
+                                      "p50_ms": round(percentile(samples, 50) * 1000, 3),
+                                      "p95_ms": round(percentile(samples, 95) * 1000, 3)}
+    report["peak_rss_mb"] = peak_rss_mb()
+    return report
+
+def print_report(report):
+    build = report["build"]
+    print(f"indexed {build['candidates']} candidates into {build['lists']} lists in {build['seconds']}s")
+    print(f"{'probes':<12}{'recall@k':>10}{'p50 ms':>10}{'p95 ms':>10}")
+    for key, row in report.items():
+        if key.startswith("probe_"):
+            print(f"{key[6:]:<12}{row['recall']:>10.3f}{row['p50_ms']:>10.3f}{row['p95_ms']:>10.3f}")
+    print(f"peak RSS {report['peak_rss_mb']} MB")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--candidates", type=int, default=20000)
+    parser.add_argument("--roles", type=int, default=40, help="Distinct skill profiles in the pool")
+    parser.add_argument("--dim", type=int, default=128)
+    parser.add_argument("--fit-sample", type=int, default=5000)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument("--probes", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--save", help="Write the report as JSON")
+    parser.add_argument("--baseline", help="Compare against a saved JSON report")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown vs baseline (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    report = run(args)
+    print_report(report)
+    if args.save:
+        save_json(report, args.save)
+    if args.baseline:
+        regressions = compare(report, load_json(args.baseline), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
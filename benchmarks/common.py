@@ -0,0 +1,46 @@
+"""Helpers shared by the benchmark scripts: percentiles, peak RSS, JSON baselines."""
+import sys
+import json
+import resource
+
+def percentile(samples, q: float) -> float:
+    # Nearest-rank percentile; q in [0, 100]
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    rank = max(1, min(len(ordered), round(q / 100 * len(ordered) + 0.5)))
+    return ordered[rank - 1]
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+def save_json(report, path):
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+
+def load_json(path):
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+def flatten(report, prefix=""):
+    # {"a": {"b": 1}} -> {"a.b": 1}, numbers only
+    flat = {}
+    for key, value in report.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, name + "."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = value
+    return flat
+
+def compare(report, baseline, tolerance: float, suffixes=("_ms",)):
+    # Latency-like metrics (keys ending in one of `suffixes`) that grew by more than `tolerance`
+    current, before = flatten(report), flatten(baseline)
+    regressions = []
+    for key, value in sorted(current.items()):
+        old = before.get(key)
+        if key.endswith(suffixes) and old and value > old * (1 + tolerance):
+            regressions.append(f"{key}: {old} -> {value}")
+    return regressions
@@ -0,0 +1,138 @@
+"""
+Synthetic benchmark corpus: PDF/DOCX resumes of any page count, JDs of any length, skill taxonomies.
+
+    python -m benchmarks.corpus out/ --resumes 200 --pages 1 2 5   # writes resumes + jd.txt
+"""
+import io
+import os
+import random
+import zipfile
+import argparse
+
+from resumentor.extract import BytesUpload, PDF_MIME, DOCX_MIME
+from resumentor.skills import predefined_skills
+
+FILLER = (
+    "designed built delivered improved led migrated automated reduced latency cost by percent across team "
+    "platform service pipeline customers data reporting stakeholders production quality release weekly "
+    "the a and with for to of in on using across within"
+).split()
+SECTIONS = ["Summary", "Experience", "Projects", "Skills", "Education", "Certifications"]
+LINES_PER_PAGE = 48
+
+def _pdf_escape(line: str) -> str:
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+def make_pdf(pages) -> bytes:
+    # Minimal PDF 1.4 writer: one Helvetica text block per page, enough for pdfplumber
+    n = len(pages)
+    font_id = 3 + 2 * n
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{' '.join(f'{3 + 2 * i} 0 R' for i in range(n))}] /Count {n} >>",
+    ]
+    for i, lines in enumerate(pages):
+        content = "BT /F1 10 Tf 14 TL 60 760 Td " + " ".join(f"({_pdf_escape(l)}) '" for l in lines) + " ET"
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {4 + 2 * i} 0 R >>")
+        objects.append(f"<< /Length {len(content.encode('latin-1'))} >>\nstream\n{content}\nendstream")
+    objects.append("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for i, obj in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{i} 0 obj\n{obj}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += b"".join(f"{o:010d} 00000 n \n".encode() for o in offsets)
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return bytes(out)
+
+# Word-style paragraph/run properties, as real editors write around every run
+_STYLED_P = '<w:p w:rsidR="00A1B2C3" w:rsidRDefault="00D4E5F6"><w:pPr><w:spacing w:after="120" w:line="264"/></w:pPr>'
+_STYLED_R = ('<w:r w:rsidRPr="00C7D8E9"><w:rPr><w:rFonts w:ascii="Calibri" w:hAnsi="Calibri" w:cs="Calibri"/>'
+             '<w:sz w:val="22"/><w:szCs w:val="22"/><w:lang w:val="en-US"/></w:rPr>')
+
+def make_docx(paragraphs, image_bytes: int = 0, rng=None, styled: bool = False) -> bytes:
+    # Minimal WordprocessingML package; image_bytes adds an incompressible word/media part,
+    # styled wraps every word in its own formatted run like documents saved by Word
+    from xml.sax.saxutils import escape
+    if styled:
+        body = "".join(_STYLED_P + "".join(f'{_STYLED_R}<w:t xml:space="preserve">{escape(w)} </w:t></w:r>'
+                                           for w in p.split()) + "</w:p>" for p in paragraphs)
+    else:
+        body = "".join(f'<w:p><w:r><w:t xml:space="preserve">{escape(p)}</w:t></w:r></w:p>' for p in paragraphs)
+    document = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+                f'<w:body>{body}</w:body></w:document>')
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml",
+                    '<?xml version="1.0"?><Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                    '<Default Extension="xml" ContentType="application/xml"/>'
+                    '<Override PartName="/word/document.xml" '
+                    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+                    '</Types>')
+        zf.writestr("_rels/.rels",
+                    '<?xml version="1.0"?><Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/'
+                    'officeDocument" Target="word/document.xml"/></Relationships>')
+        zf.writestr("word/document.xml", document)
+        if image_bytes:
+            zf.writestr("word/media/image1.png", (rng or random).randbytes(image_bytes))
+    return buf.getvalue()
+
+def resume_lines(n_lines: int, rng: random.Random, skills=predefined_skills):
+    lines = []
+    for i in range(n_lines):
+        if i % 12 == 0:
+            lines.append(SECTIONS[(i // 12) % len(SECTIONS)])
+            continue
+        words = rng.choices(FILLER, k=rng.randint(6, 11)) + rng.sample(skills, k=2)
+        rng.shuffle(words)
+        lines.append(" ".join(words).capitalize())
+    return lines
+
+def make_resume(kind: str, pages: int, rng: random.Random, image_bytes: int = 0, styled: bool = False) -> BytesUpload:
+    lines = resume_lines(pages * LINES_PER_PAGE, rng)
+    if kind == "pdf":
+        chunks = [lines[i:i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)]
+        return BytesUpload(make_pdf(chunks), PDF_MIME, f"resume_{pages}p.pdf")
+    return BytesUpload(make_docx(lines, image_bytes, rng, styled), DOCX_MIME, f"resume_{pages}p.docx")
+
+def make_jd(n_words: int, rng: random.Random, skills=predefined_skills) -> str:
+    n_skills = max(3, n_words // 15)
+    words = rng.choices(FILLER, k=max(0, n_words - n_skills)) + rng.choices(skills, k=n_skills)
+    rng.shuffle(words)
+    return "We are hiring. " + " ".join(words) + ". You will lead and mentor engineers."
+
+def synthetic_taxonomy(size: int, rng: random.Random):
+    # The real dictionary first, then made-up 1–3 word terms up to `size`
+    terms = list(predefined_skills[:size])
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    while len(terms) < size:
+        terms.append(" ".join("".join(rng.choices(letters, k=rng.randint(3, 9))) for _ in range(rng.randint(1, 3))))
+    return terms
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("output_dir")
+    parser.add_argument("--resumes", type=int, default=100)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 2, 5])
+    parser.add_argument("--jd-words", type=int, default=120)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    os.makedirs(args.output_dir, exist_ok=True)
+    for i in range(args.resumes):
+        upload = make_resume(rng.choice(["pdf", "docx"]), rng.choice(args.pages), rng)
+        with open(os.path.join(args.output_dir, f"{i:05d}_{upload.name}"), "wb") as fh:
+            fh.write(upload.getvalue())
+    with open(os.path.join(args.output_dir, "jd.txt"), "w", encoding="utf-8") as fh:
+        fh.write(make_jd(args.jd_words, rng))
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,205 @@
+"""
+Per-stage latency, throughput and memory of the analysis pipeline on a synthetic corpus:
+extract_text -> parse_sections -> clean_text -> match_score -> highlight_missing_skills
+-> generate_ai_suggestions -> highlight_resume_text.
+
+    python -m benchmarks.pipeline                              # default run
+    python -m benchmarks.pipeline --save pipeline.json         # keep a baseline
+    python -m benchmarks.pipeline --baseline pipeline.json     # exit 1 on p50/p95 regressions
+"""
+import io
+import time
+import random
+import argparse
+import tracemalloc
+
+from benchmarks.common import percentile, peak_rss_mb, save_json, load_json, compare
+from benchmarks.corpus import make_resume, make_jd, synthetic_taxonomy
+from resumentor.extract import extract_text, clean_text
+from resumentor.scoring import match_score
+from resumentor.sections import parse_sections
+from resumentor.skills import SkillMatcher, highlight_missing_skills, highlight_resume_text, highlight_spans
+from resumentor.suggestions import generate_ai_suggestions
+
+STAGES = ["extract_text", "parse_sections", "clean_text", "match_score", "highlight_missing_skills",
+          "generate_ai_suggestions", "highlight_resume_text"]
+
+def run_pipeline(upload, job_desc, timings=None):
+    # One resume through every stage; appends seconds per stage to `timings`
+    def timed(stage, fn, *args):
+        start = time.perf_counter()
+        result = fn(*args)
+        if timings is not None:
+            timings[stage].append(time.perf_counter() - start)
+        return result
+
+    upload.seek(0)
+    raw = timed("extract_text", extract_text, upload)
+    timed("parse_sections", parse_sections, raw)
+    resume_text = timed("clean_text", clean_text, raw)
+    score = timed("match_score", match_score, resume_text, job_desc)
+    matched, missing = timed("highlight_missing_skills", highlight_missing_skills, resume_text, job_desc)
+    timed("generate_ai_suggestions", generate_ai_suggestions, score, matched, missing, job_desc, resume_text)
+    timed("highlight_resume_text", highlight_resume_text, resume_text, matched)
+
+def _summary(samples):
+    return {
+        "p50_ms": round(percentile(samples, 50) * 1000, 3),
+        "p95_ms": round(percentile(samples, 95) * 1000, 3),
+        "mean_ms": round(sum(samples) / len(samples) * 1000, 3) if samples else 0.0,
+    }
+
+def bench_stages(docs, job_desc):
+    timings = {stage: [] for stage in STAGES}
+    start = time.perf_counter()
+    for upload in docs:
+        run_pipeline(upload, job_desc, timings)
+    elapsed = time.perf_counter() - start
+    report = {stage: _summary(samples) for stage, samples in timings.items()}
+    report["total"] = {"docs": len(docs), "seconds": round(elapsed, 3),
+                       "docs_per_second": round(len(docs) / elapsed, 2) if elapsed else 0.0}
+    return report
+
+def bench_stage_memory(upload, job_desc):
+    # Peak Python allocations per stage (tracemalloc), measured separately from the timings
+    peaks = {}
+    upload.seek(0)
+    steps = [
+        ("extract_text", lambda state: extract_text(upload)),
+        ("clean_text", lambda state: clean_text(state["extract_text"])),
+        ("match_score", lambda state: match_score(state["clean_text"], job_desc)),
+        ("highlight_missing_skills", lambda state: highlight_missing_skills(state["clean_text"], job_desc)),
+        ("generate_ai_suggestions", lambda state: generate_ai_suggestions(
+            state["match_score"], *state["highlight_missing_skills"], job_desc, state["clean_text"])),
+        ("highlight_resume_text", lambda state: highlight_resume_text(
+            state["clean_text"], state["highlight_missing_skills"][0])),
+    ]
+    state = {}
+    for stage, step in steps:
+        tracemalloc.start()
+        state[stage] = step(state)
+        peaks[stage] = {"peak_kib": round(tracemalloc.get_traced_memory()[1] / 1024, 1)}
+        tracemalloc.stop()
+    return peaks
+
+def _peak_kib(fn, *args):
+    tracemalloc.start()
+    fn(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return round(peak / 1024, 1)
+
+def bench_docx_memory(rng):
+    # Peak allocations of the streaming DOCX extractor vs docx2txt (whole-part parse), when installed
+    try:
+        import docx2txt
+    except ImportError:
+        docx2txt = None
+    cases = {
+        "plain_40p": make_resume("docx", 40, rng),
+        "styled_40p": make_resume("docx", 40, rng, styled=True),
+        "images_2p": make_resume("docx", 2, rng, image_bytes=8 << 20, styled=True),
+    }
+    report = {}
+    for name, upload in cases.items():
+        row = {"streaming_peak_kib": _peak_kib(extract_text, upload)}
+        if docx2txt is not None:
+            row["docx2txt_peak_kib"] = _peak_kib(docx2txt.process, io.BytesIO(upload.getvalue()))
+        report[name] = row
+    return report
+
+def bench_resume_length(page_counts, job_desc, rng, repeat):
+    curve = {}
+    for kind in ("pdf", "docx"):
+        for pages in page_counts:
+            docs = [make_resume(kind, pages, rng) for _ in range(repeat)]
+            stages = bench_stages(docs, job_desc)
+            curve[f"{kind}_{pages}p"] = {stage: stages[stage]["p50_ms"] for stage in STAGES}
+    return {name: {f"{stage}_p50_ms": ms for stage, ms in row.items()} for name, row in curve.items()}
+
+def bench_dictionary_size(sizes, resume_text, rng, repeat):
+    curve = {}
+    for size in sizes:
+        start = time.perf_counter()
+        matcher = SkillMatcher(synthetic_taxonomy(size, rng))
+        build = time.perf_counter() - start
+        find, highlight = [], []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            spans = matcher.find(resume_text)
+            find.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            highlight_spans(resume_text, spans)
+            highlight.append(time.perf_counter() - start)
+        curve[str(size)] = {
+            "build_ms": round(build * 1000, 3),
+            "find_p50_ms": round(percentile(find, 50) * 1000, 3),
+            "highlight_p50_ms": round(percentile(highlight, 50) * 1000, 3),
+        }
+    return curve
+
+def run(args):
+    rng = random.Random(args.seed)
+    job_desc = make_jd(args.jd_words, rng)
+    docs = [make_resume(rng.choice(["pdf", "docx"]), rng.choice(args.pages), rng) for _ in range(args.docs)]
+    run_pipeline(docs[0], job_desc)  # warm imports so the first sample isn't an import benchmark
+
+    report = {"config": {"docs": args.docs, "pages": args.pages, "jd_words": args.jd_words, "seed": args.seed}}
+    report["stages"] = bench_stages(docs, job_desc)
+    if args.memory:
+        report["stage_memory"] = bench_stage_memory(docs[0], job_desc)
+        report["docx_memory"] = bench_docx_memory(rng)
+    if not args.quick:
+        report["resume_length"] = bench_resume_length(args.length_curve, job_desc, rng, args.repeat)
+        long_text = clean_text(extract_text(make_resume("docx", max(args.length_curve), rng)))
+        report["dictionary_size"] = bench_dictionary_size(args.dictionary_curve, long_text, rng, args.repeat)
+    report["peak_rss_mb"] = peak_rss_mb()
+    return report
+
+def print_report(report):
+    print(f"{'stage':<26}{'p50 ms':>10}{'p95 ms':>10}")
+    for stage in STAGES:
+        row = report["stages"][stage]
+        print(f"{stage:<26}{row['p50_ms']:>10.2f}{row['p95_ms']:>10.2f}")
+    total = report["stages"]["total"]
+    print(f"throughput: {total['docs_per_second']} docs/s over {total['docs']} docs; peak RSS {report['peak_rss_mb']} MB")
+    for stage, row in report.get("stage_memory", {}).items():
+        print(f"  peak alloc {stage:<24}{row['peak_kib']:>10.1f} KiB")
+    for name, row in report.get("docx_memory", {}).items():
+        print(f"  docx {name:<12} streaming {row['streaming_peak_kib']:>10.1f} KiB"
+              + (f", docx2txt {row['docx2txt_peak_kib']:>10.1f} KiB" if "docx2txt_peak_kib" in row else ""))
+    for name, row in report.get("resume_length", {}).items():
+        print(f"  length {name:<10} " + "  ".join(f"{k.replace('_p50_ms', '')}={v:.1f}" for k, v in row.items()))
+    for size, row in report.get("dictionary_size", {}).items():
+        print(f"  dictionary {size:>6}: build {row['build_ms']:.1f} ms, find {row['find_p50_ms']:.2f} ms, "
+              f"highlight {row['highlight_p50_ms']:.2f} ms")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=50, help="Resumes in the main per-stage run")
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 2, 3], help="Page counts to sample from")
+    parser.add_argument("--jd-words", type=int, default=120)
+    parser.add_argument("--length-curve", type=int, nargs="+", default=[1, 2, 5, 10, 20])
+    parser.add_argument("--dictionary-curve", type=int, nargs="+", default=[50, 500, 5000, 50000])
+    parser.add_argument("--repeat", type=int, default=5, help="Samples per point on the scaling curves")
+    parser.add_argument("--memory", action="store_true", help="Also report per-stage peak allocations")
+    parser.add_argument("--quick", action="store_true", help="Skip the scaling curves")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--save", help="Write the report as JSON")
+    parser.add_argument("--baseline", help="Compare against a saved JSON report")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown vs baseline (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    report = run(args)
+    print_report(report)
+    if args.save:
+        save_json(report, args.save)
+    if args.baseline:
+        regressions = compare(report, load_json(args.baseline), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,91 @@
+"""
+Cold-start import cost per app page, measured with `python -X importtime`. Each page imports the modules
+main.py declares for it in PAGE_WARMUP (the same lists the app warms in the background).
+
+    python -m benchmarks.startup                      # table
+    python -m benchmarks.startup --save startup.json  # keep a baseline
+    python -m benchmarks.startup --baseline startup.json --tolerance 0.25
+"""
+import os
+import ast
+import sys
+import argparse
+import subprocess
+import statistics
+
+from benchmarks.common import compare, save_json, load_json
+
+# What every page pays before its own imports
+BASE_IMPORTS = ["streamlit", "resumentor.warmup"]
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+
+def page_modules(app_path: str = APP_PATH) -> dict:
+    # main.py's PAGE_WARMUP literal, read without running the Streamlit script
+    with open(app_path, encoding="utf-8") as fh:
+        tree = ast.parse(fh.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(t, "id", None) == "PAGE_WARMUP" for t in node.targets):
+            return ast.literal_eval(node.value)
+    raise LookupError(f"No PAGE_WARMUP in {app_path}")
+
+def parse_importtime(stderr: str):
+    # -> [(module, self_us, cumulative_us)] for top-level imports only
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, self_us, cum_us, name = (part for part in line.replace("import time:", "|", 1).split("|"))
+        if name.startswith("  "):
+            continue  # nested import, already included in its parent's cumulative time
+        rows.append((name.strip(), int(self_us), int(cum_us)))
+    return rows
+
+def measure(preload, modules):
+    # Import `preload` silently, then time only what `modules` add on top of it
+    code = "".join(f"import {m}\n" for m in preload)
+    code += "import sys; sys.stderr.write('--mark--\\n')\n"
+    code += "".join(f"import {m}\n" for m in modules)
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          capture_output=True, text=True, check=True)
+    stderr = proc.stderr.split("--mark--\n", 1)[1]
+    rows = parse_importtime(stderr)
+    return sum(cum for _, _, cum in rows) / 1000.0, sorted(rows, key=lambda r: -r[2])
+
+def run(repeat: int = 3, top: int = 5):
+    report = {}
+    pages = {"(base)": ([], BASE_IMPORTS)}
+    pages.update({page: (BASE_IMPORTS, modules) for page, modules in page_modules().items()})
+    for page, (preload, modules) in pages.items():
+        samples, rows = [], []
+        for _ in range(repeat):
+            total_ms, rows = measure(preload, modules)
+            samples.append(total_ms)
+        report[page] = {
+            "import_ms": round(statistics.median(samples), 1),
+            "top_modules": [{"module": name, "cumulative_ms": round(cum / 1000.0, 1)} for name, _, cum in rows[:top]],
+        }
+    return report
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh interpreters per page (median is reported)")
+    parser.add_argument("--save", help="Write the report as JSON")
+    parser.add_argument("--baseline", help="Compare against a saved JSON report")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown vs baseline (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    report = run(args.repeat)
+    for page, entry in report.items():
+        top = ", ".join(f"{m['module']} {m['cumulative_ms']}ms" for m in entry["top_modules"]) or "-"
+        print(f"{page:<18} {entry['import_ms']:>8.1f} ms   {top}")
+    if args.save:
+        save_json(report, args.save)
+    if args.baseline:
+        regressions = compare(report, load_json(args.baseline), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,9 +1,11 @@
 import time
 import random
+import hashlib
+import zipfile
 import streamlit as st
 
-from resume import sample_jds, extract_text, clean_text, match_score, highlight_missing_skills, generate_ai_suggestions, \
-    highlight_resume_text, generate_text_report
+# Heavy dependencies (pdfplumber, sklearn, pandas, ...) are imported inside the page that needs them
+from resumentor.warmup import start_warmup
 
 # -------------------- Page Config --------------------
 st.set_page_config(page_title="ResuMentor AI", layout="wide")
@@ -429,6 +431,24 @@ navbar_html = f"""
 
 st.markdown(navbar_html, unsafe_allow_html=True)
 
+# -------------------- Page Warm-up --------------------
+# What each page below imports: its own imports plus the heavy modules the resumentor functions it calls
+# import lazily. Warmed in the background after the first paint (start_warmup at the end of the script);
+# update the list when a page's imports change. benchmarks/startup.py times these lists too.
+PAGE_WARMUP = {
+    "Resume Analyzer": [
+        "resumentor.jds", "resumentor.extract", "resumentor.report", "resumentor.jd_index", "resumentor.jobs",
+        "resumentor.pipeline", "resumentor.sections", "resumentor.skills", "resumentor.tracing",
+        "resumentor.batch", "pdfplumber", "scipy.sparse",
+        "sklearn.preprocessing",                                                # best-fit roles (JD index)
+        "sklearn.feature_extraction.text", "sklearn.metrics.pairwise",          # batch ranking (BatchScorer)
+    ],
+    "Dashboard": [
+        "pandas", "altair", "plost", "pyarrow.parquet", "resumentor.datasets", "resumentor.versions",
+        "resumentor.profiling", "resumentor.charts", "resumentor.cleaning", "matplotlib.pyplot",
+    ],
+}
+
 # -------------------- Page Content --------------------
 if active_page == "Home":
     # Hero Section
@@ -535,96 +555,313 @@ if active_page == "Home":
 
 elif active_page == "Resume Analyzer":
     # ---------------------- Resume Analyzer ----------------------
-    import pdfplumber
-    import docx2txt
-    import re
-    import base64
-    from sklearn.feature_extraction.text import TfidfVectorizer
-    from sklearn.metrics.pairwise import cosine_similarity
+    from resumentor import sample_jds, extract_text, clean_text, render_text_report, \
+        iter_pdf_pages, PDF_MIME, extraction_cache
+    from resumentor.extract import MAX_PDF_PAGES, PDF_PAGE_TIMEOUT
+    from resumentor.jd_index import sample_jd_index, library_jd_index
+    from resumentor.jobs import default_job_manager, QueueFull
+    from resumentor.pipeline import analyze_resume, analysis_cache
+    from resumentor.sections import section_lengths
+    from resumentor.skills import skill_taxonomy
+    from resumentor.tracing import tracer, profile_engine
+
+    JOB_POLL_SECONDS = 0.5
+
+    def extract_text_streaming(file, timed_out=None):
+        # Show pages as they come in so long PDFs don't look frozen
+        if file.type != PDF_MIME:
+            return extract_text(file)
+        status, preview = st.empty(), st.empty()
+        pages = []
+        with tracer.span("extract_text", file.size):
+            for i, page_text in enumerate(iter_pdf_pages(file, max_pages=MAX_PDF_PAGES, page_timeout=PDF_PAGE_TIMEOUT,
+                                                         timed_out=timed_out), start=1):
+                pages.append(page_text + "\n")
+                status.caption(f"⏳ Extracted page {i}…")
+                preview.text(page_text[:600])
+        status.empty()
+        preview.empty()
+        return "".join(pages)
+
+    def load_resume_text(file, timed_out=None):
+        # Reruns (JD change, tab switch) reuse the text extracted from these exact bytes, unless pages timed out
+        cache_key = extraction_cache.key(file.getvalue(), file.type, MAX_PDF_PAGES)
+        text = extraction_cache.get(cache_key)
+        if text is None:
+            timed_out = [] if timed_out is None else timed_out
+            text = extract_text_streaming(file, timed_out)
+            if not timed_out:
+                extraction_cache.put(cache_key, text)
+        return text
+
+    def run_analysis(file, job_desc, jd_title, run):
+        # -> (analysis or None, still pending). Uses the background job pool unless RESUMENTOR_JOB_WORKERS=0.
+        # `run` is this rerun's tracer run; polls drop it, and a job's result is recorded as a run of its own
+        job_manager = default_job_manager()
+        jd_entry = sample_jd_index().entry(jd_title) if jd_title else None
+        if job_manager is None:
+            return analyze_resume(file, job_desc, jd_entry, extract=load_resume_text, max_pages=MAX_PDF_PAGES), False
+        # Reruns and JD changes for a resume this process has already seen skip the job queue
+        resume_key = analysis_cache.resume_key(file.getvalue(), file.type, MAX_PDF_PAGES)
+        analysis = analysis_cache.analyze(resume_key, job_desc, jd_entry)
+        if analysis is not None:
+            return analysis, False
+        job_id = job_manager.job_id(file.getvalue(), job_desc)
+        record = job_manager.status(job_id)
+        retry = False
+        # Only the rerun that submits the job keeps its own run
+        run["keep"] = False
+        if record is not None and record["status"] == "failed":
+            # Polling stops here; only Retry (or another resume/JD) submits the pair again
+            st.error(f"❌ Could not analyze this resume: {record['error']}")
+            retry = st.button("🔁 Retry analysis", key=f"retry_{job_id}")
+            if not retry:
+                return None, False
+        if record is None or retry:
+            try:
+                # The worker profiles the analysis itself when this run is profiled
+                job_manager.submit(file.getvalue(), file.type, job_desc, jd_title, retry=retry,
+                                   profile=profile_request)
+                run["keep"] = True
+            except QueueFull:
+                st.warning("⚠️ The analyzer is busy right now — your resume will be picked up shortly.")
+                return None, True
+            record = job_manager.status(job_id)
+            if record is None:
+                # Evicted between submit and poll; the next poll resubmits it
+                return None, True
+        if record["status"] == "done":
+            # The job's run: submission to result, with the worker's stages (already counted) after its queue wait
+            queued = {"stage": "job_queue", "wall_ms": round((record["started_at"] - record["submitted_at"]) * 1000, 3),
+                      "cpu_ms": 0.0, "bytes": 0, "error": False}
+            tracer.record_run("resume_analyzer", record["submitted_at"],
+                              (record["finished_at"] - record["submitted_at"]) * 1000, [queued] + record["stages"],
+                              profile=record["profile"])
+            analysis_cache.remember(resume_key, job_desc, record["result"])
+            return record["result"], False
+        waiting = "Queued" if record["status"] == "queued" else "Analyzing"
+        st.info(f"⏳ {waiting} your resume… ({time.time() - record['submitted_at']:.0f}s)")
+        return None, True
 
     st.markdown('<div class="section">', unsafe_allow_html=True)
     st.subheader("📄 AI-Powered Resume Analyzer")
     st.caption("Upload your resume and choose/paste a job description. Get ATS-style scoring, skill gaps, and AI suggestions to improve your match.")
     st.markdown('</div>', unsafe_allow_html=True)
 
+    # ?profile=1 (or =pyinstrument) profiles this run; ?diag=1 shows the diagnostics panel
+    # (None defers to $RESUMENTOR_PROFILE, in the app and in job workers alike)
+    profile_request = profile_engine(st.query_params.get("profile"))
+
     # ---------------------- UI ----------------------
-    with st.container():
+    analyzer_mode = st.radio("Mode", ["🎯 Match a job description", "🔎 Find best-fit roles", "📦 Rank a batch"],
+                             horizontal=True, label_visibility="collapsed")
+
+    if analyzer_mode == "🔎 Find best-fit roles":
+        # Reverse search: rank the whole JD library for one resume
+        jd_library = library_jd_index()
+        c1, c2 = st.columns([2, 1])
+        with c1:
+            uploaded_file = st.file_uploader("📂 Upload Resume (PDF/DOCX)", type=["pdf", "docx"], key="best_fit_resume")
+        with c2:
+            top_k = st.slider("Roles to show", min_value=3, max_value=50, value=10)
+        st.caption(f"Searching {len(jd_library):,} job descriptions.")
+
+        if uploaded_file:
+            with tracer.run("best_fit_roles", profile=profile_request):
+                resume_text = clean_text(load_resume_text(uploaded_file))
+                # Parents of the resume's skills count as present (postgresql covers sql)
+                resume_skills = set(skill_taxonomy.names_of(skill_taxonomy.with_ancestors(skill_taxonomy.mask_in(resume_text))))
+                rows = []
+                for title, score in jd_library.top_k(resume_text, top_k):
+                    jd_skills = jd_library.skills_of(title)
+                    rows.append({
+                        "Role": title,
+                        "Match %": score,
+                        "Skills you have": ", ".join(sorted(jd_skills & resume_skills)) or "-",
+                        "Skills to add": ", ".join(sorted(jd_skills - resume_skills)) or "-",
+                    })
+            if rows:
+                st.dataframe(rows, use_container_width=True, hide_index=True)
+            else:
+                st.info("No overlap between this resume and the job library.")
+        else:
+            st.info("➡️ Please upload a resume to find the best-fit roles.")
+    elif analyzer_mode == "📦 Rank a batch":
+        # Bulk ingestion: every resume in a ZIP against one JD, extracted on a process pool
+        from resumentor.batch import iter_batch_items, count_batch_items, ingest, rank_batch, MAX_BATCH_FILES
+        from resumentor.report import export_bytes
         c1, c2 = st.columns([1, 1])
         with c1:
-            jd_option = st.selectbox("📌 Choose a sample job description (or select 'Custom')",
-                                     ["Custom"] + list(sample_jds.keys()))
+            batch_jd_option = st.selectbox("📌 Job description", ["Custom"] + list(sample_jds.keys()), key="batch_jd")
         with c2:
-            uploaded_file = st.file_uploader("📂 Upload Resume (PDF/DOCX)", type=["pdf", "docx"])
-
-    if jd_option != "Custom":
-        job_description = sample_jds[jd_option]
-        st.markdown('<div class="card">', unsafe_allow_html=True)
-        st.text_area("📝 Selected Job Description", job_description, height=150, key="jd_fixed")
-        st.markdown('</div>', unsafe_allow_html=True)
+            batch_zip = st.file_uploader(f"📦 Upload a ZIP of resumes (PDF/DOCX, up to {MAX_BATCH_FILES:,})", type=["zip"])
+        if batch_jd_option != "Custom":
+            batch_jd = sample_jds[batch_jd_option]
+        else:
+            batch_jd = st.text_area("📝 Paste Job Description Here", height=150, key="batch_jd_text",
+                                    placeholder="Paste the target job description here...")
+
+        if batch_zip and batch_jd.strip():
+            batch_key = hashlib.sha256(batch_zip.getvalue() + batch_jd.encode("utf-8")).hexdigest()
+            # Rankings survive reruns (sorting, downloads) until the archive or the JD changes
+            if st.session_state.get("batch_key") != batch_key and st.button("🚀 Rank resumes", type="primary"):
+                jd_entry = sample_jd_index().entry(batch_jd_option) if batch_jd_option != "Custom" else None
+                # Count from the member list; members are then decompressed one at a time as workers free up
+                try:
+                    n_items = count_batch_items(batch_zip)
+                except (ValueError, zipfile.BadZipFile) as e:
+                    st.error(f"❌ Could not read this archive: {e}")
+                    n_items = None
+                if n_items is not None:
+                    progress = st.progress(0.0, text=f"Reading {n_items} resumes…")
+                    results = []
+                    with tracer.run("batch_ranking", profile=profile_request):
+                        items = iter_batch_items(batch_zip)
+                        for done, result in enumerate(ingest(items, max_pages=MAX_PDF_PAGES), start=1):
+                            results.append(result)
+                            progress.progress(done / max(n_items, 1), text=f"Read {done}/{n_items} resumes")
+                        with tracer.span("rank_batch", len(results)):
+                            rows = rank_batch(results, batch_jd, jd_entry)
+                    progress.empty()
+                    st.session_state["batch_key"], st.session_state["batch_rows"] = batch_key, rows
+            if st.session_state.get("batch_key") == batch_key:
+                rows = st.session_state["batch_rows"]
+                ranked = [row for row in rows if row["error"] is None]
+                failed = [row for row in rows if row["error"] is not None]
+                st.caption(f"Ranked {len(ranked)} of {len(rows)} resumes" + (f" · {len(failed)} could not be read" if failed else ""))
+                if ranked:
+                    st.dataframe([{"Rank": i, "File": row["file"], "Match %": row["score"],
+                                   "Matched": len(row["matched"]), "Missing": len(row["missing"]),
+                                   "Skills to add": ", ".join(row["missing"]) or "-"}
+                                  for i, row in enumerate(ranked, start=1)],
+                                 use_container_width=True, hide_index=True)
+                if failed:
+                    with st.expander(f"⚠️ {len(failed)} files skipped"):
+                        st.dataframe([{"File": row["file"], "Error": row["error"]} for row in failed],
+                                     use_container_width=True, hide_index=True)
+                d1, d2 = st.columns([1, 1])
+                with d1:
+                    st.download_button("📥 Download ranking (CSV)", export_bytes(rows, "csv"),
+                                       file_name="resume_ranking.csv", mime="text/csv")
+                with d2:
+                    st.download_button("📥 Download all reports (ZIP)", export_bytes(rows, "zip"),
+                                       file_name="resume_reports.zip", mime="application/zip")
+        else:
+            st.info("➡️ Please upload a ZIP of resumes and provide/select a job description.")
     else:
-        st.markdown('<div class="card">', unsafe_allow_html=True)
-        job_description = st.text_area("📝 Paste Job Description Here", height=200,
-                                       placeholder="Paste the target job description here...")
-        st.markdown('</div>', unsafe_allow_html=True)
-
-    if uploaded_file and job_description.strip():
-        # Extract, clean, score, highlight, generate suggestions, and show report
-        resume_text_raw = extract_text(uploaded_file)
-        resume_text = clean_text(resume_text_raw)
-        score = match_score(resume_text, job_description)
-        matched, missing = highlight_missing_skills(resume_text, job_description)
-
-        top = st.container()
-        with top:
-            colA, colB = st.columns([1, 2], vertical_alignment="center")
-            with colA:
-                if score < 50:
-                    color = "#c62828"
-                elif score < 75:
-                    color = "#ef6c00"
-                else:
-                    color = "#2e7d32"
-                st.markdown(f'<div class="card" style="text-align:center;">', unsafe_allow_html=True)
-                st.markdown(f'<div class="score-circle" style="background-color:{color}">{score}%</div>', unsafe_allow_html=True)
-                st.caption("ATS Match Score")
-                st.progress(score/100)
-                st.markdown("</div>", unsafe_allow_html=True)
-
-            with colB:
-                st.markdown('<div class="card">', unsafe_allow_html=True)
-                st.subheader("💡 AI Suggestions to Improve")
-                suggestions = generate_ai_suggestions(score, matched, missing, job_description, resume_text)
-                st.markdown('<div class="sugg-box">', unsafe_allow_html=True)
-                st.markdown('<span class="sugg-title">🛠️ Focus Areas</span>', unsafe_allow_html=True)
-                st.markdown("<ul class='sugg-list'>" + "".join([f"<li>{s}</li>" for s in suggestions]) + "</ul>", unsafe_allow_html=True)
-                st.markdown('</div>', unsafe_allow_html=True)
-                st.markdown("</div>", unsafe_allow_html=True)
-
-        st.markdown('<div class="card">', unsafe_allow_html=True)
-        tabs = st.tabs(["✅ Matched Skills", "⚠️ Missing Skills", "📜 Resume Text", "⬇️ Report"])
-        with tabs[0]:
-            if matched:
-                st.markdown("<div class='skill-container'>" +
-                            "".join([f"<span class='tag tag-green'>✅ {skill}</span>" for skill in matched]) +
-                            "</div>", unsafe_allow_html=True)
-            else:
-                st.info("No relevant matched skills found from the predefined dictionary.")
-        with tabs[1]:
-            if missing:
-                st.markdown("<div class='skill-container'>" +
-                            "".join([f"<span class='tag tag-red'>❌ {skill}</span>" for skill in missing]) +
-                            "</div>", unsafe_allow_html=True)
+        with st.container():
+            c1, c2 = st.columns([1, 1])
+            with c1:
+                jd_option = st.selectbox("📌 Choose a sample job description (or select 'Custom')",
+                                         ["Custom"] + list(sample_jds.keys()))
+            with c2:
+                uploaded_file = st.file_uploader("📂 Upload Resume (PDF/DOCX)", type=["pdf", "docx"])
+
+        if jd_option != "Custom":
+            job_description = sample_jds[jd_option]
+            st.markdown('<div class="card">', unsafe_allow_html=True)
+            st.text_area("📝 Selected Job Description", job_description, height=150, key="jd_fixed")
+            st.markdown('</div>', unsafe_allow_html=True)
+        else:
+            st.markdown('<div class="card">', unsafe_allow_html=True)
+            job_description = st.text_area("📝 Paste Job Description Here", height=200,
+                                           placeholder="Paste the target job description here...")
+            st.markdown('</div>', unsafe_allow_html=True)
+
+        if uploaded_file and job_description.strip():
+            with tracer.run("resume_analyzer", profile=profile_request) as run:
+                # Extract, clean, score, highlight, generate suggestions, and show report
+                analysis, pending = run_analysis(uploaded_file, job_description,
+                                                 None if jd_option == "Custom" else jd_option, run)
+                if analysis is not None:
+                    resume_text, score = analysis["resume_text"], analysis["score"]
+                    matched, missing, suggestions = analysis["matched"], analysis["missing"], analysis["suggestions"]
+                    if analysis["timed_out_pages"]:
+                        pages = ", ".join(str(i + 1) for i in analysis["timed_out_pages"])
+                        st.warning(f"⚠️ Page(s) {pages} took longer than {PDF_PAGE_TIMEOUT}s to read and were skipped.")
+
+                    top = st.container()
+                    with top:
+                        colA, colB = st.columns([1, 2], vertical_alignment="center")
+                        with colA:
+                            if score < 50:
+                                color = "#c62828"
+                            elif score < 75:
+                                color = "#ef6c00"
+                            else:
+                                color = "#2e7d32"
+                            st.markdown(f'<div class="card" style="text-align:center;">', unsafe_allow_html=True)
+                            st.markdown(f'<div class="score-circle" style="background-color:{color}">{score}%</div>', unsafe_allow_html=True)
+                            st.caption("ATS Match Score")
+                            st.progress(score/100)
+                            st.caption(f"Section-weighted: {analysis['section_score']}%",
+                                       help="Keywords under Skills, Experience and Projects count more than ones in the header or hobbies.")
+                            st.markdown("</div>", unsafe_allow_html=True)
+
+                        with colB:
+                            st.markdown('<div class="card">', unsafe_allow_html=True)
+                            st.subheader("💡 AI Suggestions to Improve")
+                            st.markdown('<div class="sugg-box">', unsafe_allow_html=True)
+                            st.markdown('<span class="sugg-title">🛠️ Focus Areas</span>', unsafe_allow_html=True)
+                            st.markdown("<ul class='sugg-list'>" + "".join([f"<li>{s}</li>" for s in suggestions]) + "</ul>", unsafe_allow_html=True)
+                            st.markdown('</div>', unsafe_allow_html=True)
+                            st.markdown("</div>", unsafe_allow_html=True)
+
+                    st.markdown('<div class="card">', unsafe_allow_html=True)
+                    tabs = st.tabs(["✅ Matched Skills", "⚠️ Missing Skills", "📜 Resume Text", "⬇️ Report"])
+                    with tabs[0]:
+                        if matched:
+                            st.markdown("<div class='skill-container'>" +
+                                        "".join([f"<span class='tag tag-green'>✅ {skill}</span>" for skill in matched]) +
+                                        "</div>", unsafe_allow_html=True)
+                        else:
+                            st.info("No relevant matched skills found from the predefined dictionary.")
+                    with tabs[1]:
+                        if missing:
+                            st.markdown("<div class='skill-container'>" +
+                                        "".join([f"<span class='tag tag-red'>❌ {skill}</span>" for skill in missing]) +
+                                        "</div>", unsafe_allow_html=True)
+                        else:
+                            st.success("Awesome! No missing skills detected against this JD.")
+                    with tabs[2]:
+                        detected = section_lengths(analysis["resume"].sections)
+                        st.caption("Sections found: " + ", ".join(f"{name.title()} ({n} words)" for name, n in detected.items()))
+                        with st.expander("Show Extracted Resume Content"):
+                            st.markdown(analysis["highlighted"], unsafe_allow_html=True)
+                    with tabs[3]:
+                        st.download_button("📥 Download Report", render_text_report(score, matched, missing),
+                                           file_name="resume_report.txt", mime="text/plain")
+                    st.markdown('</div>', unsafe_allow_html=True)
+            if pending:
+                # Poll until the background job finishes
+                time.sleep(JOB_POLL_SECONDS)
+                st.rerun()
+        else:
+            st.info("➡️ Please upload a resume and provide/select a job description to see results.")
+
+    # ---------------------- Diagnostics ----------------------
+    if st.query_params.get("diag"):
+        with st.expander("🩺 Diagnostics (last runs)"):
+            runs = list(tracer.runs)[::-1]
+            if runs:
+                rows = []
+                for run in runs:
+                    row = {"Run": run["label"], "Started": time.strftime("%H:%M:%S", time.localtime(run["started_at"])),
+                           "Total ms": run["wall_ms"]}
+                    for span in run["stages"]:
+                        row[f"{span['stage']} ms"] = round(row.get(f"{span['stage']} ms", 0) + span["wall_ms"], 2)
+                    # Whatever isn't a traced stage is Streamlit rendering and glue code (IPC for job runs)
+                    row["render/other ms"] = round(run["wall_ms"] - sum(span["wall_ms"] for span in run["stages"]), 2)
+                    rows.append(row)
+                st.dataframe(rows, use_container_width=True, hide_index=True)
+                profiled = next((run for run in runs if run["profile"]), None)
+                if profiled:
+                    st.caption(f"Latest profile ({profiled['label']})")
+                    st.code(profiled["profile"], language="text")
             else:
-                st.success("Awesome! No missing skills detected against this JD.")
-        with tabs[2]:
-            with st.expander("Show Extracted Resume Content"):
-                highlighted = highlight_resume_text(resume_text, matched)
-                st.markdown(highlighted, unsafe_allow_html=True)
-        with tabs[3]:
-            st.markdown(generate_text_report(score, matched, missing), unsafe_allow_html=True)
-        st.markdown('</div>', unsafe_allow_html=True)
-    else:
-        st.info("➡️ Please upload a resume and provide/select a job description to see results.")
+                st.caption("No analysis runs recorded in this process yet.")
+            st.caption("Prometheus counters")
+            st.code(tracer.prometheus_text(), language="text")
 
 elif active_page == "Career Advisor":
     # Title and description
@@ -878,7 +1115,7 @@ elif active_page == "Dashboard":
 
     import pandas as pd
     import random
-    import matplotlib.pyplot as plt
+    import altair as alt
 
     try:
         import plost
@@ -910,59 +1147,106 @@ elif active_page == "Dashboard":
     st.markdown("<div class='section'>", unsafe_allow_html=True)
     st.subheader("📂 Upload or Use Sample Data", anchor=False)
 
+    from resumentor.datasets import read_dataset, read_columns, format_bytes
+    from resumentor.versions import DatasetHistory
+    from resumentor.profiling import version_profile
+    from resumentor.charts import heatmap_cells, donut_counts, line_series, DOWNSAMPLE_METHODS, WEEKDAYS
+    from resumentor.cleaning import (CleaningPipeline, StripText, DropDuplicates, HandleMissing, CoerceTypes,
+                                     report_frame)
+
     c1, c2, c3 = st.columns([3,1.3,1.7])
     with c1:
-        uploaded_file = st.file_uploader("Upload CSV", type=["csv"])
+        uploaded_file = st.file_uploader("Upload CSV or Parquet", type=["csv", "parquet"])
     with c2:
         use_sample = st.button("✨ Use Sample CSV")
     with c3:
         csv_bytes = sample_df.to_csv(index=False).encode("utf-8")
         st.download_button("📥 Download Sample CSV", data=csv_bytes, file_name="resumentor_sample_dataset.csv", mime="text/csv")
 
-    if "df" not in st.session_state: st.session_state.df = None
-    if "original_df" not in st.session_state: st.session_state.original_df = None
+    # Versions share unchanged columns with the loaded frame; Reset just points back at it
+    if "dataset" not in st.session_state: st.session_state.dataset = None
+
+    if "dataset_key" not in st.session_state: st.session_state.dataset_key = None
+
+    if uploaded_file is not None:
+        with st.expander("⚙️ Load options"):
+            try:
+                file_columns = read_columns(uploaded_file)
+            except Exception:
+                file_columns = []
+            load_columns = st.multiselect("Columns to load (default: all)", file_columns)
+            arrow_backend = st.toggle("Arrow-backed columns (PyArrow)", value=False,
+                                      help="Faster parsing and compact strings; some charts may convert columns on the fly.")
 
     if use_sample:
-        st.session_state.df = sample_df.copy()
-        st.session_state.original_df = st.session_state.df.copy()
+        st.session_state.dataset = DatasetHistory(sample_df, "sample")
+        st.session_state.dataset_key = None
         st.success("Loaded sample dataset.")
     elif uploaded_file is not None:
-        try:
-            df_tmp = pd.read_csv(uploaded_file)
-            st.session_state.df = df_tmp
-            st.session_state.original_df = df_tmp.copy()
-            st.success("Uploaded dataset loaded successfully.")
-        except Exception as e:
-            st.error(f"❌ Failed to read uploaded CSV: {e}")
+        # Read once per upload + load options, not on every rerun
+        dataset_key = (uploaded_file.file_id, tuple(load_columns), arrow_backend)
+        if st.session_state.dataset_key != dataset_key:
+            try:
+                with st.spinner("Reading dataset…"):
+                    df_tmp = read_dataset(uploaded_file, columns=load_columns or None,
+                                          backend="pyarrow" if arrow_backend else "numpy")
+                st.session_state.dataset = DatasetHistory(df_tmp, uploaded_file.name)
+                st.session_state.dataset_key = dataset_key
+                st.success("Uploaded dataset loaded successfully.")
+            except Exception as e:
+                st.error(f"❌ Failed to read uploaded file: {e}")
 
     st.markdown("</div>", unsafe_allow_html=True)
 
-    df = st.session_state.df
+    dataset = st.session_state.dataset
 
     # --- If dataset available ---
-    if df is not None:
+    if dataset is not None:
         # Cleaning / Reset / Preview
         st.markdown("<div class='section'>", unsafe_allow_html=True)
         st.subheader("🧹 Dataset Actions", anchor=False)
+        with st.expander("🧽 Cleaning options"):
+            dataset_columns = dataset.current.view.columns
+            o1, o2 = st.columns(2)
+            with o1:
+                clean_trim = st.checkbox("Trim whitespace in text columns", value=True)
+                clean_dedup = st.checkbox("Drop duplicate rows", value=True)
+                dedup_keys = st.multiselect("Duplicate key columns (default: all)", dataset_columns)
+            with o2:
+                na_policy = st.selectbox("Missing values", ["drop", "keep", "median", "mode"],
+                                         format_func={"drop": "Drop rows", "keep": "Keep",
+                                                      "median": "Fill with median (numeric)",
+                                                      "mode": "Fill with most frequent"}.get)
+                na_columns = st.multiselect("Only in columns (default: all)", dataset_columns)
+                clean_types = st.checkbox("Convert text columns to detected dates / categories", value=False)
         ca, cb, cc = st.columns([1,1,3])
         with ca:
             if st.button("Clean Dataset"):
-                df_clean = df.copy()
-                df_clean.drop_duplicates(inplace=True)
-                df_clean.dropna(inplace=True)
-                df_clean = df_clean.applymap(lambda x: x.strip() if isinstance(x, str) else x)
-                st.session_state.df = df_clean
-                df = df_clean
-                st.success("✅ Cleaned: duplicates & NaNs removed, text trimmed.")
+                steps = [StripText()] if clean_trim else []
+                if clean_dedup:
+                    steps.append(DropDuplicates(dedup_keys or None))
+                if na_columns:
+                    steps.append(HandleMissing({c: na_policy for c in na_columns}, default="keep"))
+                else:
+                    steps.append(HandleMissing(default=na_policy))
+                if clean_types:
+                    steps.append(CoerceTypes())
+                pipeline = CleaningPipeline(steps)
+                version = dataset.apply(pipeline, "cleaned")
+                st.session_state.clean_report = (version.id, pipeline.reports)
+                st.success("✅ Cleaned.")
         with cb:
             if st.button("⟲ Reset to Original"):
-                if st.session_state.original_df is not None:
-                    st.session_state.df = st.session_state.original_df.copy()
-                    df = st.session_state.df
-                    st.info("Dataset reset to original.")
+                dataset.reset()
+                st.info("Dataset reset to original.")
         with cc:
             preview = st.checkbox("🔍 Show Data Preview", value=True)
 
+        df = dataset.frame()
+        st.caption("Version: " + " → ".join(v.label for v in dataset.current.history()))
+        report_version, clean_reports = st.session_state.get("clean_report", (None, []))
+        if report_version == dataset.current.id:
+            st.dataframe(report_frame(clean_reports), use_container_width=True, hide_index=True)
         if preview:
             st.dataframe(df, use_container_width=True)
         st.markdown("</div>", unsafe_allow_html=True)
@@ -970,74 +1254,89 @@ elif active_page == "Dashboard":
         # Metrics
         st.markdown("<div class='section'>", unsafe_allow_html=True)
         st.subheader("📊 Dataset Metrics", anchor=False)
-        m1, m2, m3, m4 = st.columns(4)
-        m1.metric("Rows", f"{df.shape[0]:,}")
-        m2.metric("Columns", f"{df.shape[1]:,}")
-        m3.metric("Missing Values", f"{int(df.isna().sum().sum()):,}")
-        m4.metric("Duplicate Rows", f"{int(df.duplicated().sum()):,}")
+        # Computed once per dataset version (reusing the previous version's column stats), not per rerun
+        version = dataset.current
+        profile = version_profile(version)
+        m1, m2, m3, m4, m5 = st.columns(5)
+        m1.metric("Rows", f"{profile.rows:,}")
+        m2.metric("Columns", f"{len(profile.columns):,}")
+        m3.metric("Memory", format_bytes(profile.memory))
+        m4.metric("Missing Values", f"{profile.nulls:,}")
+        m5.metric("Duplicate Rows", f"{profile.duplicate_rows:,}")
+        with st.expander("🧬 Column profile"):
+            st.dataframe(profile.frame(), use_container_width=True, hide_index=True)
+            st.caption(f"Distinct counts are HyperLogLog estimates (exact for categories). Profiled in "
+                       f"{profile.seconds * 1000:,.0f} ms; {profile.reused} of {len(profile.columns)} columns "
+                       f"reused from the previous version.")
         st.markdown("</div>", unsafe_allow_html=True)
 
-        # Charts
-        numeric_cols = df.select_dtypes(include="number").columns.tolist()
+        # Charts: bounded aggregates, computed once per dataset version
+        numeric_cols = profile.numeric_columns
         all_cols = df.columns.tolist()
         first_col = all_cols[0] if all_cols else None
+        value_col = numeric_cols[0] if numeric_cols else None
+        label_cols = [c for c in all_cols if c not in numeric_cols and not pd.api.types.is_datetime64_any_dtype(df[c])]
+        category_col = label_cols[0] if label_cols else first_col
 
         st.markdown("<div class='section'>", unsafe_allow_html=True)
         st.subheader("🔥 Heatmap / Time Histogram", anchor=False)
-        if PLOST_AVAILABLE and first_col is not None:
+        if first_col is not None:
             try:
-                tmp = df.copy()
-                tmp[first_col] = pd.to_datetime(tmp[first_col], errors='coerce')
-                plost.time_hist(
-                    data=tmp,
-                    date=first_col,
-                    x_unit='week',
-                    y_unit='day',
-                    color=all_cols[1] if len(all_cols)>1 else first_col,
-                    aggregate='median',
-                    legend=None,
-                    height=345,
-                    use_container_width=True
-                )
+                cells = version.cached(("heatmap", first_col, value_col),
+                                       lambda frame: heatmap_cells(frame, first_col, value_col))
+                if len(cells):
+                    color = value_col or "count"
+                    chart = alt.Chart(cells).mark_rect().encode(
+                        x=alt.X("week:O", title="Week"),
+                        y=alt.Y("day:O", sort=list(WEEKDAYS), title=None),
+                        color=alt.Color(f"{color}:Q", title=f"median {color}" if value_col else "rows"),
+                        tooltip=["week", "day", color],
+                    ).properties(height=345)
+                    st.altair_chart(chart, use_container_width=True)
+                else:
+                    st.info(f"`{first_col}` has no dates to plot.")
             except Exception as e:
-                st.warning(f"plost.time_hist failed: {e}.")
-        else:
-            st.info("Install `plost` for heatmap. (pip install plost)")
+                st.warning(f"Heatmap failed: {e}.")
         st.markdown("</div>", unsafe_allow_html=True)
 
         st.markdown("<div class='section'>", unsafe_allow_html=True)
         st.subheader("🍩 Donut Chart", anchor=False)
-        if PLOST_AVAILABLE and first_col:
-            try:
-                plost.donut_chart(
-                    data=df,
-                    theta=all_cols[1] if len(all_cols)>1 else first_col,
-                    color=first_col,
-                    legend='bottom',
-                    use_container_width=True
-                )
-            except Exception as e:
-                st.warning(f"plost.donut_chart failed: {e}")
-        else:
-            try:
-                counts = df[all_cols[1]].value_counts() if len(all_cols)>1 else df[first_col].value_counts()
-                fig, ax = plt.subplots()
-                ax.pie(counts, labels=counts.index, autopct='%1.1f%%', startangle=90)
-                ax.axis('equal')
-                st.pyplot(fig, use_container_width=True)
-            except Exception as e:
-                st.warning(f"Fallback pie failed: {e}")
+        if category_col:
+            slices = version.cached(("donut", category_col, value_col),
+                                    lambda frame: donut_counts(frame, category_col, value_col))
+            theta = value_col or "count"
+            if PLOST_AVAILABLE:
+                try:
+                    plost.donut_chart(
+                        data=slices,
+                        theta=theta,
+                        color=category_col,
+                        legend='bottom',
+                        use_container_width=True
+                    )
+                except Exception as e:
+                    st.warning(f"plost.donut_chart failed: {e}")
+            else:
+                try:
+                    import matplotlib.pyplot as plt
+                    fig, ax = plt.subplots()
+                    ax.pie(slices[theta], labels=slices[category_col], autopct='%1.1f%%', startangle=90)
+                    ax.axis('equal')
+                    st.pyplot(fig, use_container_width=True)
+                except Exception as e:
+                    st.warning(f"Fallback pie failed: {e}")
         st.markdown("</div>", unsafe_allow_html=True)
 
         st.markdown("<div class='section'>", unsafe_allow_html=True)
         st.subheader("📈 Line Chart", anchor=False)
         if numeric_cols:
             try:
-                tmp = df.copy()
-                tmp[first_col] = pd.to_datetime(tmp[first_col], errors='coerce')
-                if pd.api.types.is_datetime64_any_dtype(tmp[first_col]):
-                    tmp = tmp.set_index(first_col)
-                st.line_chart(tmp[numeric_cols].fillna(0), height=380, use_container_width=True)
+                method = st.radio("Downsampling", DOWNSAMPLE_METHODS, horizontal=True,
+                                  format_func={"lttb": "Shape-preserving (LTTB)", "minmax": "Min / max per bucket"}.get)
+                series = version.cached(("line", first_col, tuple(numeric_cols), method),
+                                        lambda frame: line_series(frame, first_col, numeric_cols, method=method))
+                st.line_chart(series, height=380, use_container_width=True)
+                st.caption(f"{len(series):,} of {len(df):,} rows plotted.")
             except Exception as e:
                 st.error(f"Line chart error: {e}")
         else:
@@ -1053,3 +1352,6 @@ st.markdown("""
     © 2025 ResuMentor AI | All Rights Reserved | <a href="https://www.linkedin.com/in/raj-mehra-499406253" target="_blank">LinkedIn</a> | <a href="https://github.com/Raj-bit-1603" target="_blank">GitHub</a>
 </footer>
 """, unsafe_allow_html=True)
+
+# Warm the other pages' imports in the background once this page has painted
+start_warmup(PAGE_WARMUP, active_page)
@@ -1,10 +1,7 @@
 import streamlit as st
-import pdfplumber
-import docx2txt
-import re
-import base64
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+
+from resumentor import sample_jds, extract_text, clean_text, match_score, highlight_missing_skills, \
+    generate_ai_suggestions, highlight_resume_text, render_text_report
 
 # ---------------------- Page Config ----------------------
 st.set_page_config(page_title="📄 AI-Powered Resume Analyzer", layout="wide")
@@ -130,164 +127,6 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# ---------------------- Predefined Skills Dictionary ----------------------
-predefined_skills = [
-    # Core Languages / Frameworks
-    "python", "java", "c++", "c#", "go", "ruby", "javascript", "typescript",
-    "html", "css", "react", "angular", "vue", "node.js", "express",
-    # Databases
-    "sql", "mysql", "postgresql", "mongodb", "redis",
-    # Cloud / DevOps
-    "aws", "azure", "gcp", "docker", "kubernetes", "jenkins", "linux", "terraform",
-    "ci/cd", "git",
-    # Data/ML
-    "tensorflow", "pytorch", "scikit-learn", "pandas", "numpy", "matplotlib",
-    # BI/Analytics
-    "power bi", "tableau", "excel",
-    # Big Data
-    "hadoop", "spark",
-    # Security
-    "cybersecurity", "penetration testing", "network security", "firewall", "encryption",
-    # Process
-    "agile", "scrum", "rest api", "microservices"
-]
-
-# ---------------------- Functions ----------------------
-def extract_text(file):
-    text = ""
-    if file.type == "application/pdf":
-        with pdfplumber.open(file) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text() or ""
-                text += page_text + "\n"
-    elif file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-        text = docx2txt.process(file) or ""
-    return text
-
-def clean_text(text: str) -> str:
-    return re.sub(r'\s+', ' ', (text or "").strip())
-
-def match_score(resume_text: str, job_desc: str) -> float:
-    # Simple TF-IDF cosine similarity of full texts
-    vectorizer = TfidfVectorizer()
-    vectors = vectorizer.fit_transform([resume_text, job_desc])
-    similarity = cosine_similarity(vectors[0:1], vectors[1:2])[0][0]
-    return round(float(similarity) * 100, 2)
-
-def highlight_missing_skills(resume_text: str, job_desc: str):
-    # Only check predefined skills (prevents common stopwords)
-    jd_words = {skill for skill in predefined_skills if skill in job_desc.lower()}
-    resume_words = {skill for skill in predefined_skills if skill in resume_text.lower()}
-    missing = sorted(list(jd_words - resume_words))
-    matched = sorted(list(jd_words & resume_words))
-    return matched, missing
-
-def highlight_resume_text(resume_text: str, matched_skills):
-    # Bold matched skills in resume text
-    marked = resume_text
-    for skill in sorted(matched_skills, key=len, reverse=True):
-        # escape plus signs etc.
-        pattern = re.escape(skill)
-        marked = re.sub(fr"(?i)\b({pattern})\b", r"**\1**", marked)
-    return marked
-
-def generate_text_report(score, matched, missing):
-    report = f"""
-Resume Match Report
-
-ATS Match Score: {score}%
-
-Matched Skills:
-{', '.join(matched) if matched else '-'}
-
-Missing Skills:
-{', '.join(missing) if missing else '-'}
-
-Tips:
-- Tailor your resume bullet points to the JD.
-- Use action verbs and quantify impact (%, ₹, time saved).
-- Mirror important keywords naturally in relevant sections.
-"""
-    b64 = base64.b64encode(report.encode()).decode()
-    return f'<a class="download-link" href="data:file/txt;base64,{b64}" download="resume_report.txt">📥 Download Report</a>'
-
-def _contains_any(text: str, keywords):
-    text_l = text.lower()
-    return any(k in text_l for k in keywords)
-
-def generate_ai_suggestions(score: float, matched, missing, job_desc: str, resume_text: str):
-    """
-    Lightweight rule-based 'AI' suggestions based on:
-    - score thresholds
-    - missing skills grouping
-    - presence of project/certification terms
-    - seniority cues in JD
-    """
-    suggestions = []
-
-    # Score-based guidance
-    if score < 50:
-        suggestions.append("Your score is low. Rewrite key sections with clear, keyword-rich bullet points aligned to the JD (Skills, Experience, Projects).")
-        suggestions.append("Add 2–3 recent, measurable achievements (e.g., 'Improved API latency by 35% using Redis cache').")
-    elif score < 75:
-        suggestions.append("Good start. Add missing keywords and strengthen project descriptions with metrics and tooling details.")
-    else:
-        suggestions.append("Strong overall match. Do a final pass to mirror JD phrasing and tighten bullets.")
-
-    # Missing skills clustering
-    if missing:
-        cloud = [s for s in missing if s in {"aws","azure","gcp","docker","kubernetes","terraform","jenkins"}]
-        data_ml = [s for s in missing if s in {"pandas","numpy","scikit-learn","tensorflow","pytorch","matplotlib"}]
-        web = [s for s in missing if s in {"react","angular","vue","node.js","express","rest api","microservices"}]
-        db = [s for s in missing if s in {"sql","mysql","postgresql","mongodb","redis"}]
-        sec = [s for s in missing if s in {"cybersecurity","penetration testing","network security","firewall","encryption"}]
-
-        for group, label in [
-            (cloud, "cloud/devops"),
-            (data_ml, "data/ML"),
-            (web, "web/full-stack"),
-            (db, "databases"),
-            (sec, "security"),
-        ]:
-            if group:
-                suggestions.append(f"Add {label} evidence: **{', '.join(group[:6])}** in Projects/Experience/Skills.")
-
-    # JD seniority cues
-    if _contains_any(job_desc, ["lead", "mentor", "architecture", "design scalable", "ownership"]):
-        suggestions.append("JD hints seniority: highlight leadership, system design decisions, and mentoring impact.")
-
-    # Projects & certification nudges
-    if not _contains_any(resume_text, ["project", "capstone", "case study"]):
-        suggestions.append("Add a Projects section with 2–3 bullets per project focusing on problem → solution → impact.")
-    if _contains_any(job_desc, ["aws", "azure", "gcp"]) and not _contains_any(resume_text, ["certified", "certificate"]):
-        suggestions.append("Consider listing relevant cloud certifications (e.g., AWS CCP/Associate, Azure Fundamentals).")
-
-    # Soft skills if JD mentions agile/scrum
-    if _contains_any(job_desc, ["agile", "scrum"]) and not _contains_any(resume_text, ["agile", "scrum"]):
-        suggestions.append("Mention Agile/Scrum collaboration (ceremonies, cross-functional teamwork) where applicable.")
-
-    # Formatting hygiene
-    suggestions.append("Ensure consistent formatting: section headings, bullet alignment, and unified tense per section.")
-
-    # Deduplicate while preserving order
-    seen = set()
-    final = []
-    for s in suggestions:
-        if s not in seen:
-            final.append(s)
-            seen.add(s)
-    return final[:10]  # keep it concise
-
-# ---------------------- Sample Job Descriptions ----------------------
-sample_jds = {
-    "Software Engineer": """We are seeking a Software Engineer proficient in Python, Java, and SQL with experience in cloud platforms like AWS or Azure. The role involves designing scalable software systems, working with REST APIs, version control (Git), and Agile methodologies.""",
-    "Machine Learning Engineer": """We are hiring a Machine Learning Engineer skilled in Python, TensorFlow or PyTorch, data preprocessing, and model deployment. The candidate should have strong knowledge of statistics, feature engineering, and cloud ML services.""",
-    "Full Stack Developer": """Looking for a Full Stack Developer experienced with HTML, CSS, JavaScript, React, Node.js, and MongoDB. Knowledge of REST APIs, version control, CI/CD pipelines, and deployment on cloud platforms is a must.""",
-    "Data Analyst": """We need a Data Analyst skilled in SQL, Excel, Power BI or Tableau, and Python for data cleaning and visualization. The role requires strong problem-solving skills and ability to generate insights from large datasets.""",
-    "DevOps Engineer": """Hiring a DevOps Engineer with expertise in CI/CD pipelines, Docker, Kubernetes, Jenkins, and cloud platforms (AWS/GCP/Azure). The role includes automating deployments, monitoring, and ensuring system reliability.""",
-    "Cybersecurity Specialist": """We are looking for a Cybersecurity Specialist familiar with penetration testing, network security, firewalls, encryption, and threat detection. Knowledge of security compliance frameworks (ISO, NIST) is preferred."""
-}
-
 # ---------------------- UI ----------------------
 st.title("📄 AI-Powered Resume Analyzer")
 st.caption("Upload your resume and choose/paste a job description. Get ATS-style scoring, skill gaps, and AI suggestions to improve your match.")
@@ -367,7 +206,8 @@ if uploaded_file and job_description.strip():
             highlighted = highlight_resume_text(resume_text, matched)
             st.markdown(highlighted, unsafe_allow_html=True)
     with tabs[3]:
-        st.markdown(generate_text_report(score, matched, missing), unsafe_allow_html=True)
+        st.download_button("📥 Download Report", render_text_report(score, matched, missing),
+                           file_name="resume_report.txt", mime="text/plain")
     st.markdown('</div>', unsafe_allow_html=True)
 else:
     st.info("➡️ Please upload a resume and provide/select a job description to see results.")
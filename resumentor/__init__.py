@@ -0,0 +1,92 @@
+"""
+ResuMentor analysis core, usable without Streamlit.
+
+Names are resolved lazily so `import resumentor` stays cheap; pdfplumber/sklearn load on first use.
+"""
+import importlib
+
+_EXPORTS = {
+    # extract
+    "PDF_MIME": "extract",
+    "DOCX_MIME": "extract",
+    "BytesUpload": "extract",
+    "iter_pdf_pages": "extract",
+    "iter_docx_paragraphs": "extract",
+    "ExtractionLimitExceeded": "extract",
+    "extract_text": "extract",
+    "clean_text": "extract",
+    "ExtractionCache": "extract",
+    "extraction_cache": "extract",
+    "cached_extract_text": "extract",
+    # scoring
+    "match_score": "scoring",
+    "BatchScorer": "scoring",
+    "term_counts": "scoring",
+    "pair_score": "scoring",
+    # bulk ranking
+    "iter_batch_items": "batch",
+    "ingest": "batch",
+    "rank_batch": "batch",
+    "score_batch": "batch",
+    # sections
+    "parse_sections": "sections",
+    "section_score": "sections",
+    "SectionIndex": "sections",
+    # candidate search
+    "LSAEmbedder": "embeddings",
+    "IVFIndex": "ann",
+    "CandidateIndex": "ann",
+    # JD index
+    "JDIndex": "jd_index",
+    "sample_jd_index": "jd_index",
+    "load_jd_library": "jd_index",
+    "library_jd_index": "jd_index",
+    # skills
+    "predefined_skills": "skills",
+    "SkillTaxonomy": "taxonomy",
+    "default_taxonomy": "taxonomy",
+    "skill_taxonomy": "skills",
+    "SkillMatcher": "skills",
+    "skill_matcher": "skills",
+    "highlight_missing_skills": "skills",
+    "highlight_resume_text": "skills",
+    # suggestions / report / sample data
+    "generate_ai_suggestions": "suggestions",
+    "compute_jd_flags": "suggestions",
+    "compute_resume_flags": "suggestions",
+    "suggestion_features": "suggestions",
+    "evaluate_rules": "suggestions",
+    "suggest": "suggestions",
+    "generate_text_report": "report",
+    "render_text_report": "report",
+    "export_results": "report",
+    "export_bytes": "report",
+    "sample_jds": "jds",
+    # pipeline / background jobs
+    "analyze_resume": "pipeline",
+    "AnalysisCache": "pipeline",
+    "analysis_cache": "pipeline",
+    "JobManager": "jobs",
+    "QueueFull": "jobs",
+    # dashboard datasets
+    "read_dataset": "datasets",
+    "memory_footprint": "datasets",
+    "DatasetHistory": "versions",
+    "CleaningPipeline": "cleaning",
+    "version_profile": "profiling",
+    # tracing
+    "tracer": "tracing",
+    "traced": "tracing",
+}
+
+__all__ = sorted(_EXPORTS)
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
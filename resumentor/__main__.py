@@ -0,0 +1,3 @@
+from resumentor.cli import main
+
+raise SystemExit(main())
@@ -0,0 +1,198 @@
+"""
+Approximate nearest-neighbour search over resume embeddings (inverted-file index in NumPy).
+
+Vectors are clustered with spherical k-means into `n_lists` lists and stored list by list, so a query
+scores the centroids, then scans only the `n_probe` closest lists as contiguous slices. More probes
+mean higher recall and more work; n_probe = n_lists is an exact search. Saved indexes are a directory
+of .npy arrays plus meta.json, loaded with memory-mapping like the JD index.
+"""
+import os
+import json
+from itertools import islice
+
+import numpy as np
+
+from resumentor.embeddings import LSAEmbedder
+from resumentor.tracing import traced
+
+ANN_FORMAT_VERSION = 1
+DEFAULT_N_PROBE = 8
+# Rows per matrix product when assigning vectors to lists (bounds temporary memory)
+_ASSIGN_CHUNK = 8192
+
+def _nearest_centroid(vectors, centroids) -> np.ndarray:
+    lists = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), _ASSIGN_CHUNK):
+        lists[start:start + _ASSIGN_CHUNK] = np.argmax(vectors[start:start + _ASSIGN_CHUNK] @ centroids.T, axis=1)
+    return lists
+
+def spherical_kmeans(vectors, n_clusters: int, n_iter: int = 15, sample: int = None, seed: int = 0) -> np.ndarray:
+    # Unit-norm centroids maximizing cosine to their members, trained on at most `sample` vectors
+    rng = np.random.default_rng(seed)
+    n = len(vectors)
+    sample = min(n, sample or 64 * n_clusters)
+    train = np.asarray(vectors[np.sort(rng.choice(n, sample, replace=False))], dtype=np.float32)
+    centroids = train[rng.choice(sample, n_clusters, replace=False)].copy()
+    for _ in range(n_iter):
+        lists = _nearest_centroid(train, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, lists, train)
+        empty = np.flatnonzero(~sums.any(axis=1))
+        # Reseed empty lists with random training vectors
+        sums[empty] = train[rng.choice(sample, len(empty), replace=False)]
+        centroids = sums / np.linalg.norm(sums, axis=1, keepdims=True).clip(min=1e-12)
+    return centroids.astype(np.float32)
+
+class IVFIndex:
+    """
+    - centroids: n_lists × dim unit vectors
+    - vectors: N × dim, grouped by list; list l is rows offsets[l]:offsets[l + 1]
+    - order: original row number of each stored vector
+    """
+
+    def __init__(self, centroids, vectors, offsets, order):
+        self.centroids = centroids
+        self.vectors = vectors
+        self.offsets = offsets
+        self.order = order
+        self._positions = None
+
+    @classmethod
+    def build(cls, vectors, n_lists: int = None, n_iter: int = 15, seed: int = 0):
+        # n_lists defaults to ~sqrt(N), which keeps both the centroid scan and each list short
+        vectors = np.asarray(vectors, dtype=np.float32)
+        n = len(vectors)
+        n_lists = max(1, min(n, n_lists or int(np.sqrt(n))))
+        centroids = spherical_kmeans(vectors, n_lists, n_iter, seed=seed)
+        lists = _nearest_centroid(vectors, centroids)
+        order = np.argsort(lists, kind="stable")
+        offsets = np.concatenate([[0], np.cumsum(np.bincount(lists, minlength=n_lists))]).astype(np.int64)
+        return cls(centroids, vectors[order], offsets, order.astype(np.int64))
+
+    def __len__(self):
+        return len(self.order)
+
+    @property
+    def n_lists(self) -> int:
+        return len(self.centroids)
+
+    def vector(self, row: int) -> np.ndarray:
+        # Stored vector of original row `row`
+        if self._positions is None:
+            self._positions = np.argsort(self.order)
+        return np.asarray(self.vectors[self._positions[row]])
+
+    def search(self, queries, k: int = 10, n_probe: int = DEFAULT_N_PROBE):
+        """
+        Top-k rows by cosine for each query (rows of `queries`, unit-norm).
+        Returns (rows, scores): two len(queries) × k arrays, best first; missing hits are row -1.
+        """
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        n_probe = max(1, min(n_probe, self.n_lists))
+        rows = np.full((len(queries), k), -1, dtype=np.int64)
+        scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+        centroid_scores = queries @ self.centroids.T
+        probes = np.argpartition(-centroid_scores, n_probe - 1, axis=1)[:, :n_probe]
+        for i, (query, probe) in enumerate(zip(queries, probes)):
+            positions = [np.arange(self.offsets[l], self.offsets[l + 1]) for l in probe]
+            blocks = [self.vectors[self.offsets[l]:self.offsets[l + 1]] @ query for l in probe]
+            positions, block_scores = np.concatenate(positions), np.concatenate(blocks)
+            top = min(k, len(block_scores))
+            if not top:
+                continue
+            best = np.argpartition(-block_scores, top - 1)[:top]
+            best = best[np.argsort(-block_scores[best], kind="stable")]
+            rows[i, :top] = self.order[positions[best]]
+            scores[i, :top] = block_scores[best]
+        return rows, scores
+
+    # ---------------------- Persistence ----------------------
+    _ARRAYS = ("centroids", "vectors", "offsets", "order")
+
+    def save(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        for name in self._ARRAYS:
+            np.save(os.path.join(directory, f"{name}.npy"), np.asarray(getattr(self, name)))
+
+    @classmethod
+    def load(cls, directory, mmap: bool = True):
+        mode = "r" if mmap else None
+        arrays = {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode=mode) for name in cls._ARRAYS}
+        return cls(np.asarray(arrays["centroids"]), arrays["vectors"], np.asarray(arrays["offsets"]), arrays["order"])
+
+class CandidateIndex:
+    """
+    Searchable store of past candidates: an LSA embedder, an IVF index over their resume embeddings,
+    and one label (file name, applicant id, ...) per candidate.
+    """
+
+    def __init__(self, embedder: LSAEmbedder, ivf: IVFIndex, labels):
+        self.embedder = embedder
+        self.ivf = ivf
+        self.labels = list(labels)
+        self._rows = None
+
+    @classmethod
+    def build(cls, texts, labels, dim: int = 128, n_lists: int = None, fit_sample: int = 20000,
+              batch_size: int = 4096, seed: int = 0):
+        """
+        Embed `texts` (any iterable, consumed in batches) and index them.
+        The embedder is fitted on the first `fit_sample` texts.
+        """
+        texts = iter(texts)
+        head = list(islice(texts, fit_sample))
+        embedder = LSAEmbedder(dim=dim, seed=seed).fit(head)
+        chunks = [embedder.transform(head[i:i + batch_size]) for i in range(0, len(head), batch_size)]
+        del head
+        for batch in iter(lambda: list(islice(texts, batch_size)), []):
+            chunks.append(embedder.transform(batch))
+        vectors = np.concatenate(chunks)
+        labels = list(labels)
+        if len(labels) != len(vectors):
+            raise ValueError(f"{len(labels)} labels for {len(vectors)} texts")
+        return cls(embedder, IVFIndex.build(vectors, n_lists, seed=seed), labels)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def _results(self, rows, scores, skip=None):
+        return [(self.labels[r], round(float(s) * 100, 2)) for r, s in zip(rows.tolist(), scores.tolist())
+                if r >= 0 and r != skip]
+
+    @traced("candidate_search", size_arg=1)
+    def top_k(self, text: str, k: int = 10, n_probe: int = DEFAULT_N_PROBE):
+        # Candidates most similar to a JD or resume text: [(label, cosine %), ...] best first
+        rows, scores = self.ivf.search(self.embedder.transform([text]), k, n_probe)
+        return self._results(rows[0], scores[0])
+
+    def similar_to(self, label, k: int = 10, n_probe: int = DEFAULT_N_PROBE):
+        # Nearest indexed candidates to an indexed candidate (itself excluded)
+        if self._rows is None:
+            self._rows = {label: row for row, label in enumerate(self.labels)}
+        row = self._rows[label]
+        rows, scores = self.ivf.search(self.ivf.vector(row), k + 1, n_probe)
+        return self._results(rows[0], scores[0], skip=row)[:k]
+
+    # ---------------------- Persistence ----------------------
+    def save(self, directory):
+        self.embedder.save(directory)
+        self.ivf.save(directory)
+        encoded = [label.encode("utf-8") for label in self.labels]
+        with open(os.path.join(directory, "labels.bin"), "wb") as fh:
+            fh.write(b"".join(encoded))
+        np.save(os.path.join(directory, "label_offsets.npy"),
+                np.concatenate([[0], np.cumsum([len(e) for e in encoded], dtype=np.int64)]))
+        with open(os.path.join(directory, "meta.json"), "w", encoding="utf-8") as fh:
+            json.dump({"format_version": ANN_FORMAT_VERSION, "count": len(self), "n_lists": self.ivf.n_lists}, fh)
+
+    @classmethod
+    def load(cls, directory, mmap: bool = True):
+        with open(os.path.join(directory, "meta.json"), encoding="utf-8") as fh:
+            meta = json.load(fh)
+        if meta.get("format_version") != ANN_FORMAT_VERSION:
+            raise ValueError(f"Unsupported candidate index format: {meta.get('format_version')!r}")
+        with open(os.path.join(directory, "labels.bin"), "rb") as fh:
+            blob = fh.read()
+        offsets = np.load(os.path.join(directory, "label_offsets.npy")).tolist()
+        labels = [blob[a:b].decode("utf-8") for a, b in zip(offsets, offsets[1:])]
+        return cls(LSAEmbedder.load(directory, mmap), IVFIndex.load(directory, mmap), labels)
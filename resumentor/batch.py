@@ -0,0 +1,259 @@
+"""
+Bulk ingestion: rank a ZIP archive or a directory of resumes against one JD.
+
+Resumes are extracted and cleaned on a process pool with a bounded number of files in flight, then
+scored together in one sparse pass (scoring.BatchScorer: IDF learned from the whole pool, or from a saved
+reference corpus) with skill gaps and suggestions evaluated as a batch.
+A file that fails, takes longer than FILE_TIMEOUT, or whose worker crashes becomes an error row; the rest
+of the batch carries on.
+"""
+import os
+import time
+import signal
+import zipfile
+import multiprocessing
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, TimeoutError, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from resumentor.extract import MIME_BY_SUFFIX, MAX_PDF_PAGES
+
+# Refuse archives with more resumes than this, and skip single files larger than MAX_RESUME_BYTES
+MAX_BATCH_FILES = 5000
+MAX_RESUME_BYTES = 20 * 1024 * 1024
+# Files handed to the pool ahead of the results being collected, per worker
+IN_FLIGHT_PER_WORKER = 2
+# Seconds a worker may spend on one file before it is killed and the file reported as timed out
+FILE_TIMEOUT = 120
+_KILL = getattr(signal, "SIGKILL", signal.SIGTERM)
+
+_started = None
+
+def _is_resume(name: str) -> bool:
+    base = os.path.basename(name)
+    return not base.startswith((".", "~$")) and os.path.splitext(base)[1].lower() in MIME_BY_SUFFIX
+
+def _dir_paths(source, max_files: int) -> list:
+    paths = sorted(os.path.join(root, name) for root, _, files in os.walk(source)
+                   for name in files if _is_resume(name))
+    if len(paths) > max_files:
+        raise ValueError(f"{len(paths)} resumes found; the limit is {max_files}")
+    return paths
+
+def _zip_members(zf: zipfile.ZipFile, max_files: int) -> list:
+    members = [m for m in zf.infolist()
+               if not m.is_dir() and not m.filename.startswith("__MACOSX/") and _is_resume(m.filename)]
+    if len(members) > max_files:
+        raise ValueError(f"{len(members)} resumes in the archive; the limit is {max_files}")
+    return members
+
+def _is_dir(source) -> bool:
+    return isinstance(source, (str, os.PathLike)) and os.path.isdir(source)
+
+def count_batch_items(source, max_files: int = MAX_BATCH_FILES) -> int:
+    # How many items iter_batch_items(source) yields, from the directory listing or the ZIP's member list
+    if _is_dir(source):
+        return len(_dir_paths(source, max_files))
+    with zipfile.ZipFile(source) as zf:
+        return len(_zip_members(zf, max_files))
+
+def iter_batch_items(source, max_files: int = MAX_BATCH_FILES, max_file_bytes: int = MAX_RESUME_BYTES):
+    """
+    Resumes in a directory, a .zip path, or an open ZIP file object, as work items
+    {"file", "type", "data" | "path", "error"}. Only .pdf/.docx members are read, one at a time.
+    """
+    if _is_dir(source):
+        for path in _dir_paths(source, max_files):
+            item = {"file": path, "type": MIME_BY_SUFFIX[os.path.splitext(path)[1].lower()], "path": path}
+            if os.path.getsize(path) > max_file_bytes:
+                item = {"file": path, "error": f"File is larger than {max_file_bytes // (1024 * 1024)} MB"}
+            yield item
+        return
+    with zipfile.ZipFile(source) as zf:
+        for member in _zip_members(zf, max_files):
+            file_type = MIME_BY_SUFFIX[os.path.splitext(member.filename)[1].lower()]
+            if member.file_size > max_file_bytes:
+                yield {"file": member.filename, "error": f"File is larger than {max_file_bytes // (1024 * 1024)} MB"}
+                continue
+            try:
+                with zf.open(member) as fh:
+                    data = fh.read(max_file_bytes + 1)
+            except Exception as e:
+                yield {"file": member.filename, "error": f"{type(e).__name__}: {e}"}
+                continue
+            if len(data) > max_file_bytes:
+                yield {"file": member.filename, "error": f"File is larger than {max_file_bytes // (1024 * 1024)} MB"}
+                continue
+            yield {"file": member.filename, "type": file_type, "data": data}
+
+def ingest_one(item: dict, max_pages=MAX_PDF_PAGES) -> dict:
+    # Runs in a worker process: extract + clean one resume and precompute its resume-side features
+    import numpy as np
+    from resumentor.extract import BytesUpload, extract_text, clean_text
+    from resumentor.skills import skill_taxonomy
+    from resumentor.suggestions import compute_resume_flags
+    if item.get("error"):
+        return {"file": item["file"], "error": item["error"]}
+    try:
+        if item.get("data") is not None:
+            upload = BytesUpload(item["data"], item["type"], os.path.basename(item["file"]))
+        else:
+            upload = BytesUpload.from_path(item["path"])
+        # Parallelism is across files, so each file is extracted serially
+        text = clean_text(extract_text(upload, max_pages=max_pages, workers=1))
+        return {"file": item["file"], "text": text, "skills": np.packbits(skill_taxonomy.mask_in(text)),
+                "flags": compute_resume_flags(text)}
+    except Exception as e:
+        return {"file": item["file"], "error": f"{type(e).__name__}: {e}"}
+
+def _init_ingest_worker(started):
+    global _started
+    _started = started
+
+def _ingest_timed(seq: int, item: dict, max_pages) -> dict:
+    # Tell the parent which process is reading file `seq`; its deadline starts now
+    _started.put((seq, os.getpid()))
+    return ingest_one(item, max_pages)
+
+def _timeout_row(item: dict, file_timeout) -> dict:
+    return {"file": item["file"], "error": f"Timed out after {file_timeout:g}s"}
+
+def _ingest_alone(item: dict, max_pages, file_timeout) -> dict:
+    # Re-run one file in a pool of its own, so a second crash can only be this file's
+    started = multiprocessing.SimpleQueue()
+    executor = ProcessPoolExecutor(1, initializer=_init_ingest_worker, initargs=(started,))
+    try:
+        return executor.submit(_ingest_timed, 0, item, max_pages).result(timeout=file_timeout)
+    except BrokenProcessPool:
+        return {"file": item["file"], "error": "Worker process crashed while reading this file"}
+    except TimeoutError:
+        if not started.empty():
+            os.kill(started.get()[1], _KILL)
+        return _timeout_row(item, file_timeout)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def ingest(items, workers: int = None, max_pages=MAX_PDF_PAGES, file_timeout=FILE_TIMEOUT):
+    """
+    Run ingest_one over `items` on a process pool, yielding results as they finish (not in input order).
+    At most workers × IN_FLIGHT_PER_WORKER items are pending at once, so archive members are read lazily.
+    - a file still being read file_timeout seconds after a worker picked it up (None: no limit) has that
+      worker killed and becomes an error row; the other files in flight are resubmitted to a fresh pool
+    - if a worker process dies on its own, the pool is restarted and the files that were in flight are
+      retried one by one
+    """
+    workers = workers or os.cpu_count() or 1
+    items = iter(items)
+    started = multiprocessing.SimpleQueue() if file_timeout else None
+    pending = {}   # future -> (seq, item, executor)
+    running = {}   # seq -> (worker pid, monotonic start)
+    timed_out = set()
+    killed = set()  # executors we broke by killing a worker
+    crashed = []
+    seqs = iter(range(1 << 62))
+
+    def new_executor():
+        if started is None:
+            return ProcessPoolExecutor(workers)
+        return ProcessPoolExecutor(workers, initializer=_init_ingest_worker, initargs=(started,))
+
+    executor = new_executor()
+
+    def submit(item):
+        nonlocal executor
+        seq = next(seqs)
+        call = (_ingest_timed, seq, item, max_pages) if started is not None else (ingest_one, item, max_pages)
+        try:
+            future = executor.submit(*call)
+        except BrokenProcessPool:
+            executor.shutdown(wait=False)
+            executor = new_executor()
+            future = executor.submit(*call)
+        pending[future] = (seq, item, executor)
+
+    try:
+        for item in islice(items, workers * IN_FLIGHT_PER_WORKER):
+            submit(item)
+        while pending:
+            # With a deadline, wake up every second to check it
+            done, _ = wait(pending, timeout=1 if started is not None else None, return_when=FIRST_COMPLETED)
+            while started is not None and not started.empty():
+                seq, pid = started.get()
+                running[seq] = (pid, time.monotonic())
+            for future in done:
+                seq, item, owner = pending.pop(future)
+                running.pop(seq, None)
+                try:
+                    yield future.result()
+                except BrokenProcessPool:
+                    if seq in timed_out:
+                        yield _timeout_row(item, file_timeout)
+                    elif owner in killed:
+                        # Only lost because a timed-out neighbour's worker was killed
+                        submit(item)
+                        continue
+                    else:
+                        crashed.append(item)
+                for item in islice(items, 1):
+                    submit(item)
+            now = time.monotonic()
+            for seq, item, owner in list(pending.values()):
+                if seq in running and seq not in timed_out and now - running[seq][1] > file_timeout:
+                    timed_out.add(seq)
+                    killed.add(owner)
+                    try:
+                        os.kill(running[seq][0], _KILL)
+                    except ProcessLookupError:
+                        pass
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    for item in crashed:
+        yield _ingest_alone(item, max_pages, file_timeout)
+
+def rank_batch(results, job_desc: str, jd_entry=None, scorer=None) -> list:
+    """
+    Score ingested resumes against one JD in a single vectorized pass.
+    `scorer` is a fitted BatchScorer (default: the $RESUMENTOR_SCORER reference, else one fitted on the
+    pool plus the JD, so terms every applicant uses count for less than the distinctive ones).
+    Returns rows with the report fields (file, score, matched, missing, suggestions, error):
+    best score first, then failed files.
+    """
+    import numpy as np
+    from resumentor.scoring import BatchScorer, reference_scorer
+    from resumentor.skills import skill_taxonomy
+    from resumentor.suggestions import compute_jd_flags, suggestion_features, evaluate_rules
+    results = list(results)
+    ok = [r for r in results if "error" not in r]
+    failed = sorted((r for r in results if "error" in r), key=lambda r: r["file"])
+    rows = []
+    if ok:
+        n_skills = len(skill_taxonomy)
+        scorer = scorer or reference_scorer() or BatchScorer()
+        scores = scorer.score_matrix([r["text"] for r in ok], [job_desc])[:, 0]
+        resume_skills = np.stack([np.unpackbits(r["skills"], count=n_skills).astype(bool) for r in ok])
+        resume_skills = skill_taxonomy.with_ancestors(resume_skills)
+        if jd_entry is not None:
+            jd_skills, jd_flags = skill_taxonomy.mask(jd_entry.skills), jd_entry.flags
+        else:
+            jd_skills, jd_flags = skill_taxonomy.mask_in(job_desc), compute_jd_flags(job_desc)
+        matched = resume_skills & jd_skills
+        missing = ~resume_skills & jd_skills
+        features = suggestion_features(scores, missing, [jd_flags] * len(ok), [r["flags"] for r in ok])
+        suggestions = evaluate_rules(features)
+        for i in np.argsort(-scores, kind="stable"):
+            rows.append({"file": ok[i]["file"], "score": float(scores[i]),
+                         "matched": skill_taxonomy.names_of(matched[i]), "missing": skill_taxonomy.names_of(missing[i]),
+                         "suggestions": [s.text for s in suggestions[i]], "error": None})
+    rows += [{"file": r["file"], "score": None, "matched": None, "missing": None, "suggestions": None,
+              "error": r["error"]} for r in failed]
+    return rows
+
+def score_batch(source, job_desc: str, jd_entry=None, workers: int = None, max_pages=MAX_PDF_PAGES,
+                progress=None, scorer=None, file_timeout=FILE_TIMEOUT) -> list:
+    # Ingest + rank in one call; progress(done) is called after every file
+    results = []
+    for done, result in enumerate(ingest(iter_batch_items(source), workers, max_pages, file_timeout), start=1):
+        results.append(result)
+        if progress is not None:
+            progress(done)
+    return rank_batch(results, job_desc, jd_entry, scorer)
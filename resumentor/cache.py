@@ -0,0 +1,86 @@
+"""Size-bounded, optionally expiring LRU shared by the extraction and analysis caches."""
+import sys
+import time
+import threading
+from collections import OrderedDict
+
+def deep_sizeof(obj, _seen=None) -> int:
+    # Approximate retained size of plain containers (dict/list/tuple/set) and what they hold
+    seen = _seen if _seen is not None else set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    return size
+
+class BoundedLRU:
+    """
+    Thread-safe LRU mapping.
+    - max_bytes: least recently used entries are evicted once the summed `sizeof` exceeds it
+    - ttl: seconds an entry stays valid after it was stored (None = no expiry)
+    """
+
+    def __init__(self, max_bytes: int, ttl: float = None, sizeof=sys.getsizeof):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.sizeof = sizeof
+        self._entries = OrderedDict()  # key -> (value, size, expires_at)
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            if entry[2] is not None and entry[2] <= time.monotonic():
+                self._drop(key)
+                return default
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value):
+        size = self.sizeof(value)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if size > self.max_bytes:
+                return
+            expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+            self._entries[key] = (value, size, expires_at)
+            self._size += size
+            self._evict()
+
+    def _drop(self, key):
+        self._size -= self._entries.pop(key)[1]
+
+    def _evict(self):
+        # Expired entries go first, then least recently used ones until under budget
+        if self.ttl is not None:
+            now = time.monotonic()
+            for key in [k for k, (_, _, expires_at) in self._entries.items() if expires_at <= now]:
+                self._drop(key)
+        while self._size > self.max_bytes:
+            _, (_, size, _) = self._entries.popitem(last=False)
+            self._size -= size
+
+    @property
+    def nbytes(self) -> int:
+        return self._size
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+_MISSING = object()
@@ -0,0 +1,141 @@
+"""
+Dashboard chart data: bounded aggregates computed in pandas instead of shipping every row to the browser.
+
+- line charts are downsampled to about the chart's pixel width (LTTB, or min/max per bucket)
+- donut charts get one row per slice, small slices folded into "Other"
+- the weekly heatmap gets one cell per (week of year, weekday)
+
+Each function takes the full frame and returns a small one; the Dashboard caches the results per dataset
+version (versions.DatasetVersion.cached), so reruns don't recompute them.
+"""
+import numpy as np
+import pandas as pd
+
+from resumentor.datasets import infer_schema, SAMPLE_ROWS
+
+# Points per line chart (about its width in pixels), donut slices, and downsampling methods
+MAX_POINTS = 1000
+MAX_SLICES = 12
+DOWNSAMPLE_METHODS = ("lttb", "minmax")
+WEEKDAYS = ("Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat")
+
+def as_dates(values: pd.Series):
+    # The column as datetimes if it holds dates (judged on a sample, with its detected format), else None
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    spec = infer_schema(values.head(SAMPLE_ROWS).to_frame())[values.name]
+    if spec.kind != "datetime":
+        return None
+    return pd.to_datetime(values, errors="coerce", format=spec.format or "mixed")
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_points: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: positions of `n_points` of the (x-sorted) points that keep the
+    line's visual shape. The first and last points are always kept.
+    """
+    n = len(x)
+    if n_points >= n or n_points < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    # n_points - 2 buckets between the first and last point; bucket i is edges[i]:edges[i + 1]
+    edges = np.linspace(1, n - 1, n_points - 1).astype(np.int64)
+    x_sums = np.concatenate([[0.0], np.cumsum(x)])
+    y_sums = np.concatenate([[0.0], np.cumsum(y)])
+    sizes = np.maximum(edges[1:] - edges[:-1], 1)
+    x_means = (x_sums[edges[1:]] - x_sums[edges[:-1]]) / sizes
+    y_means = (y_sums[edges[1:]] - y_sums[edges[:-1]]) / sizes
+    selected = np.empty(n_points, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(n_points - 2):
+        lo, hi = edges[i], max(edges[i + 1], edges[i] + 1)
+        # The next bucket's mean (the last point after the final bucket) is the triangle's third vertex
+        cx, cy = (x_means[i + 1], y_means[i + 1]) if i + 1 < n_points - 2 else (x[-1], y[-1])
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+def minmax_indices(y: np.ndarray, n_points: int) -> np.ndarray:
+    # Positions of the minimum and maximum of each of n_points / 2 equal row buckets, in order
+    n = len(y)
+    n_buckets = max(1, n_points // 2)
+    if n_points >= n:
+        return np.arange(n)
+    size = -(-n // n_buckets)
+    padded = np.full(n_buckets * size, np.nan)
+    padded[:n] = y
+    padded = padded.reshape(n_buckets, size)
+    valid = ~np.isnan(padded).all(axis=1)
+    offsets = np.arange(n_buckets)[valid] * size
+    filled = np.where(np.isnan(padded[valid]), np.inf, padded[valid])
+    lows = offsets + filled.argmin(axis=1)
+    filled = np.where(np.isnan(padded[valid]), -np.inf, padded[valid])
+    highs = offsets + filled.argmax(axis=1)
+    return np.unique(np.concatenate([lows, highs]))
+
+def line_series(df: pd.DataFrame, x=None, columns=None, max_points: int = MAX_POINTS,
+                method: str = "lttb") -> pd.DataFrame:
+    """
+    Numeric `columns` (default: all) of `df` against `x` (a date column; row order if None or not dates),
+    sorted by x with missing values as 0, keeping at most ~max_points rows. Each column is downsampled
+    separately and the chosen rows are merged, so every series keeps its own peaks.
+    """
+    if method not in DOWNSAMPLE_METHODS:
+        raise ValueError(f"Unknown method {method!r}; expected one of {', '.join(DOWNSAMPLE_METHODS)}")
+    columns = list(columns if columns is not None else df.select_dtypes(include="number").columns)
+    values = df[columns].fillna(0)
+    dates = as_dates(df[x]) if x is not None else None
+    if dates is not None:
+        keep = dates.notna().to_numpy()
+        order = np.argsort(dates.to_numpy()[keep], kind="stable")
+        values = values[keep].iloc[order].set_axis(pd.DatetimeIndex(dates[keep].iloc[order], name=x))
+        positions = values.index.asi8.astype(np.float64)
+    else:
+        positions = np.arange(len(values), dtype=np.float64)
+    budget = max(3, max_points // max(1, len(columns)))
+    chosen = [np.arange(0)]
+    for name in columns:
+        y = values[name].to_numpy(dtype=np.float64, na_value=0.0)
+        chosen.append(lttb_indices(positions, y, budget) if method == "lttb" else minmax_indices(y, budget))
+    return values.iloc[np.unique(np.concatenate(chosen))]
+
+def donut_counts(df: pd.DataFrame, category, value=None, max_slices: int = MAX_SLICES) -> pd.DataFrame:
+    """
+    One row per slice: [category, value] with the sum of numeric `value` per category, or [category, "count"]
+    rows per category. The largest max_slices - 1 categories are kept and the rest summed into "Other".
+    """
+    name = value if value is not None else "count"
+    if value is not None:
+        totals = df.groupby(df[category], observed=True, dropna=True)[value].sum()
+    else:
+        totals = df[category].value_counts(dropna=True)
+    totals = totals.sort_values(ascending=False)
+    if len(totals) > max_slices:
+        other = totals.iloc[max_slices - 1:].sum()
+        totals = totals.iloc[:max_slices - 1]
+        totals = pd.concat([totals.set_axis(totals.index.astype(str)), pd.Series([other], index=["Other"])])
+    return pd.DataFrame({category: totals.index.astype(str), name: totals.to_numpy()})
+
+def heatmap_cells(df: pd.DataFrame, date, value=None, agg: str = "median") -> pd.DataFrame:
+    """
+    [week, day, value] cells: week of year (Sunday-first, 0-53), weekday name, and `agg` of `value`
+    (or the row count) over the rows falling in that cell. At most 54 × 7 rows.
+    """
+    dates = as_dates(df[date])
+    if dates is None:
+        return pd.DataFrame(columns=["week", "day", value or "count"])
+    keep = dates.notna()
+    dates = dates[keep]
+    weekday = ((dates.dt.dayofweek + 1) % 7).to_numpy()
+    week = (dates.dt.dayofyear.to_numpy() - 1 + 7 - weekday) // 7
+    frame = pd.DataFrame({"week": week, "weekday": weekday})
+    if value is None:
+        cells = frame.groupby(["week", "weekday"]).size().rename("count")
+    else:
+        frame[value] = df[value][keep].to_numpy()
+        cells = frame.groupby(["week", "weekday"])[value].agg(agg)
+    cells = cells.reset_index()
+    cells.insert(1, "day", pd.Categorical.from_codes(cells.pop("weekday"), WEEKDAYS))
+    return cells
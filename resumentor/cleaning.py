@@ -0,0 +1,326 @@
+"""
+Dashboard dataset cleaning: a pipeline of column-vectorized steps with a report per step.
+
+Steps run on a versions.TableView, so a cleaned Dashboard version shares every column a step did not
+touch. The same pipeline can clean a file chunk by chunk (iter_chunks in, CSV/Parquet out) when the
+dataset does not fit in memory; duplicates are then tracked across chunks by 64-bit row hashes.
+"""
+import time
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from resumentor.datasets import iter_chunks, infer_schema, dataset_format, CHUNK_ROWS, SAMPLE_ROWS
+from resumentor.versions import TableView
+
+# NA policies: drop the row, leave it, or fill it (fill statistics need the whole column, so not chunk-wise)
+NA_POLICIES = ("drop", "keep", "mean", "median", "mode")
+STAT_FILLS = ("mean", "median", "mode")
+_BOOL_VALUES = {"true": True, "t": True, "yes": True, "y": True, "1": True,
+                "false": False, "f": False, "no": False, "n": False, "0": False}
+
+# changes: {column: cells changed} (or {"rows": n} for row-level steps); seconds: wall time of the step
+StepReport = namedtuple("StepReport", ["step", "rows_in", "rows_out", "changes", "seconds"])
+
+def _is_text(dtype) -> bool:
+    return pd.api.types.is_string_dtype(dtype) and not isinstance(dtype, pd.CategoricalDtype)
+
+def _strip(values: pd.Series):
+    # (stripped values, cells changed); non-string cells of object columns are left alone
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        categories = values.cat.categories
+        if not _is_text(categories.dtype):
+            return values, 0
+        stripped = categories.str.strip()
+        changed = int(np.isin(values.cat.codes, np.flatnonzero(stripped != categories)).sum())
+        if not changed:
+            return values, 0
+        # Stripping can merge categories ("a" and " a"), so remap codes instead of renaming
+        merged = pd.Index(stripped).unique()
+        codes = np.where(values.cat.codes >= 0, merged.get_indexer(stripped)[values.cat.codes], -1)
+        return pd.Series(pd.Categorical.from_codes(codes, merged), name=values.name), changed
+    try:
+        stripped = values.str.strip()
+    except AttributeError:
+        # An object column without any strings
+        return values, 0
+    if values.dtype == object:
+        stripped = stripped.where(stripped.notna() | values.isna(), values)
+    changed = int(((stripped != values) & values.notna()).fillna(False).sum())
+    return (stripped, changed) if changed else (values, 0)
+
+class StripText:
+    """Trim surrounding whitespace in string/object/categorical columns (default: all of them)."""
+    name = "strip_text"
+
+    def __init__(self, columns=None):
+        self.columns = columns
+
+    def __call__(self, view: TableView, state: dict):
+        columns = self.columns or [c for c in view.columns if _is_text(view.dtype(c))
+                                   or isinstance(view.dtype(c), pd.CategoricalDtype)]
+        replaced, changes = {}, {}
+        for name in columns:
+            values, changed = _strip(view.column(name))
+            if changed:
+                replaced[name], changes[name] = values, changed
+        return view.with_columns(replaced) if replaced else view, changes
+
+def _seen(runs: list, hashes: np.ndarray) -> np.ndarray:
+    # Membership of each hash in a list of sorted uint64 runs
+    found = np.zeros(len(hashes), dtype=bool)
+    for run in runs:
+        positions = np.searchsorted(run, hashes).clip(max=len(run) - 1)
+        found |= run[positions] == hashes
+    return found
+
+def _remember(runs: list, new: np.ndarray):
+    # Append a sorted run of unseen hashes, merging runs like a binary counter so there are O(log n) of them
+    if not len(new):
+        return
+    runs.append(new)
+    while len(runs) > 1 and len(runs[-2]) <= 2 * len(runs[-1]):
+        last = runs.pop()
+        runs[-1] = np.sort(np.concatenate([runs[-1], last]), kind="mergesort")
+
+class DropDuplicates:
+    """Drop repeated rows, comparing only `subset` columns if given; the first occurrence is kept."""
+    name = "drop_duplicates"
+
+    def __init__(self, subset=None):
+        self.subset = subset
+
+    @staticmethod
+    def _column_hashes(values: pd.Series) -> np.ndarray:
+        # Integers are widened first: chunks downcast independently and -1 as int8 hashes unlike -1 as int16
+        if values.dtype.kind == "i" or (values.dtype.kind == "u" and values.dtype.itemsize < 8):
+            values = values.astype(np.int64)
+        return pd.util.hash_pandas_object(values, index=False).to_numpy()
+
+    def _hashes(self, view: TableView) -> np.ndarray:
+        hashes = np.zeros(len(view), dtype=np.uint64)
+        for name in self.subset or view.columns:
+            hashes = hashes * np.uint64(0x100000001B3) ^ view.column_map(name, self._column_hashes)
+        return hashes
+
+    def __call__(self, view: TableView, state: dict):
+        if "seen" not in state:
+            result = view.drop_duplicates(self.subset)
+        else:
+            # Chunk-wise: a row is a duplicate if its hash was seen in an earlier chunk or earlier in this one
+            hashes = self._hashes(view)
+            keep = ~pd.Series(hashes).duplicated().to_numpy() & ~_seen(state["seen"], hashes)
+            _remember(state["seen"], np.sort(hashes[keep]))
+            result = view.filter(keep)
+        return result, {"rows": len(view) - len(result)}
+
+def _statistic(values: pd.Series, how: str):
+    # Fill value for a "mean" / "median" / "mode" policy, or None if the column has none
+    if how == "mode":
+        modes = values.mode(dropna=True)
+        value = modes.iloc[0] if len(modes) else None
+    elif pd.api.types.is_numeric_dtype(values.dtype) and not pd.api.types.is_bool_dtype(values.dtype):
+        value = getattr(values, how)()
+    else:
+        value = None
+    return None if value is None or pd.isna(value) else value
+
+def _fillna(values: pd.Series, value) -> pd.Series:
+    if isinstance(values.dtype, pd.CategoricalDtype) and value not in values.cat.categories:
+        values = values.cat.add_categories([value])
+    return values.fillna(value)
+
+class HandleMissing:
+    """
+    Per-column NA policy: policy {column: "drop" | "keep" | "mean" | "median" | "mode" | fill value};
+    columns not in `policy` get `default`. "drop" removes the row.
+    """
+    name = "handle_missing"
+
+    def __init__(self, policy=None, default="drop"):
+        self.policy = dict(policy or {})
+        self.default = default
+
+    def __call__(self, view: TableView, state: dict):
+        keep = np.ones(len(view), dtype=bool)
+        fills, changes = {}, {}
+        for name in view.columns:
+            rule = self.policy.get(name, self.default)
+            named = rule if isinstance(rule, str) and rule in NA_POLICIES else None
+            if named == "keep":
+                continue
+            missing = view.column_map(name, pd.isna)
+            if not missing.any():
+                continue
+            if named == "drop":
+                keep &= ~missing
+                continue
+            if named in STAT_FILLS:
+                if "seen" in state:
+                    raise ValueError(f"{named} fill of {name!r} needs the whole column; use a constant chunk-wise")
+                rule = _statistic(view.column(name), named)
+                if rule is None:
+                    continue
+            fills[name] = rule
+            changes[name] = int(missing.sum())
+        result = view.with_columns({name: _fillna(view.column(name), value) for name, value in fills.items()})
+        result = result.filter(keep)
+        if not keep.all():
+            changes["rows"] = int((~keep).sum())
+        return result, changes
+
+def coerce_column(values: pd.Series, kind: str, fmt=None) -> pd.Series:
+    # Convert to a datasets.ColumnType kind; values that cannot be converted become NA
+    if kind == "int":
+        numbers = pd.to_numeric(values, errors="coerce")
+        if numbers.notna().all() and (numbers % 1 == 0).all():
+            return pd.to_numeric(numbers.astype(np.int64), downcast="integer")
+        return numbers.where(numbers % 1 == 0).astype("Int64")
+    if kind == "float":
+        return pd.to_numeric(values, errors="coerce").astype(np.float64)
+    if kind == "bool":
+        if pd.api.types.is_bool_dtype(values):
+            return values
+        return values.astype("string").str.strip().str.lower().map(_BOOL_VALUES).astype("boolean")
+    if kind == "datetime":
+        if pd.api.types.is_datetime64_any_dtype(values):
+            return values
+        return pd.to_datetime(values, errors="coerce", format=fmt or "mixed")
+    if kind == "category":
+        return values.astype("category")
+    if kind == "string":
+        return values.astype("string")
+    raise ValueError(f"Unknown column kind {kind!r}")
+
+class CoerceTypes:
+    """
+    Convert columns to types: {column: kind or datasets.ColumnType}; failed conversions count as changes.
+    With types=None, text columns get the date/category types datasets.infer_schema finds in their first rows
+    (decided on the first chunk when cleaning chunk-wise).
+    """
+    name = "coerce_types"
+
+    def __init__(self, types: dict = None):
+        self.types = None if types is None else dict(types)
+
+    def _types(self, view: TableView, state: dict) -> dict:
+        if self.types is not None:
+            return self.types
+        if "types" not in state:
+            text = [c for c in view.columns if _is_text(view.dtype(c))]
+            sample = pd.DataFrame({c: view.column(c).head(SAMPLE_ROWS) for c in text})
+            state["types"] = {c: spec for c, spec in infer_schema(sample).items() if spec.kind in ("datetime", "category")}
+        return state["types"]
+
+    def __call__(self, view: TableView, state: dict):
+        replaced, changes = {}, {}
+        for name, spec in self._types(view, state).items():
+            if name not in view.columns:
+                continue
+            kind, fmt = (spec, None) if isinstance(spec, str) else (spec.kind, spec.format)
+            values = view.column(name)
+            converted = coerce_column(values, kind, fmt)
+            if converted is values:
+                continue
+            replaced[name] = converted
+            lost = int((converted.isna().to_numpy() & values.notna().to_numpy()).sum())
+            if lost:
+                changes[name] = lost
+        return view.with_columns(replaced) if replaced else view, changes
+
+def _merge(reports: list, new: list) -> list:
+    # Chunk-wise totals: add this chunk's rows, changes and time to the running per-step report
+    if not reports:
+        return new
+    merged = []
+    for old, report in zip(reports, new):
+        changes = dict(old.changes)
+        for key, count in report.changes.items():
+            changes[key] = changes.get(key, 0) + count
+        merged.append(StepReport(old.step, old.rows_in + report.rows_in, old.rows_out + report.rows_out,
+                                 changes, old.seconds + report.seconds))
+    return merged
+
+class CleaningPipeline:
+    """
+    Steps run in order on a TableView (or DataFrame). A pipeline is a valid DatasetHistory operation:
+    history.apply(pipeline, "cleaned"). `reports` holds one StepReport per step for the last run.
+    """
+
+    def __init__(self, steps):
+        self.steps = list(steps)
+        self.reports = []
+
+    @classmethod
+    def default(cls, subset=None):
+        # The Dashboard's Clean button: trim text, drop duplicate rows, drop rows with missing values
+        return cls([StripText(), DropDuplicates(subset), HandleMissing()])
+
+    def _run(self, view: TableView, state: dict):
+        reports = []
+        for step in self.steps:
+            start = time.perf_counter()
+            rows_in = len(view)
+            view, changes = step(view, state)
+            reports.append(StepReport(step.name, rows_in, len(view), changes, time.perf_counter() - start))
+        return view, reports
+
+    def __call__(self, view) -> TableView:
+        if isinstance(view, pd.DataFrame):
+            view = TableView(view)
+        view, self.reports = self._run(view, {})
+        return view
+
+    def run_chunks(self, chunks):
+        """Clean DataFrame chunks one at a time (yields cleaned frames); `reports` are totals over all chunks."""
+        state = {"seen": []}
+        self.reports = []
+        for chunk in chunks:
+            view, reports = self._run(TableView(chunk.reset_index(drop=True)), state)
+            self.reports = _merge(self.reports, reports)
+            yield view.to_frame()
+
+def _arrow_table(chunk: pd.DataFrame, schema=None):
+    # Chunks may differ in downcast int width and category sets, so widen to one stable schema
+    import pyarrow as pa
+    table = pa.Table.from_pandas(chunk, preserve_index=False)
+    if schema is None:
+        fields = []
+        for field in table.schema:
+            if pa.types.is_dictionary(field.type):
+                field = field.with_type(field.type.value_type)
+            elif pa.types.is_integer(field.type):
+                field = field.with_type(pa.int64())
+            fields.append(field)
+        schema = pa.schema(fields)
+    return table.cast(schema), schema
+
+def clean_file(source, destination, pipeline: CleaningPipeline, columns=None, chunksize: int = CHUNK_ROWS) -> list:
+    """
+    Clean a CSV/Parquet file into `destination` (.csv or .parquet) without loading it whole.
+    Returns the pipeline's per-step reports.
+    """
+    writer = schema = None
+    header = True
+    try:
+        for frame in pipeline.run_chunks(iter_chunks(source, columns, chunksize)):
+            if dataset_format(destination) == "parquet":
+                import pyarrow.parquet as pq
+                table, schema = _arrow_table(frame, schema)
+                if writer is None:
+                    writer = pq.ParquetWriter(destination, schema)
+                writer.write_table(table)
+            else:
+                frame.to_csv(destination, mode="w" if header else "a", header=header, index=False)
+                header = False
+    finally:
+        if writer is not None:
+            writer.close()
+    return pipeline.reports
+
+def report_frame(reports: list) -> pd.DataFrame:
+    # One display row per step: rows in/out, what changed, milliseconds
+    return pd.DataFrame([{"step": r.step, "rows in": r.rows_in, "rows out": r.rows_out,
+                          "changes": ", ".join(f"{k}: {v:,}" for k, v in r.changes.items()) or "none",
+                          "ms": round(r.seconds * 1000, 1)} for r in reports])
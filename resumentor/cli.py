@@ -0,0 +1,193 @@
+"""Command line entry point: `python -m resumentor <command>`."""
+import sys
+import json
+import argparse
+
+from resumentor.report import EXPORT_FORMATS
+
+def cmd_score(args):
+    from resumentor.batch import iter_batch_items, ingest, rank_batch, FILE_TIMEOUT
+    from resumentor.report import export_format, export_results
+    from resumentor.scoring import BatchScorer
+    with open(args.jd_file, encoding="utf-8") as fh:
+        job_desc = fh.read()
+    fmt = export_format(args.output, args.format)
+    if args.output == "-" and fmt in ("parquet", "zip"):
+        print(f"{fmt} output needs a file path (-o)", file=sys.stderr)
+        return 2
+    scorer = BatchScorer.load(args.reference) if args.reference else None
+    file_timeout = FILE_TIMEOUT if args.file_timeout is None else args.file_timeout or None
+    # Extraction runs on the pool; scoring is one vectorized pass once every file is in
+    results = ingest(iter_batch_items(args.resumes), args.workers, args.max_pages, file_timeout)
+    rows = rank_batch(results, job_desc, scorer=scorer)
+    failed = sum(row["error"] is not None for row in rows)
+    export_results(rows, sys.stdout if args.output == "-" else args.output, fmt)
+    print(f"Scored {len(rows) - failed}/{len(rows)} resumes", file=sys.stderr)
+    return 1 if failed and failed == len(rows) else 0
+
+def cmd_build_jd_index(args):
+    from resumentor.jds import sample_jds
+    from resumentor.jd_index import JDIndex, load_jd_library
+    jds = load_jd_library(args.source) if args.source else sample_jds
+    JDIndex.build(jds).save(args.output_dir)
+    print(f"Indexed {len(jds)} job descriptions into {args.output_dir}", file=sys.stderr)
+    return 0
+
+def cmd_match_jds(args):
+    from resumentor.extract import BytesUpload, extract_text, clean_text
+    from resumentor.jd_index import JDIndex, library_jd_index
+    index = JDIndex.load(args.index) if args.index else library_jd_index()
+    resume_text = clean_text(extract_text(BytesUpload.from_path(args.resume)))
+    for title, score in index.top_k(resume_text, args.top):
+        print(json.dumps({"title": title, "score": score}, ensure_ascii=False))
+    return 0
+
+def _candidate_texts(source, labels, workers):
+    # Texts of past candidates from a .jsonl ({"id", "text"} per line) or a directory/ZIP of resumes;
+    # labels are appended as texts are produced
+    if str(source).lower().endswith(".jsonl"):
+        with open(source, encoding="utf-8") as fh:
+            for line in fh:
+                if line.strip():
+                    row = json.loads(line)
+                    labels.append(str(row["id"]))
+                    yield row["text"]
+        return
+    from resumentor.batch import iter_batch_items, ingest
+    for result in ingest(iter_batch_items(source), workers):
+        if "error" in result:
+            print(f"Skipped {result['file']}: {result['error']}", file=sys.stderr)
+            continue
+        labels.append(result["file"])
+        yield result["text"]
+
+def cmd_fit_scorer(args):
+    from resumentor.scoring import BatchScorer
+    texts = list(_candidate_texts(args.source, [], args.workers))
+    for path in args.jd_files:
+        with open(path, encoding="utf-8") as fh:
+            texts.append(fh.read())
+    BatchScorer().fit(texts).save(args.output)
+    print(f"Fitted a scorer on {len(texts)} documents into {args.output}", file=sys.stderr)
+    return 0
+
+def cmd_build_candidate_index(args):
+    from resumentor.ann import CandidateIndex
+    if args.fit_sample < 2:
+        print("--fit-sample must be at least 2", file=sys.stderr)
+        return 2
+    labels = []
+    try:
+        index = CandidateIndex.build(_candidate_texts(args.source, labels, args.workers), labels, dim=args.dim,
+                                     n_lists=args.lists, fit_sample=args.fit_sample)
+    except ValueError as err:
+        # Fewer than 2 readable resumes: an LSA embedding needs at least 2 documents
+        print(f"Cannot build a candidate index from {args.source}: {err}", file=sys.stderr)
+        return 2
+    index.save(args.output_dir)
+    print(f"Indexed {len(index)} candidates into {args.output_dir} ({index.ivf.n_lists} lists)", file=sys.stderr)
+    return 0
+
+def cmd_search_candidates(args):
+    from resumentor.ann import CandidateIndex
+    index = CandidateIndex.load(args.index)
+    if args.like:
+        hits = index.similar_to(args.query, args.top, args.probe)
+    elif args.query.lower().endswith(".txt"):
+        with open(args.query, encoding="utf-8") as fh:
+            hits = index.top_k(fh.read(), args.top, args.probe)
+    else:
+        from resumentor.extract import BytesUpload, extract_text, clean_text
+        hits = index.top_k(clean_text(extract_text(BytesUpload.from_path(args.query))), args.top, args.probe)
+    for label, score in hits:
+        print(json.dumps({"candidate": label, "score": score}, ensure_ascii=False))
+    return 0
+
+def cmd_clean_dataset(args):
+    from resumentor.cleaning import CleaningPipeline, StripText, DropDuplicates, HandleMissing, CoerceTypes, clean_file
+    steps = [] if args.no_strip else [StripText()]
+    if not args.keep_duplicates:
+        steps.append(DropDuplicates(args.keys))
+    steps.append(HandleMissing(default=args.fill if args.fill is not None else args.na))
+    if args.infer_types:
+        steps.append(CoerceTypes())
+    # Chunk by chunk, so the dataset never has to fit in memory
+    reports = clean_file(args.source, args.output, CleaningPipeline(steps), args.columns, args.chunksize)
+    for report in reports:
+        changes = ", ".join(f"{k}: {v}" for k, v in report.changes.items()) or "none"
+        print(f"{report.step}: {report.rows_in} -> {report.rows_out} rows, {changes} ({report.seconds:.2f}s)",
+              file=sys.stderr)
+    return 0
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="resumentor", description="Headless ResuMentor resume analysis.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    score = sub.add_parser("score", help="Rank every PDF/DOCX resume in a directory or ZIP against one JD.")
+    score.add_argument("resumes", help="Directory (searched recursively) or .zip of .pdf/.docx resumes")
+    score.add_argument("jd_file", help="Plain-text job description")
+    score.add_argument("-o", "--output", default="-", help="Output path (default: JSONL on stdout)")
+    score.add_argument("-f", "--format", choices=EXPORT_FORMATS, default=None,
+                       help="jsonl, csv, parquet, or zip (one text report per resume); default: from -o's extension")
+    score.add_argument("-j", "--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    score.add_argument("--max-pages", type=int, default=None, help="Read at most this many pages per PDF")
+    score.add_argument("--file-timeout", type=float, default=None,
+                       help="Seconds allowed per resume before it is reported as timed out (default: 120; 0 = no limit)")
+    score.add_argument("--reference", default=None,
+                       help="Scorer saved by fit-scorer (default: $RESUMENTOR_SCORER, else fitted on these resumes)")
+    score.set_defaults(func=cmd_score)
+
+    fit = sub.add_parser("fit-scorer", help="Fit the batch scorer's vocabulary + IDF on a reference corpus and save it.")
+    fit.add_argument("output", help="File to write the scorer into")
+    fit.add_argument("source", help='.jsonl of {"id", "text"} rows, or a directory/.zip of .pdf/.docx resumes')
+    fit.add_argument("jd_files", nargs="*", help="Plain-text job descriptions to include in the corpus")
+    fit.add_argument("-j", "--workers", type=int, default=None, help="Extraction worker processes")
+    fit.set_defaults(func=cmd_fit_scorer)
+
+    index = sub.add_parser("build-jd-index", help="Precompute a JD index (term counts, skills, flags) on disk.")
+    index.add_argument("output_dir", help="Directory to write the index into")
+    index.add_argument("source", nargs="?", help=".json / .jsonl / directory of .txt JDs (default: built-in samples)")
+    index.set_defaults(func=cmd_build_jd_index)
+
+    match = sub.add_parser("match-jds", help="Rank a JD index for one resume (JSONL, best first).")
+    match.add_argument("resume", help="PDF/DOCX resume")
+    match.add_argument("index", nargs="?", help="JD index directory (default: $RESUMENTOR_JD_INDEX or the samples)")
+    match.add_argument("-k", "--top", type=int, default=10, help="Number of JDs to return")
+    match.set_defaults(func=cmd_match_jds)
+
+    candidates = sub.add_parser("build-candidate-index",
+                                help="Embed past candidates (LSA) into an approximate nearest-neighbour index on disk.")
+    candidates.add_argument("output_dir", help="Directory to write the index into")
+    candidates.add_argument("source", help='.jsonl of {"id", "text"} rows, or a directory/.zip of .pdf/.docx resumes')
+    candidates.add_argument("--dim", type=int, default=128, help="Embedding size")
+    candidates.add_argument("--lists", type=int, default=None, help="Inverted lists (default: ~sqrt(candidates))")
+    candidates.add_argument("--fit-sample", type=int, default=20000, help="Texts used to fit the embedding")
+    candidates.add_argument("-j", "--workers", type=int, default=None, help="Extraction worker processes")
+    candidates.set_defaults(func=cmd_build_candidate_index)
+
+    search = sub.add_parser("search-candidates", help="Most similar indexed candidates to a JD or resume (JSONL).")
+    search.add_argument("index", help="Candidate index directory")
+    search.add_argument("query", help="JD/resume as .txt, a PDF/DOCX resume, or a candidate id with --like")
+    search.add_argument("--like", action="store_true", help="Query is an indexed candidate's id")
+    search.add_argument("-k", "--top", type=int, default=10, help="Number of candidates to return")
+    search.add_argument("--probe", type=int, default=8,
+                        help="Lists scanned per query: higher is slower with better recall (default: 8)")
+    search.set_defaults(func=cmd_search_candidates)
+
+    clean = sub.add_parser("clean-dataset", help="Clean a CSV/Parquet dataset chunk by chunk into a new file.")
+    clean.add_argument("source", help="CSV or Parquet file")
+    clean.add_argument("output", help="Output .csv or .parquet")
+    clean.add_argument("--columns", nargs="+", default=None, help="Only read these columns")
+    clean.add_argument("--keys", nargs="+", default=None, help="Columns that identify a duplicate (default: all)")
+    clean.add_argument("--keep-duplicates", action="store_true", help="Do not drop duplicate rows")
+    clean.add_argument("--no-strip", action="store_true", help="Do not trim whitespace in text columns")
+    clean.add_argument("--na", choices=("drop", "keep"), default="drop", help="Rows with missing values (default: drop)")
+    clean.add_argument("--fill", default=None, help="Fill missing values with this constant instead")
+    clean.add_argument("--infer-types", action="store_true", help="Convert text columns to detected dates/categories")
+    clean.add_argument("--chunksize", type=int, default=100000, help="Rows per chunk")
+    clean.set_defaults(func=cmd_clean_dataset)
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
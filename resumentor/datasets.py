@@ -0,0 +1,166 @@
+"""
+Dashboard dataset ingestion: compact, typed DataFrames from CSV or Parquet uploads.
+
+A sample of the file decides each column's type (downcast integers, categoricals for low-cardinality
+strings, parsed dates); the file is then read in chunks, optionally only some of its columns, and each
+chunk is converted before the next is read. The "pyarrow" backend keeps columns in Arrow memory instead.
+"""
+from collections import namedtuple
+
+import pandas as pd
+
+# Rows read to infer column types, and rows per chunk when reading the whole file
+SAMPLE_ROWS = 10000
+CHUNK_ROWS = 100000
+# A string column becomes categorical when its sample has at most this share of distinct values
+CATEGORY_MAX_RATIO = 0.5
+# A string column becomes datetime when this share of its first DATE_SNIFF_ROWS values parse as dates
+DATE_MIN_RATIO = 0.9
+DATE_SNIFF_ROWS = 200
+BACKENDS = ("numpy", "pyarrow")
+
+# kind: "int" | "float" | "bool" | "datetime" | "category" | "string"; format: strftime format of dates (or None)
+ColumnType = namedtuple("ColumnType", ["kind", "format"])
+
+def _rewind(source):
+    if hasattr(source, "seek"):
+        source.seek(0)
+    return source
+
+def dataset_format(source) -> str:
+    name = str(getattr(source, "name", source)).lower()
+    return "parquet" if name.endswith((".parquet", ".pq")) else "csv"
+
+def read_columns(source) -> list:
+    # Column names only (the CSV header / Parquet schema)
+    if dataset_format(source) == "parquet":
+        import pyarrow.parquet as pq
+        columns = pq.ParquetFile(_rewind(source)).schema_arrow.names
+    else:
+        columns = pd.read_csv(_rewind(source), nrows=0).columns.tolist()
+    _rewind(source)
+    return columns
+
+def _date_format(values: pd.Series):
+    # (looks like dates, strftime format guessed from the first value or None)
+    from pandas.tseries.api import guess_datetime_format
+    values = values.head(DATE_SNIFF_ROWS).astype(str)
+    if not values.str.contains(r"\d").all():
+        return False, None
+    fmt = guess_datetime_format(values.iloc[0])
+    parsed = pd.to_datetime(values, errors="coerce", format=fmt or "mixed")
+    if parsed.notna().mean() >= DATE_MIN_RATIO:
+        return True, fmt
+    return False, None
+
+def infer_schema(sample: pd.DataFrame) -> dict:
+    """{column: ColumnType} from a sample of rows."""
+    schema = {}
+    for name, col in sample.items():
+        if pd.api.types.is_bool_dtype(col):
+            schema[name] = ColumnType("bool", None)
+        elif pd.api.types.is_integer_dtype(col):
+            schema[name] = ColumnType("int", None)
+        elif pd.api.types.is_float_dtype(col):
+            schema[name] = ColumnType("float", None)
+        elif pd.api.types.is_datetime64_any_dtype(col):
+            schema[name] = ColumnType("datetime", None)
+        else:
+            values = col.dropna()
+            is_date, fmt = _date_format(values) if len(values) else (False, None)
+            if is_date:
+                schema[name] = ColumnType("datetime", fmt)
+            elif values.nunique() <= CATEGORY_MAX_RATIO * len(values):
+                schema[name] = ColumnType("category", None)
+            else:
+                schema[name] = ColumnType("string", None)
+    return schema
+
+def apply_schema(chunk: pd.DataFrame, schema: dict) -> pd.DataFrame:
+    # Convert one chunk in place: downcast integers, parse dates, encode categoricals
+    for name, spec in schema.items():
+        if name not in chunk:
+            continue
+        col = chunk[name]
+        if spec.kind == "int" and pd.api.types.is_integer_dtype(col):
+            chunk[name] = pd.to_numeric(col, downcast="integer")
+        elif spec.kind == "datetime" and not pd.api.types.is_datetime64_any_dtype(col):
+            chunk[name] = pd.to_datetime(col, errors="coerce", format=spec.format or "mixed")
+        elif spec.kind == "category" and not isinstance(col.dtype, pd.CategoricalDtype):
+            chunk[name] = col.astype("category")
+    return chunk
+
+def _concat(chunks: list) -> pd.DataFrame:
+    # Categoricals only survive concat when every chunk has the same categories
+    if len(chunks) == 1:
+        return chunks[0]
+    from pandas.api.types import union_categoricals
+    for name in chunks[0].columns:
+        if all(isinstance(chunk[name].dtype, pd.CategoricalDtype) for chunk in chunks):
+            categories = union_categoricals([chunk[name] for chunk in chunks]).categories
+            for chunk in chunks:
+                chunk[name] = chunk[name].cat.set_categories(categories)
+    return pd.concat(chunks, ignore_index=True)
+
+def iter_chunks(source, columns=None, chunksize: int = CHUNK_ROWS, schema=None, sample_rows: int = SAMPLE_ROWS):
+    """
+    Typed DataFrame chunks of a CSV/Parquet file (path or file object), reading only `columns` if given.
+    The schema is inferred from the first `sample_rows` rows unless passed in.
+    """
+    if dataset_format(source) == "parquet":
+        import pyarrow.parquet as pq
+        batches = pq.ParquetFile(_rewind(source)).iter_batches(batch_size=chunksize, columns=columns)
+        chunks = (batch.to_pandas() for batch in batches)
+    else:
+        if schema is None:
+            schema = infer_schema(pd.read_csv(_rewind(source), nrows=sample_rows, usecols=columns))
+        dtype = {name: "category" for name, spec in schema.items() if spec.kind == "category"}
+        chunks = pd.read_csv(_rewind(source), usecols=columns, chunksize=chunksize, dtype=dtype)
+    for chunk in chunks:
+        if schema is None:
+            schema = infer_schema(chunk.head(sample_rows))
+        yield apply_schema(chunk, schema)
+
+def _read_arrow(source, columns) -> pd.DataFrame:
+    # Columns stay in Arrow buffers (pd.ArrowDtype); low-cardinality strings are dictionary-encoded
+    import pyarrow as pa
+    if dataset_format(source) == "parquet":
+        import pyarrow.parquet as pq
+        table = pq.read_table(_rewind(source), columns=columns)
+    else:
+        from pyarrow import csv
+        reader = csv.open_csv(_rewind(source), read_options=csv.ReadOptions(block_size=16 * 1024 * 1024),
+                              convert_options=csv.ConvertOptions(include_columns=columns))
+        table = pa.Table.from_batches(list(reader), schema=reader.schema)
+    for i, field in enumerate(table.schema):
+        if pa.types.is_string(field.type) or pa.types.is_large_string(field.type):
+            sample = table.column(i).slice(0, SAMPLE_ROWS).drop_null()
+            if len(sample) and len(sample.unique()) <= CATEGORY_MAX_RATIO * len(sample):
+                table = table.set_column(i, field.name, table.column(i).dictionary_encode())
+    # Dictionary columns become pandas categoricals; everything else keeps its Arrow type
+    return table.to_pandas(types_mapper=lambda t: None if pa.types.is_dictionary(t) else pd.ArrowDtype(t))
+
+def read_dataset(source, columns=None, backend: str = "numpy", chunksize: int = CHUNK_ROWS) -> pd.DataFrame:
+    """
+    Load a CSV/Parquet dataset with compact dtypes.
+    - columns: only read these columns (default: all)
+    - backend: "numpy" (typed chunks of `chunksize` rows, concatenated) or "pyarrow" (Arrow-backed columns)
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}; expected one of {', '.join(BACKENDS)}")
+    if backend == "pyarrow":
+        return _read_arrow(source, columns)
+    chunks = list(iter_chunks(source, columns, chunksize))
+    if not chunks:
+        return pd.DataFrame(columns=columns or read_columns(source))
+    return _concat(chunks)
+
+def memory_footprint(df: pd.DataFrame) -> int:
+    # Bytes held by the frame, including string payloads
+    return int(df.memory_usage(deep=True).sum())
+
+def format_bytes(n: int) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024 or unit == "GB":
+            return f"{n:,.0f} {unit}" if unit == "B" else f"{n:,.1f} {unit}"
+        n /= 1024
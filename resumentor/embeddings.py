@@ -0,0 +1,87 @@
+"""
+Dense resume/JD embeddings: hashed word n-grams -> TF-IDF -> truncated SVD (LSA), CPU only.
+
+Hashing needs no vocabulary, so a fitted embedder is just two arrays (IDF weights and SVD components)
+that are saved as .npy files and memory-mapped on load.
+"""
+import os
+import json
+
+import numpy as np
+
+EMBEDDER_FORMAT_VERSION = 1
+
+class LSAEmbedder:
+    """
+    - n_features: hash buckets for word 1..ngram_max-grams
+    - dim: embedding size (capped by the number of fitted documents)
+    Embeddings are L2-normalized float32 rows, so a dot product is a cosine similarity.
+    """
+
+    def __init__(self, n_features: int = 2 ** 16, dim: int = 128, ngram_max: int = 2, seed: int = 0,
+                 idf=None, components=None):
+        self.n_features = n_features
+        self.dim = dim
+        self.ngram_max = ngram_max
+        self.seed = seed
+        self.idf = idf
+        self.components = components
+        self._hasher = None
+
+    def _hashed(self, texts):
+        # Sublinear term frequencies (1 + log tf) in hash space
+        if self._hasher is None:
+            from sklearn.feature_extraction.text import HashingVectorizer
+            self._hasher = HashingVectorizer(n_features=self.n_features, ngram_range=(1, self.ngram_max),
+                                             alternate_sign=False, norm=None, dtype=np.float32)
+        counts = self._hasher.transform(texts)
+        np.log(counts.data, out=counts.data)
+        counts.data += 1
+        return counts
+
+    def _weighted(self, counts):
+        from sklearn.preprocessing import normalize
+        return normalize(counts.multiply(self.idf).tocsr())
+
+    def fit(self, texts):
+        from sklearn.decomposition import TruncatedSVD
+        counts = self._hashed(list(texts))
+        n_docs = counts.shape[0]
+        if n_docs < 2:
+            raise ValueError(f"Fitting an embedder needs at least 2 documents, got {n_docs}")
+        df = np.bincount(counts.indices, minlength=self.n_features)
+        self.idf = (np.log((1 + n_docs) / (1 + df)) + 1).astype(np.float32)
+        svd = TruncatedSVD(n_components=min(self.dim, n_docs - 1), random_state=self.seed)
+        svd.fit(self._weighted(counts))
+        self.components = np.ascontiguousarray(svd.components_.T, dtype=np.float32)
+        self.dim = self.components.shape[1]
+        return self
+
+    def transform(self, texts) -> np.ndarray:
+        if self.components is None:
+            raise ValueError("Embedder is not fitted")
+        vectors = np.asarray(self._weighted(self._hashed(list(texts))) @ self.components, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
+
+    # ---------------------- Persistence ----------------------
+    def save(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, "idf.npy"), self.idf)
+        np.save(os.path.join(directory, "components.npy"), self.components)
+        meta = {"format_version": EMBEDDER_FORMAT_VERSION, "n_features": self.n_features, "dim": self.dim,
+                "ngram_max": self.ngram_max, "seed": self.seed}
+        with open(os.path.join(directory, "embedder.json"), "w", encoding="utf-8") as fh:
+            json.dump(meta, fh)
+
+    @classmethod
+    def load(cls, directory, mmap: bool = True):
+        with open(os.path.join(directory, "embedder.json"), encoding="utf-8") as fh:
+            meta = json.load(fh)
+        if meta.get("format_version") != EMBEDDER_FORMAT_VERSION:
+            raise ValueError(f"Unsupported embedder format: {meta.get('format_version')!r}")
+        mode = "r" if mmap else None
+        return cls(meta["n_features"], meta["dim"], meta["ngram_max"], meta["seed"],
+                   idf=np.load(os.path.join(directory, "idf.npy"), mmap_mode=mode),
+                   components=np.load(os.path.join(directory, "components.npy"), mmap_mode=mode))
@@ -0,0 +1,312 @@
+"""Resume text extraction (PDF/DOCX) and the content-addressed extraction cache."""
+import io
+import os
+import re
+import zlib
+import sqlite3
+import hashlib
+import zipfile
+import threading
+import multiprocessing
+import xml.etree.ElementTree as ET
+
+from resumentor.cache import BoundedLRU, deep_sizeof
+from resumentor.tracing import traced
+
+PDF_MIME = "application/pdf"
+DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+MIME_BY_SUFFIX = {".pdf": PDF_MIME, ".docx": DOCX_MIME}
+
+# PDFs with at least this many pages are spread across a process pool
+PARALLEL_PAGE_THRESHOLD = 8
+# Guard rails for pathological PDFs in the app and job workers
+MAX_PDF_PAGES = 50
+PDF_PAGE_TIMEOUT = 20  # seconds
+# Zip-bomb guard: most decompressed XML read from one DOCX (all text parts together)
+MAX_DOCX_XML_BYTES = 64 * 1024 * 1024
+
+_worker_pdf = None
+# Idle single-process workers that read small PDFs under a page timeout; kept across calls
+_page_workers = []
+_page_workers_lock = threading.Lock()
+
+def _close_pdf_worker():
+    global _worker_pdf
+    if _worker_pdf is not None:
+        _worker_pdf.close()
+        _worker_pdf = None
+
+def _init_pdf_worker(data: bytes):
+    # Each pool worker parses the document once, then extracts the pages it is handed
+    global _worker_pdf
+    import pdfplumber
+    _close_pdf_worker()
+    _worker_pdf = pdfplumber.open(io.BytesIO(data))
+
+def _extract_pdf_page(index: int) -> str:
+    return _worker_pdf.pages[index].extract_text() or ""
+
+class BytesUpload(io.BytesIO):
+    # In-memory stand-in for Streamlit's UploadedFile: bytes plus a MIME `type`
+    def __init__(self, data: bytes, file_type: str, name: str = ""):
+        super().__init__(data)
+        self.type = file_type
+        self.name = name
+
+    @classmethod
+    def from_path(cls, path):
+        suffix = os.path.splitext(str(path))[1].lower()
+        with open(path, "rb") as fh:
+            return cls(fh.read(), MIME_BY_SUFFIX.get(suffix, ""), os.path.basename(str(path)))
+
+def _file_bytes(file) -> bytes:
+    if hasattr(file, "getvalue"):
+        return file.getvalue()
+    file.seek(0)
+    return file.read()
+
+def _iter_pdf_pages_pool(data: bytes, n_pages: int, page_timeout, workers, timed_out: list):
+    workers = workers or min(n_pages, os.cpu_count() or 1)
+    pool = multiprocessing.Pool(workers, initializer=_init_pdf_worker, initargs=(data,))
+    try:
+        pending = [pool.apply_async(_extract_pdf_page, (i,)) for i in range(n_pages)]
+        for index, result in enumerate(pending):
+            try:
+                yield result.get(timeout=page_timeout)
+            except multiprocessing.TimeoutError:
+                # Give up on this page; terminate() below kills the stuck worker
+                timed_out.append(index)
+                yield ""
+    finally:
+        pool.terminate()
+
+def _checkout_page_worker():
+    with _page_workers_lock:
+        if _page_workers:
+            return _page_workers.pop()
+    return multiprocessing.Pool(1)
+
+def _release_page_worker(worker):
+    worker.apply_async(_close_pdf_worker)
+    with _page_workers_lock:
+        if len(_page_workers) < (os.cpu_count() or 1):
+            _page_workers.append(worker)
+            return
+    worker.terminate()
+
+def _iter_pdf_pages_worker(data: bytes, n_pages: int, page_timeout, timed_out: list):
+    # One page at a time on a reused worker process; a worker stuck past the timeout is killed and replaced
+    worker = None
+    try:
+        for index in range(n_pages):
+            try:
+                if worker is None:
+                    worker = _checkout_page_worker()
+                    worker.apply_async(_init_pdf_worker, (data,)).get(timeout=page_timeout)
+                text = worker.apply_async(_extract_pdf_page, (index,)).get(timeout=page_timeout)
+            except multiprocessing.TimeoutError:
+                worker.terminate()
+                worker = None
+                timed_out.append(index)
+                text = ""
+            yield text
+    finally:
+        if worker is not None:
+            _release_page_worker(worker)
+
+def iter_pdf_pages(file, max_pages=None, page_timeout=None, workers=None, timed_out=None):
+    """
+    Yield the text of each PDF page, in order, as soon as it is extracted.
+    - max_pages caps how many pages are read
+    - documents with PARALLEL_PAGE_THRESHOLD pages or more run on a process pool (unless workers=1)
+    - a page that takes longer than page_timeout seconds yields ""; smaller documents are then read
+      on a reused worker process, so the timeout can be enforced without starting a pool per call
+    - timed_out: list that receives the index of every page that timed out
+    """
+    import pdfplumber
+    with pdfplumber.open(file) as pdf:
+        n_pages = len(pdf.pages) if max_pages is None else min(len(pdf.pages), max_pages)
+        serial = workers == 1 or n_pages < PARALLEL_PAGE_THRESHOLD
+        if serial and page_timeout is None:
+            for page in pdf.pages[:n_pages]:
+                yield page.extract_text() or ""
+            return
+    if not n_pages:
+        return
+    timed_out = [] if timed_out is None else timed_out
+    if serial:
+        yield from _iter_pdf_pages_worker(_file_bytes(file), n_pages, page_timeout, timed_out)
+    else:
+        yield from _iter_pdf_pages_pool(_file_bytes(file), n_pages, page_timeout, workers, timed_out)
+
+# ---------------------- DOCX ----------------------
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_HEADER_RE = re.compile(r"word/header[0-9]*.xml")
+_FOOTER_RE = re.compile(r"word/footer[0-9]*.xml")
+_DOCX_CHUNK = 64 * 1024
+
+class ExtractionLimitExceeded(ValueError):
+    pass
+
+def _iter_xml_paragraphs(part, budget: list):
+    """
+    Incrementally parse one WordprocessingML part, yielding text per paragraph as docx2txt renders it
+    ("\n\n" before each paragraph, tabs/breaks as characters). Finished body children are dropped from
+    the tree, so memory stays at one top-level element. `budget` is [bytes left], shared across parts.
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    parts, depth, body = [], 0, None
+    for chunk in iter(lambda: part.read(_DOCX_CHUNK), b""):
+        budget[0] -= len(chunk)
+        if budget[0] < 0:
+            raise ExtractionLimitExceeded("DOCX text parts exceed the decompressed size limit")
+        parser.feed(chunk)
+        for event, elem in parser.read_events():
+            if event == "start":
+                depth += 1
+                if depth == 2:
+                    body = elem
+                if elem.tag == _W + "p":
+                    if parts:
+                        yield "".join(parts)
+                    parts = ["\n\n"]
+                elif elem.tag == _W + "tab":
+                    parts.append("\t")
+                elif elem.tag in (_W + "br", _W + "cr"):
+                    parts.append("\n")
+                continue
+            depth -= 1
+            if elem.tag == _W + "t" and elem.text:
+                parts.append(elem.text)
+            if depth == 2 and body is not None:
+                body.remove(elem)
+    parser.close()
+    if parts:
+        yield "".join(parts)
+
+def iter_docx_paragraphs(file, max_xml_bytes: int = MAX_DOCX_XML_BYTES):
+    """
+    Stream a DOCX's text: headers, body, then footers, one paragraph at a time.
+    Only the XML text parts are decompressed (media is never read), in chunks, and at most
+    `max_xml_bytes` of them in total; more raises ExtractionLimitExceeded.
+    """
+    budget = [max_xml_bytes]
+    with zipfile.ZipFile(file) as zf:
+        names = zf.namelist()
+        parts = [n for n in names if _HEADER_RE.match(n)] + ["word/document.xml"]
+        parts += [n for n in names if _FOOTER_RE.match(n)]
+        for name in parts:
+            if zf.getinfo(name).file_size > budget[0]:
+                raise ExtractionLimitExceeded(f"{name} is larger than the decompressed size limit")
+            with zf.open(name) as part:
+                yield from _iter_xml_paragraphs(part, budget)
+
+@traced()
+def extract_text(file, max_pages=None, page_timeout=None, workers=None, max_xml_bytes=MAX_DOCX_XML_BYTES,
+                 timed_out=None):
+    text = ""
+    if file.type == PDF_MIME:
+        pages = iter_pdf_pages(file, max_pages, page_timeout, workers, timed_out)
+        text = "".join(page_text + "\n" for page_text in pages)
+    elif file.type == DOCX_MIME:
+        text = "".join(iter_docx_paragraphs(file, max_xml_bytes)).strip()
+    return text
+
+# ---------------------- Extraction Cache ----------------------
+# Bump whenever extraction output changes so stale cache entries stop matching
+EXTRACTOR_VERSION = "1"
+
+class ExtractionCache:
+    """
+    Content-addressed cache of extracted resume text.
+    - key: sha256 of extractor version + MIME type + PDF page cap + file bytes
+      (text with pages that timed out is never cached, so the page timeout is not part of it)
+    - memory tier: LRU evicted by total size of the cached strings
+    - optional disk tier: SQLite file holding zlib-compressed text
+    The section index of each text (see resumentor.sections) is cached next to it in both tiers.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, path=None):
+        self.max_bytes = max_bytes
+        self.path = path
+        self._memory = BoundedLRU(max_bytes, sizeof=deep_sizeof)
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS extraction (key TEXT PRIMARY KEY, text BLOB NOT NULL)")
+            self._db.execute("CREATE TABLE IF NOT EXISTS sections (key TEXT PRIMARY KEY, data BLOB NOT NULL)")
+            self._db.commit()
+
+    @staticmethod
+    def key(data: bytes, file_type: str, max_pages=None) -> str:
+        max_pages = max_pages if file_type == PDF_MIME else None
+        digest = hashlib.sha256(f"{EXTRACTOR_VERSION}:{file_type}:{max_pages}:".encode())
+        digest.update(data)
+        return digest.hexdigest()
+
+    def get(self, key: str):
+        text = self._memory.get(key)
+        if text is not None or self._db is None:
+            return text
+        with self._lock:
+            row = self._db.execute("SELECT text FROM extraction WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        text = zlib.decompress(row[0]).decode("utf-8")
+        self._memory.put(key, text)
+        return text
+
+    def put(self, key: str, text: str):
+        self._memory.put(key, text)
+        if self._db is not None:
+            blob = zlib.compress(text.encode("utf-8"))
+            with self._lock:
+                self._db.execute("INSERT OR REPLACE INTO extraction (key, text) VALUES (?, ?)", (key, blob))
+                self._db.commit()
+
+    def sections(self, key: str, text: str):
+        # Section index of `text`, the extracted text cached under `key`; parsed on first use
+        from resumentor.sections import SECTIONS_VERSION, parse_sections, dump_sections, load_sections
+        if self.get(key) != text:
+            # Not the cached text (e.g. pages timed out): nothing to store it next to
+            return parse_sections(text)
+        sections_key = f"{key}:sections:{SECTIONS_VERSION}"
+        index = self._memory.get(sections_key)
+        if index is not None:
+            return index
+        if self._db is not None:
+            with self._lock:
+                row = self._db.execute("SELECT data FROM sections WHERE key = ?", (sections_key,)).fetchone()
+            if row is not None:
+                index = load_sections(zlib.decompress(row[0]))
+        if index is None:
+            index = parse_sections(text)
+            if self._db is not None:
+                blob = zlib.compress(dump_sections(index))
+                with self._lock:
+                    self._db.execute("INSERT OR REPLACE INTO sections (key, data) VALUES (?, ?)", (sections_key, blob))
+                    self._db.commit()
+        self._memory.put(sections_key, index)
+        return index
+
+    def __len__(self):
+        return len(self._memory)
+
+# Shared per process; set RESUMENTOR_CACHE_DB to a file path to keep entries across restarts
+extraction_cache = ExtractionCache(path=os.environ.get("RESUMENTOR_CACHE_DB"))
+
+def cached_extract_text(file, cache: ExtractionCache = extraction_cache, timed_out=None, **kwargs):
+    # kwargs go to extract_text; text with pages that timed out (listed in `timed_out`) is not cached
+    key = cache.key(_file_bytes(file), file.type, kwargs.get("max_pages"))
+    text = cache.get(key)
+    if text is None:
+        timed_out = [] if timed_out is None else timed_out
+        text = extract_text(file, timed_out=timed_out, **kwargs)
+        if not timed_out:
+            cache.put(key, text)
+    return text
+
+@traced()
+def clean_text(text: str) -> str:
+    return re.sub(r'\s+', ' ', (text or "").strip())
@@ -0,0 +1,211 @@
+"""
+Precomputed JD index: per-JD term counts, skill sets and suggestion flags.
+
+Built once (at startup for the sample JDs, or offline via `python -m resumentor build-jd-index`)
+so comparing a resume against an indexed JD only costs the resume-side work. Saved indexes are a
+directory of .npy arrays plus meta.json, loaded with memory-mapping.
+"""
+import os
+import json
+import functools
+from collections import namedtuple
+
+import numpy as np
+
+from resumentor.jds import sample_jds
+from resumentor.scoring import term_counts
+from resumentor.skills import skill_taxonomy
+from resumentor.suggestions import compute_jd_flags, JD_FLAG_NAMES
+from resumentor.tracing import traced
+
+INDEX_FORMAT_VERSION = 1
+
+JDEntry = namedtuple("JDEntry", ["title", "text", "counts", "skills", "flags"])
+
+class JDIndex:
+    """
+    Column-oriented store of M job descriptions.
+    - counts: CSR arrays (indptr/indices/data) of raw term counts over `vocabulary`
+    - skills: M × len(skill_names) boolean matrix
+    - flags: M × len(JD_FLAG_NAMES) boolean matrix
+    - texts: UTF-8 blob + offsets, so large libraries can stay on disk
+    """
+
+    def __init__(self, titles, vocabulary, indptr, indices, data, skill_names, skills, flags, text_blob, text_offsets):
+        self.titles = list(titles)
+        self.vocabulary = list(vocabulary)
+        self.indptr, self.indices, self.data = indptr, indices, data
+        self.skill_names = list(skill_names)
+        self.skills = skills
+        self.flags = flags
+        self.text_blob, self.text_offsets = text_blob, text_offsets
+        self._positions = {title: i for i, title in enumerate(self.titles)}
+        self._term_ids = None
+        self._idf = None
+        self._postings = None
+
+    @classmethod
+    def build(cls, jds: dict, taxonomy=skill_taxonomy):
+        titles = list(jds)
+        term_ids = {}
+        indptr, indices, data = [0], [], []
+        skills = np.zeros((len(titles), len(taxonomy)), dtype=bool)
+        flags = np.zeros((len(titles), len(JD_FLAG_NAMES)), dtype=bool)
+        blobs, offsets = [], [0]
+        for row, title in enumerate(titles):
+            text = jds[title]
+            for term, count in sorted(term_counts(text).items()):
+                indices.append(term_ids.setdefault(term, len(term_ids)))
+                data.append(count)
+            indptr.append(len(indices))
+            skills[row] = taxonomy.mask_in(text)
+            jd_flags = compute_jd_flags(text)
+            flags[row] = [jd_flags[name] for name in JD_FLAG_NAMES]
+            encoded = text.encode("utf-8")
+            blobs.append(encoded)
+            offsets.append(offsets[-1] + len(encoded))
+        return cls(
+            titles, list(term_ids),
+            np.asarray(indptr, dtype=np.int64), np.asarray(indices, dtype=np.int32), np.asarray(data, dtype=np.int32),
+            taxonomy.names, skills, flags,
+            np.frombuffer(b"".join(blobs), dtype=np.uint8), np.asarray(offsets, dtype=np.int64),
+        )
+
+    def __len__(self):
+        return len(self.titles)
+
+    def position(self, title_or_pos) -> int:
+        return title_or_pos if isinstance(title_or_pos, (int, np.integer)) else self._positions[title_or_pos]
+
+    def text(self, title_or_pos) -> str:
+        i = self.position(title_or_pos)
+        return bytes(self.text_blob[self.text_offsets[i]:self.text_offsets[i + 1]]).decode("utf-8")
+
+    def term_counts(self, title_or_pos) -> dict:
+        i = self.position(title_or_pos)
+        lo, hi = self.indptr[i], self.indptr[i + 1]
+        return {self.vocabulary[t]: int(c) for t, c in zip(self.indices[lo:hi], self.data[lo:hi])}
+
+    def skills_of(self, title_or_pos) -> set:
+        return {self.skill_names[j] for j in np.flatnonzero(self.skills[self.position(title_or_pos)])}
+
+    def flags_of(self, title_or_pos) -> dict:
+        row = self.flags[self.position(title_or_pos)]
+        return {name: bool(row[j]) for j, name in enumerate(JD_FLAG_NAMES)}
+
+    def entry(self, title_or_pos) -> JDEntry:
+        i = self.position(title_or_pos)
+        return JDEntry(self.titles[i], self.text(i), self.term_counts(i), self.skills_of(i), self.flags_of(i))
+
+    # ---------------------- Reverse Search ----------------------
+    def _build_postings(self):
+        # Library-wide smooth IDF + L2-normalized TF-IDF rows, stored column-major so each
+        # term's postings (JDs containing it) are one contiguous slice
+        from scipy.sparse import csr_matrix, diags
+        from sklearn.preprocessing import normalize
+        n_docs, n_terms = len(self), len(self.vocabulary)
+        counts = csr_matrix((np.asarray(self.data, dtype=np.float32), self.indices, self.indptr), shape=(n_docs, n_terms))
+        df = np.bincount(self.indices, minlength=n_terms)
+        self._idf = (np.log((1 + n_docs) / (1 + df)) + 1).astype(np.float32)
+        self._postings = normalize(counts @ diags(self._idf)).tocsc()
+        self._term_ids = {term: i for i, term in enumerate(self.vocabulary)}
+
+    @traced("jd_top_k", size_arg=1)
+    def top_k(self, resume_text: str, k: int = 10):
+        """
+        Best-fitting JDs for one resume: [(title, score), ...] best first, at most k and only JDs scoring above 0.
+        Only the postings of the resume's own terms are touched, so cost tracks resume length
+        rather than library size. Scores are TF-IDF cosine (%) with IDF fitted on the library.
+        """
+        if self._postings is None:
+            self._build_postings()
+        ids, weights = [], []
+        for term, count in term_counts(resume_text).items():
+            j = self._term_ids.get(term)
+            if j is not None:
+                ids.append(j)
+                weights.append(count * self._idf[j])
+        if not ids or k <= 0:
+            return []
+        weights = np.asarray(weights, dtype=np.float32)
+        scores = self._postings[:, ids] @ (weights / np.linalg.norm(weights))
+        # JDs sharing no term with the resume are not a fit, however few others match
+        matched = np.flatnonzero(scores > 0)
+        k = min(k, len(matched))
+        if not k:
+            return []
+        best = matched[np.argpartition(-scores[matched], k - 1)[:k]]
+        best = best[np.argsort(-scores[best], kind="stable")]
+        return [(self.titles[i], round(float(scores[i]) * 100, 2)) for i in best]
+
+    # ---------------------- Persistence ----------------------
+    _ARRAYS = ("indptr", "indices", "data", "skills", "flags", "text_offsets")
+
+    def save(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        for name in self._ARRAYS:
+            np.save(os.path.join(directory, f"{name}.npy"), np.asarray(getattr(self, name)))
+        with open(os.path.join(directory, "texts.bin"), "wb") as fh:
+            fh.write(np.asarray(self.text_blob).tobytes())
+        meta = {
+            "format_version": INDEX_FORMAT_VERSION,
+            "titles": self.titles,
+            "vocabulary": self.vocabulary,
+            "skill_names": self.skill_names,
+            "flag_names": list(JD_FLAG_NAMES),
+        }
+        with open(os.path.join(directory, "meta.json"), "w", encoding="utf-8") as fh:
+            json.dump(meta, fh, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, directory, mmap: bool = True):
+        with open(os.path.join(directory, "meta.json"), encoding="utf-8") as fh:
+            meta = json.load(fh)
+        if meta.get("format_version") != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported JD index format: {meta.get('format_version')!r}")
+        if tuple(meta["flag_names"]) != JD_FLAG_NAMES:
+            raise ValueError("JD index was built with different suggestion flags; rebuild it.")
+        mode = "r" if mmap else None
+        arrays = {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode=mode) for name in cls._ARRAYS}
+        texts_path = os.path.join(directory, "texts.bin")
+        if os.path.getsize(texts_path) == 0:
+            text_blob = np.zeros(0, dtype=np.uint8)
+        elif mmap:
+            text_blob = np.memmap(texts_path, dtype=np.uint8, mode="r")
+        else:
+            text_blob = np.fromfile(texts_path, dtype=np.uint8)
+        return cls(meta["titles"], meta["vocabulary"], arrays["indptr"], arrays["indices"], arrays["data"],
+                   meta["skill_names"], arrays["skills"], arrays["flags"], text_blob, arrays["text_offsets"])
+
+def load_jd_library(path) -> dict:
+    """
+    Read a JD library into {title: text}.
+    - .json: {"title": "text", ...}
+    - .jsonl: one {"title": ..., "text": ...} object per line
+    - directory: every .txt file, titled by file name
+    """
+    if os.path.isdir(path):
+        jds = {}
+        for name in sorted(os.listdir(path)):
+            if name.lower().endswith(".txt"):
+                with open(os.path.join(path, name), encoding="utf-8") as fh:
+                    jds[os.path.splitext(name)[0]] = fh.read()
+        return jds
+    with open(path, encoding="utf-8") as fh:
+        if path.lower().endswith(".jsonl"):
+            rows = (json.loads(line) for line in fh if line.strip())
+            return {row["title"]: row["text"] for row in rows}
+        return dict(json.load(fh))
+
+@functools.lru_cache(maxsize=1)
+def sample_jd_index() -> JDIndex:
+    # Compiled on first use, then shared by every session in the process
+    return JDIndex.build(sample_jds)
+
+# Set to a directory written by `python -m resumentor build-jd-index` to search your own JD library
+JD_INDEX_ENV = "RESUMENTOR_JD_INDEX"
+
+@functools.lru_cache(maxsize=1)
+def library_jd_index() -> JDIndex:
+    path = os.environ.get(JD_INDEX_ENV)
+    return JDIndex.load(path) if path else sample_jd_index()
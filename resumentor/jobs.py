@@ -0,0 +1,177 @@
+"""
+Background analysis jobs: a pluggable queue backend feeding a process pool.
+
+The Streamlit page submits (resume bytes, JD) and polls for the result, so a slow PDF never blocks
+a script run. Identical resume+JD pairs share one job, and a full queue raises QueueFull.
+"""
+import os
+import time
+import queue
+import hashlib
+import functools
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from resumentor.tracing import tracer
+
+# Worker processes for the app's job manager; 0 analyzes inline in the Streamlit session instead
+JOB_WORKERS_ENV = "RESUMENTOR_JOB_WORKERS"
+# Jobs allowed to wait for a worker before submissions are rejected
+JOB_QUEUE_ENV = "RESUMENTOR_JOB_QUEUE"
+
+class QueueFull(Exception):
+    pass
+
+def run_job(payload):
+    # Executed in a worker process: -> (analysis, stage records, profile report or None) for the app's tracer
+    from resumentor.extract import BytesUpload, MAX_PDF_PAGES, PDF_PAGE_TIMEOUT
+    from resumentor.jd_index import sample_jd_index
+    from resumentor.pipeline import analyze_resume
+    data, file_type, job_desc, jd_title, profile = payload
+    with tracer.capture(profile) as captured:
+        jd_entry = sample_jd_index().entry(jd_title) if jd_title else None
+        result = analyze_resume(BytesUpload(data, file_type), job_desc, jd_entry, max_pages=MAX_PDF_PAGES,
+                                page_timeout=PDF_PAGE_TIMEOUT)
+    return result, captured["stages"], captured["profile"]
+
+class InMemoryJobBackend:
+    """
+    Default queue backend: a bounded FIFO of pending jobs plus job records.
+    Any object with the same methods (enqueue/dequeue/get/update/queued), e.g. one backed by Redis,
+    can be handed to JobManager instead.
+    """
+
+    def __init__(self, max_pending: int = 32, max_finished: int = 256):
+        self.max_finished = max_finished
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._records = OrderedDict()
+        self._lock = threading.Lock()
+
+    def enqueue(self, job_id: str, payload):
+        with self._lock:
+            self._records[job_id] = {"id": job_id, "status": "queued", "submitted_at": time.time(),
+                                     "started_at": None, "finished_at": None, "result": None, "stages": None,
+                                     "profile": None, "error": None}
+            self._records.move_to_end(job_id)
+        try:
+            self._queue.put_nowait((job_id, payload))
+        except queue.Full:
+            with self._lock:
+                self._records.pop(job_id, None)
+            raise QueueFull(f"{self._queue.maxsize} jobs already waiting") from None
+
+    def dequeue(self, timeout: float):
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def get(self, job_id: str):
+        with self._lock:
+            record = self._records.get(job_id)
+            return dict(record) if record else None
+
+    def update(self, job_id: str, **fields):
+        with self._lock:
+            if job_id not in self._records:
+                return
+            self._records[job_id].update(fields)
+            if fields.get("status") in ("done", "failed"):
+                self._records.move_to_end(job_id)
+                finished = [k for k, r in self._records.items() if r["status"] in ("done", "failed")]
+                for stale in finished[:max(0, len(finished) - self.max_finished)]:
+                    del self._records[stale]
+
+    def queued(self) -> int:
+        return self._queue.qsize()
+
+class JobManager:
+    def __init__(self, backend=None, workers: int = None):
+        self.backend = backend or InMemoryJobBackend()
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(self.workers)
+        # Jobs are only handed to the pool when a worker is free, so waiting happens in the backend
+        self._slots = threading.BoundedSemaphore(self.workers)
+        self._submit_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._dispatcher = threading.Thread(target=self._dispatch, name="resumentor-jobs", daemon=True)
+        self._dispatcher.start()
+
+    @staticmethod
+    def job_id(data: bytes, job_desc: str) -> str:
+        digest = hashlib.sha256(hashlib.sha256(data).digest())
+        digest.update(job_desc.encode("utf-8"))
+        return digest.hexdigest()
+
+    def submit(self, data: bytes, file_type: str, job_desc: str, jd_title: str = None, retry: bool = False,
+               profile=None) -> str:
+        # Returns the job id; a pair that is queued, running or done is not submitted again,
+        # and a failed one only with retry=True (its record keeps the error until then).
+        # profile: engine for the worker's profiler, as in tracer.run (None: $RESUMENTOR_PROFILE)
+        job_id = self.job_id(data, job_desc)
+        with self._submit_lock:
+            record = self.backend.get(job_id)
+            if record is None or (retry and record["status"] == "failed"):
+                self.backend.enqueue(job_id, (data, file_type, job_desc, jd_title, profile))
+        return job_id
+
+    def status(self, job_id: str):
+        return self.backend.get(job_id)
+
+    def _dispatch(self):
+        while not self._stop.is_set():
+            # Time out on both waits so shutdown() can stop this thread
+            if not self._slots.acquire(timeout=0.5):
+                continue
+            item = self.backend.dequeue(timeout=0.5)
+            if item is None:
+                self._slots.release()
+                continue
+            job_id, payload = item
+            self.backend.update(job_id, status="running", started_at=time.time())
+            try:
+                future = self._submit(payload)
+            except RuntimeError as e:
+                # The pool is shut down, or broke again right away
+                self.backend.update(job_id, status="failed", error=f"{type(e).__name__}: {e}", finished_at=time.time())
+                self._slots.release()
+                continue
+            future.add_done_callback(functools.partial(self._finish, job_id))
+
+    def _submit(self, payload):
+        try:
+            return self._executor.submit(run_job, payload)
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM-killed); start a fresh pool for the jobs behind this one
+            self._executor = ProcessPoolExecutor(self.workers)
+            return self._executor.submit(run_job, payload)
+
+    def _finish(self, job_id: str, future):
+        try:
+            result, stages, profile = future.result()
+            # Counted once per job here; pages record the stages as a run when they show the result
+            tracer.merge(stages)
+            self.backend.update(job_id, status="done", result=result, stages=stages, profile=profile,
+                                finished_at=time.time())
+        except Exception as e:
+            self.backend.update(job_id, status="failed", error=f"{type(e).__name__}: {e}", finished_at=time.time())
+        finally:
+            self._slots.release()
+
+    def shutdown(self, timeout: float = 5):
+        # Stop the dispatcher first, so it never hands a job to a pool that is shutting down
+        self._stop.set()
+        self._dispatcher.join(timeout)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+@functools.lru_cache(maxsize=1)
+def default_job_manager():
+    # Shared by every session in the process; None when RESUMENTOR_JOB_WORKERS=0
+    value = os.environ.get(JOB_WORKERS_ENV, "").strip()
+    workers = int(value) if value else None
+    if workers is not None and workers <= 0:
+        return None
+    max_pending = int(os.environ.get(JOB_QUEUE_ENV, "32"))
+    return JobManager(InMemoryJobBackend(max_pending=max_pending), workers=workers)
@@ -0,0 +1,152 @@
+"""
+One resume against one JD: extract -> sections + clean -> score -> skills -> suggestions.
+
+Analyses are memoized per process. Resume-side artifacts (cleaned text, term counts, section index, skill spans) and
+JD-side artifacts are cached separately, so a new JD for an already-seen resume only redoes the JD work.
+"""
+import os
+import hashlib
+import functools
+from collections import namedtuple
+
+from resumentor.cache import BoundedLRU, deep_sizeof
+from resumentor.extract import ExtractionCache, extraction_cache, cached_extract_text, clean_text, _file_bytes
+from resumentor.scoring import SCORER_VERSION, term_counts, pair_score
+from resumentor.sections import parse_sections, section_score
+from resumentor.skills import skill_taxonomy, highlight_spans
+from resumentor.suggestions import compute_jd_flags, compute_resume_flags, generate_ai_suggestions
+from resumentor.tracing import tracer, traced
+
+# Memory budget (MiB) and lifetime (seconds) of memoized analyses
+ANALYSIS_CACHE_MB_ENV = "RESUMENTOR_ANALYSIS_CACHE_MB"
+ANALYSIS_TTL_ENV = "RESUMENTOR_ANALYSIS_TTL"
+
+# `skills` fields are boolean masks over the taxonomy's skill ids
+ResumeArtifacts = namedtuple("ResumeArtifacts", ["text", "counts", "sections", "spans", "skills", "flags"])
+JDArtifacts = namedtuple("JDArtifacts", ["counts", "skills", "flags"])
+
+@traced()
+def resume_artifacts(resume_text: str, taxonomy=skill_taxonomy, sections=None) -> ResumeArtifacts:
+    # sections: SectionIndex of the raw text; parsed from the cleaned text (no line structure) if omitted
+    spans = taxonomy.matcher.find(resume_text)
+    sections = parse_sections(resume_text) if sections is None else sections
+    return ResumeArtifacts(resume_text, term_counts(resume_text), sections, spans,
+                           taxonomy.mask(s.skill for s in spans), compute_resume_flags(resume_text))
+
+@traced()
+def jd_artifacts(job_desc: str, jd_entry=None, taxonomy=skill_taxonomy) -> JDArtifacts:
+    # jd_entry: a JDEntry from a JD index; skips tokenizing/scanning the JD
+    if jd_entry is not None:
+        return JDArtifacts(jd_entry.counts, taxonomy.mask(jd_entry.skills), jd_entry.flags)
+    return JDArtifacts(term_counts(job_desc), taxonomy.mask_in(job_desc), compute_jd_flags(job_desc))
+
+def combine(resume: ResumeArtifacts, jd: JDArtifacts, job_desc: str, taxonomy=skill_taxonomy) -> dict:
+    # The JD-dependent part of an analysis
+    with tracer.span("match_score", len(resume.text)):
+        score = pair_score(resume.counts, jd.counts)
+    with tracer.span("section_score", len(resume.text)):
+        weighted = section_score(resume.sections, jd.counts)
+    with tracer.span("highlight_missing_skills", len(resume.text)):
+        # A resume's skills imply their parents (postgresql covers a JD's sql)
+        has = taxonomy.with_ancestors(resume.skills)
+        matched = taxonomy.names_of(jd.skills & has)
+        missing = taxonomy.names_of(jd.skills & ~has)
+    suggestions = generate_ai_suggestions(score, matched, missing, job_desc, resume.text,
+                                          jd_flags=jd.flags, resume_flags=resume.flags)
+    with tracer.span("highlight_resume_text", len(resume.text)):
+        wanted = set(matched)
+        highlighted = highlight_spans(resume.text, [s for s in resume.spans if s.skill in wanted])
+    return {"resume_text": resume.text, "score": score, "section_score": weighted, "matched": matched,
+            "missing": missing, "suggestions": suggestions, "highlighted": highlighted, "resume": resume}
+
+def _result_size(result: dict) -> int:
+    # Resume text and artifacts are shared with (and budgeted by) the resume tier
+    return deep_sizeof({k: v for k, v in result.items() if k not in ("resume_text", "resume")})
+
+class AnalysisCache:
+    """
+    Memoized analyses, keyed by (resume hash, JD hash, skill-dictionary version, scorer version).
+    - resumes: ResumeArtifacts per resume
+    - jds: JDArtifacts per JD text
+    - results: finished analyses per resume/JD pair
+    Every tier is an LRU bounded by its share of `max_bytes`; entries also expire after `ttl` seconds.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, ttl: float = 1800, taxonomy=skill_taxonomy):
+        self.taxonomy = taxonomy
+        self.resumes = BoundedLRU(max_bytes // 2, ttl, sizeof=deep_sizeof)
+        self.jds = BoundedLRU(max_bytes // 4, ttl, sizeof=deep_sizeof)
+        self.results = BoundedLRU(max_bytes // 4, ttl, sizeof=_result_size)
+
+    def resume_key(self, data: bytes, file_type: str, max_pages=None) -> str:
+        return f"{ExtractionCache.key(data, file_type, max_pages)}:{self.taxonomy.matcher.version}:{SCORER_VERSION}"
+
+    def jd_key(self, job_desc: str) -> str:
+        digest = hashlib.sha256(job_desc.encode("utf-8")).hexdigest()
+        return f"{digest}:{self.taxonomy.matcher.version}:{SCORER_VERSION}"
+
+    def analyze(self, resume_key: str, job_desc: str, jd_entry=None, load_text=None):
+        """
+        Analysis of one resume/JD pair, computing only what isn't cached yet.
+        - load_text: returns (cleaned resume text, SectionIndex of the raw text, indices of PDF pages that timed out);
+          called on a resume-side miss (without it a resume-side miss returns None)
+        An analysis of text with pages missing is returned (see its "timed_out_pages") but not memoized.
+        """
+        jd_key = self.jd_key(job_desc)
+        result = self.results.get((resume_key, jd_key))
+        if result is not None:
+            return result
+        resume = self.resumes.get(resume_key)
+        timed_out = []
+        if resume is None:
+            if load_text is None:
+                return None
+            resume_text, sections, timed_out = load_text()
+            resume = resume_artifacts(resume_text, self.taxonomy, sections)
+            if not timed_out:
+                self.resumes.put(resume_key, resume)
+        jd = self.jds.get(jd_key)
+        if jd is None:
+            jd = jd_artifacts(job_desc, jd_entry, self.taxonomy)
+            self.jds.put(jd_key, jd)
+        result = combine(resume, jd, job_desc, self.taxonomy)
+        result["timed_out_pages"] = timed_out
+        if not timed_out:
+            self.results.put((resume_key, jd_key), result)
+        return result
+
+    def remember(self, resume_key: str, job_desc: str, result: dict):
+        # Adopt an analysis computed elsewhere (e.g. in a job worker) so later JD changes reuse its resume side
+        if result.get("timed_out_pages"):
+            return
+        self.resumes.put(resume_key, result["resume"])
+        self.results.put((resume_key, self.jd_key(job_desc)), result)
+
+# Shared per process
+analysis_cache = AnalysisCache(
+    max_bytes=int(float(os.environ.get(ANALYSIS_CACHE_MB_ENV, "64")) * 1024 * 1024),
+    ttl=float(os.environ.get(ANALYSIS_TTL_ENV, "1800")),
+)
+
+def _load_resume(upload, extract, extraction: ExtractionCache, max_pages):
+    # Cleaned text plus the section index of the raw text, cached with the extracted text
+    timed_out = []
+    raw = extract(upload, timed_out=timed_out)
+    sections = extraction.sections(extraction.key(_file_bytes(upload), upload.type, max_pages), raw)
+    return clean_text(raw), sections, timed_out
+
+def analyze_resume(upload, job_desc: str, jd_entry=None, extract=None, cache=None, max_pages=None,
+                   page_timeout=None) -> dict:
+    """
+    Full analysis of one uploaded resume (anything with `.type` + file-like bytes).
+    - jd_entry: a JDEntry from a JD index; skips tokenizing/scanning the JD
+    - extract: callable(upload, timed_out=list) turning the upload into raw text, reading at most
+      max_pages PDF pages (default: cached extraction with max_pages and page_timeout)
+    - cache: AnalysisCache to memoize into (default: the shared analysis_cache)
+    """
+    cache = analysis_cache if cache is None else cache
+    if extract is None:
+        extract = functools.partial(cached_extract_text, max_pages=max_pages, page_timeout=page_timeout)
+    key = cache.resume_key(_file_bytes(upload), upload.type, max_pages)
+    return cache.analyze(key, job_desc, jd_entry,
+                         load_text=lambda: _load_resume(upload, extract, extraction_cache, max_pages))
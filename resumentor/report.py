@@ -0,0 +1,151 @@
+"""
+Reports: the per-resume text report and streaming exports of many analyses.
+
+Exports consume an iterable of result dicts (as produced by `python -m resumentor score`) one row at a
+time, so thousands of candidates never have to be held in memory at once.
+"""
+import io
+import os
+import csv
+import json
+import base64
+import zipfile
+import tempfile
+from itertools import islice
+
+REPORT_FIELDS = ["file", "score", "matched", "missing", "suggestions", "error"]
+EXPORT_FORMATS = ("jsonl", "csv", "parquet", "zip")
+# Separator for list fields in CSV cells
+CSV_LIST_SEPARATOR = "; "
+
+def render_text_report(score, matched, missing) -> str:
+    return f"""
+Resume Match Report
+
+ATS Match Score: {score}%
+
+Matched Skills:
+{', '.join(matched) if matched else '-'}
+
+Missing Skills:
+{', '.join(missing) if missing else '-'}
+
+Tips:
+- Tailor your resume bullet points to the JD.
+- Use action verbs and quantify impact (%, ₹, time saved).
+- Mirror important keywords naturally in relevant sections.
+"""
+
+def generate_text_report(score, matched, missing):
+    # Inline data: URI link; prefer serving render_text_report() bytes through st.download_button
+    b64 = base64.b64encode(render_text_report(score, matched, missing).encode()).decode()
+    return f'<a class="download-link" href="data:file/txt;base64,{b64}" download="resume_report.txt">📥 Download Report</a>'
+
+# ---------------------- Bulk Export ----------------------
+def report_row(result: dict) -> dict:
+    # One result dict -> exactly REPORT_FIELDS (lists stay lists; absent fields become None)
+    row = {field: result.get(field) for field in REPORT_FIELDS}
+    for field in ("matched", "missing", "suggestions"):
+        if row[field] is None and row["error"] is None:
+            row[field] = []
+    return row
+
+def _csv_cell(value):
+    return CSV_LIST_SEPARATOR.join(value) if isinstance(value, list) else value
+
+def write_jsonl(results, fh) -> int:
+    n = 0
+    for n, result in enumerate(results, start=1):
+        fh.write(json.dumps(report_row(result), ensure_ascii=False) + "\n")
+    return n
+
+def write_csv(results, fh) -> int:
+    writer = csv.DictWriter(fh, fieldnames=REPORT_FIELDS)
+    writer.writeheader()
+    n = 0
+    for n, result in enumerate(results, start=1):
+        writer.writerow({k: _csv_cell(v) for k, v in report_row(result).items()})
+    return n
+
+def write_parquet(results, path, batch_size: int = 1024) -> int:
+    # Written one row group per `batch_size` results; needs pyarrow
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet export needs pyarrow: pip install pyarrow") from None
+    strings = pa.list_(pa.string())
+    schema = pa.schema([("file", pa.string()), ("score", pa.float64()), ("matched", strings),
+                        ("missing", strings), ("suggestions", strings), ("error", pa.string())])
+    results = iter(results)
+    n = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        while True:
+            batch = [report_row(result) for result in islice(results, batch_size)]
+            if not batch:
+                break
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            n += len(batch)
+    return n
+
+def _report_name(i: int, path) -> str:
+    stem = os.path.splitext(os.path.basename(path or ""))[0] or "resume"
+    return f"reports/{i:05d}_{stem}.txt"
+
+def write_bundle(results, fh) -> int:
+    """
+    Zip of one text report per candidate plus summary.csv. Each report is compressed into the archive
+    as soon as it is rendered; the summary is spooled to a temp file and appended at the end.
+    """
+    n = 0
+    with zipfile.ZipFile(fh, "w", compression=zipfile.ZIP_DEFLATED) as zf, \
+            tempfile.SpooledTemporaryFile(max_size=1024 * 1024, mode="w+", newline="", encoding="utf-8") as summary:
+        writer = csv.DictWriter(summary, fieldnames=REPORT_FIELDS)
+        writer.writeheader()
+        for n, result in enumerate(results, start=1):
+            row = report_row(result)
+            if row["error"] is None:
+                text = render_text_report(row["score"], row["matched"], row["missing"])
+            else:
+                text = f"\nCould not analyze {row['file']}:\n{row['error']}\n"
+            zf.writestr(_report_name(n, row["file"]), text)
+            writer.writerow({k: _csv_cell(v) for k, v in row.items()})
+        summary.seek(0)
+        with zf.open("summary.csv", "w") as out:
+            for chunk in iter(lambda: summary.read(64 * 1024), ""):
+                out.write(chunk.encode("utf-8"))
+    return n
+
+def export_format(path, fmt: str = None) -> str:
+    # Explicit format, else the output file's extension, else JSONL
+    if fmt:
+        return fmt
+    suffix = os.path.splitext(str(path))[1].lower().lstrip(".")
+    return suffix if suffix in EXPORT_FORMATS else "jsonl"
+
+def export_results(results, out, fmt: str = None) -> int:
+    """
+    Stream results to `out` (a path, or an open file: text for jsonl/csv, binary for parquet/zip).
+    Returns the number of rows written.
+    """
+    fmt = export_format(out if isinstance(out, (str, os.PathLike)) else "", fmt)
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format {fmt!r}; expected one of {', '.join(EXPORT_FORMATS)}")
+    if fmt == "parquet":
+        return write_parquet(results, out)
+    if fmt == "zip":
+        return write_bundle(results, out)
+    if not isinstance(out, (str, os.PathLike)):
+        return (write_csv if fmt == "csv" else write_jsonl)(results, out)
+    with open(out, "w", encoding="utf-8", newline="" if fmt == "csv" else None) as fh:
+        return (write_csv if fmt == "csv" else write_jsonl)(results, fh)
+
+def export_bytes(results, fmt: str) -> bytes:
+    # Whole export in memory, for st.download_button
+    if fmt in ("parquet", "zip"):
+        buffer = io.BytesIO()
+        export_results(results, buffer, fmt)
+        return buffer.getvalue()
+    buffer = io.StringIO(newline="")
+    export_results(results, buffer, fmt)
+    return buffer.getvalue().encode("utf-8")
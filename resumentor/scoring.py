@@ -0,0 +1,117 @@
+"""TF-IDF match scoring: single resume/JD pairs and corpus-fitted batches."""
+import os
+import re
+import math
+import pickle
+import functools
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from resumentor.tracing import traced
+
+# sklearn/numpy are imported where used so importing the package stays cheap
+if TYPE_CHECKING:
+    import numpy as np
+
+# Bump whenever scores change for the same inputs so memoized analyses stop matching
+SCORER_VERSION = "1"
+# TfidfVectorizer's default analyzer: lowercase, then tokens of 2+ word characters
+_WORD_RE = re.compile(r"(?u)\b\w\w+\b")
+# Smooth IDF of a term found in only one of two documents: ln((1 + 2) / (1 + 1)) + 1
+_ONE_DOC_IDF = math.log(1.5) + 1.0
+
+@traced()
+def match_score(resume_text: str, job_desc: str) -> float:
+    # Simple TF-IDF cosine similarity of full texts
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+    vectorizer = TfidfVectorizer()
+    vectors = vectorizer.fit_transform([resume_text, job_desc])
+    similarity = cosine_similarity(vectors[0:1], vectors[1:2])[0][0]
+    return round(float(similarity) * 100, 2)
+
+def term_counts(text: str) -> Counter:
+    return Counter(_WORD_RE.findall((text or "").lower()))
+
+def pair_score(resume_counts, jd_counts) -> float:
+    """
+    match_score computed from precomputed term counts (see term_counts), without sklearn.
+    With two documents, shared terms get IDF 1 and all other terms get ln(1.5) + 1.
+    """
+    dot = sum(count * jd_counts[term] for term, count in resume_counts.items() if term in jd_counts)
+    if not dot:
+        return 0.0
+    resume_norm = math.sqrt(sum((c if t in jd_counts else c * _ONE_DOC_IDF) ** 2 for t, c in resume_counts.items()))
+    jd_norm = math.sqrt(sum((c if t in resume_counts else c * _ONE_DOC_IDF) ** 2 for t, c in jd_counts.items()))
+    return round(dot / (resume_norm * jd_norm) * 100, 2)
+
+# ---------------------- Batch Scoring ----------------------
+class BatchScorer:
+    """
+    TF-IDF scorer that learns vocabulary + IDF once and reuses it for many documents.
+    - fit() on a corpus (or load() a previously saved reference corpus fit)
+    - score_matrix() turns N resumes and M JDs into an N×M similarity matrix in one call
+    - top_k() ranks resumes per JD
+    """
+
+    def __init__(self, **vectorizer_kwargs):
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        self.vectorizer = TfidfVectorizer(**vectorizer_kwargs)
+        self.fitted = False
+
+    def fit(self, corpus):
+        self.vectorizer.fit(corpus)
+        self.fitted = True
+        return self
+
+    def transform(self, texts):
+        if not self.fitted:
+            raise RuntimeError("BatchScorer is not fitted; call fit() or load() first.")
+        return self.vectorizer.transform(texts)
+
+    def score_matrix(self, resumes, job_descs) -> "np.ndarray":
+        # Scores are percentages like match_score; rows = resumes, columns = JDs
+        import numpy as np
+        from sklearn.metrics.pairwise import cosine_similarity
+        resumes, job_descs = list(resumes), list(job_descs)
+        if not self.fitted:
+            try:
+                self.fit(resumes + job_descs)
+            except ValueError:
+                # Not a single token in any document
+                return np.zeros((len(resumes), len(job_descs)))
+        similarity = cosine_similarity(self.transform(resumes), self.transform(job_descs))
+        return np.round(similarity * 100, 2)
+
+    def top_k(self, resumes, job_descs, k: int = 10):
+        # For every JD: [(resume_index, score), ...] best first
+        import numpy as np
+        scores = self.score_matrix(resumes, job_descs)
+        k = min(k, scores.shape[0])
+        ranking = []
+        for col in scores.T:
+            idx = np.argpartition(-col, k - 1)[:k] if k else np.array([], dtype=int)
+            idx = idx[np.argsort(-col[idx], kind="stable")]
+            ranking.append([(int(i), float(col[i])) for i in idx])
+        return ranking
+
+    def save(self, path):
+        with open(path, "wb") as fh:
+            pickle.dump(self.vectorizer, fh)
+
+    @classmethod
+    def load(cls, path):
+        scorer = cls()
+        with open(path, "rb") as fh:
+            scorer.vectorizer = pickle.load(fh)
+        scorer.fitted = True
+        return scorer
+
+# Set to a file written by `python -m resumentor fit-scorer` to rank pools against a saved reference corpus
+SCORER_ENV = "RESUMENTOR_SCORER"
+
+@functools.lru_cache(maxsize=1)
+def reference_scorer():
+    # The saved reference BatchScorer, or None (pools are then scored on their own vocabulary + IDF)
+    path = os.environ.get(SCORER_ENV)
+    return BatchScorer.load(path) if path else None
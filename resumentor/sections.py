@@ -0,0 +1,107 @@
+"""
+Section-aware resume parsing and section-weighted scoring.
+
+Headings (Experience, Projects, Skills, Education, Certifications, and common others) are found in the raw
+extracted text, before clean_text folds it onto one line. The resume is reduced to a term × section count
+matrix, so weighting sections for a JD is a vector product instead of a re-parse.
+"""
+import re
+import json
+from collections import Counter, namedtuple
+
+import numpy as np
+
+from resumentor.scoring import _WORD_RE, pair_score
+from resumentor.tracing import traced
+
+# Bump whenever parse_sections output changes so cached section indexes stop matching
+SECTIONS_VERSION = "1"
+# Section ids are positions in this tuple; "other" holds the header (name, contact) and unrecognised sections
+SECTION_NAMES = ("other", "experience", "projects", "skills", "education", "certifications")
+SECTION_HEADINGS = {
+    "experience": ["experience", "work experience", "professional experience", "relevant experience",
+                   "employment", "employment history", "work history", "career history", "internships",
+                   "internship", "internship experience"],
+    "projects": ["projects", "project", "personal projects", "academic projects", "key projects",
+                 "selected projects", "project experience"],
+    "skills": ["skills", "technical skills", "key skills", "core skills", "skill set", "skillset", "skills & tools",
+               "skills and tools", "tools", "technologies", "tech stack", "core competencies", "competencies"],
+    "education": ["education", "academic background", "academics", "qualifications", "educational qualifications",
+                  "education & training", "education and training"],
+    "certifications": ["certifications", "certification", "certificates", "licenses & certifications",
+                       "licenses and certifications", "courses", "training"],
+    # Headings that end the previous section without starting a scored one
+    "other": ["summary", "professional summary", "profile", "objective", "career objective", "about me",
+              "hobbies", "interests", "hobbies & interests", "hobbies and interests", "languages", "achievements",
+              "awards", "honors", "publications", "references", "volunteering", "volunteer experience",
+              "extracurricular activities", "activities", "personal details", "contact", "declaration", "strengths"],
+}
+# Relative weight of a term by the section it appears in
+DEFAULT_SECTION_WEIGHTS = {"skills": 1.5, "experience": 1.25, "projects": 1.25, "certifications": 1.0,
+                           "education": 0.75, "other": 0.5}
+
+_SECTION_OF = {heading: SECTION_NAMES.index(section)
+               for section, headings in SECTION_HEADINGS.items() for heading in headings}
+# A heading owns its line: optional bullet/numbering, the heading, then end of line or ":" / " - " / " | "
+_HEADING_RE = re.compile(
+    r"^[ \t•*#>·▪◦●\-\d.)]*("
+    + "|".join(re.escape(h).replace(r"\ ", r"[ \t]+") for h in sorted(_SECTION_OF, key=len, reverse=True))
+    + r")[ \t]*(?::|[\-–—|][ \t]|$)",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# - terms: sorted vocabulary
+# - counts: len(SECTION_NAMES) × len(terms) term counts
+# - spans: (section name, start, end) character ranges of the parsed text, in order
+SectionIndex = namedtuple("SectionIndex", ["terms", "counts", "spans"])
+
+@traced()
+def parse_sections(text: str) -> SectionIndex:
+    # Raw extract_text output (newlines intact); heading words count toward the section they open
+    text = text or ""
+    bounds = [(0, 0)]
+    for match in _HEADING_RE.finditer(text):
+        bounds.append((match.start(), _SECTION_OF[" ".join(match.group(1).lower().split())]))
+    bounds.append((len(text), None))
+    per_section = [Counter() for _ in SECTION_NAMES]
+    spans = []
+    for (start, section), (end, _) in zip(bounds, bounds[1:]):
+        tokens = _WORD_RE.findall(text[start:end].lower())
+        if tokens:
+            per_section[section].update(tokens)
+            spans.append((SECTION_NAMES[section], start, end))
+    terms = sorted(set().union(*per_section))
+    column = {term: j for j, term in enumerate(terms)}
+    counts = np.zeros((len(SECTION_NAMES), len(terms)), dtype=np.uint32)
+    for i, section_counts in enumerate(per_section):
+        for term, count in section_counts.items():
+            counts[i, column[term]] = count
+    return SectionIndex(tuple(terms), counts, tuple(spans))
+
+def section_lengths(index: SectionIndex) -> dict:
+    # {section: token count} for the sections present in the resume
+    totals = index.counts.sum(axis=1).tolist()
+    return {name: total for name, total in zip(SECTION_NAMES, totals) if total}
+
+def weighted_counts(index: SectionIndex, weights=None) -> dict:
+    # {term: Σ section weight × count}; sections missing from `weights` weigh 1
+    weights = DEFAULT_SECTION_WEIGHTS if weights is None else weights
+    w = np.array([weights.get(name, 1.0) for name in SECTION_NAMES])
+    totals = (w @ index.counts).tolist()
+    return {term: total for term, total in zip(index.terms, totals) if total}
+
+def section_score(index: SectionIndex, jd_counts, weights=None) -> float:
+    """
+    match_score with every resume term weighted by its section (see DEFAULT_SECTION_WEIGHTS).
+    Equal weights give exactly pair_score of the whole resume.
+    """
+    return pair_score(weighted_counts(index, weights), jd_counts)
+
+# ---------------------- Serialization ----------------------
+def dump_sections(index: SectionIndex) -> bytes:
+    return json.dumps({"terms": index.terms, "counts": index.counts.tolist(), "spans": index.spans}).encode("utf-8")
+
+def load_sections(data: bytes) -> SectionIndex:
+    raw = json.loads(data)
+    counts = np.array(raw["counts"], dtype=np.uint32).reshape(len(SECTION_NAMES), len(raw["terms"]))
+    return SectionIndex(tuple(raw["terms"]), counts, tuple(tuple(span) for span in raw["spans"]))
@@ -0,0 +1,153 @@
+"""Skill dictionary, Aho–Corasick skill matching and resume highlighting."""
+import re
+import html
+import bisect
+import hashlib
+from collections import deque, namedtuple
+
+from resumentor.taxonomy import default_taxonomy
+from resumentor.tracing import traced
+
+# ---------------------- Skill Matching ----------------------
+# Alphanumeric runs, or any single other visible character ("c++" -> c, +, +)
+_TOKEN_RE = re.compile(r"[^\W_]+|\S")
+
+SkillMatch = namedtuple("SkillMatch", ["start", "end", "skill"])
+
+def _tokenize(text: str):
+    return [m.group().lower() for m in _TOKEN_RE.finditer(text)]
+
+class SkillMatcher:
+    """
+    Aho–Corasick automaton over the tokens of a skill dictionary.
+    - one linear pass over the text reports every skill with its character span
+    - token-level matching gives word boundaries for free: "go" never matches "good",
+      "java" never matches "javascript"
+    - a plural "s" on the last word still matches ("REST APIs", "firewalls")
+    - aliases ({"k8s": "kubernetes"}) are matched too and reported as their skill
+    """
+
+    def __init__(self, skills, aliases=None):
+        self.skills = list(dict.fromkeys(s.lower() for s in skills))
+        self._known = set(self.skills)
+        ids = {skill: idx for idx, skill in enumerate(self.skills)}
+        patterns = list(ids.items())
+        patterns += sorted((alias.lower(), ids[skill.lower()]) for alias, skill in (aliases or {}).items())
+        # Identifies the dictionary in cache keys, so editing it invalidates cached skill spans
+        self.version = hashlib.sha1(repr(patterns).encode("utf-8")).hexdigest()[:12]
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]
+        for term, idx in patterns:
+            tokens = _tokenize(term)
+            if not tokens:
+                continue
+            self._insert(tokens, idx)
+            last = tokens[-1]
+            if last.isalpha() and not last.endswith("s"):
+                self._insert(tokens[:-1] + [last + "s"], idx)
+        self._link()
+
+    def _insert(self, tokens, idx):
+        node = 0
+        for tok in tokens:
+            nxt = self._goto[node].get(tok)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][tok] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            node = nxt
+        if (idx, len(tokens)) not in self._out[node]:
+            self._out[node] += ((idx, len(tokens)),)
+
+    def _link(self):
+        # Breadth-first failure links; each node also inherits the outputs of its fallback
+        goto, fail, out = self._goto, self._fail, self._out
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for tok, nxt in goto[node].items():
+                queue.append(nxt)
+                f = fail[node]
+                while f and tok not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(tok, 0)
+                out[nxt] += out[fail[nxt]]
+
+    def find(self, text: str):
+        goto, fail, out = self._goto, self._fail, self._out
+        matches = []
+        starts = []
+        node = 0
+        for m in _TOKEN_RE.finditer(text or ""):
+            tok = m.group().lower()
+            starts.append(m.start())
+            while node and tok not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(tok, 0)
+            for idx, n_tokens in out[node]:
+                matches.append(SkillMatch(starts[-n_tokens], m.end(), self.skills[idx]))
+        return matches
+
+    def skills_in(self, text: str) -> set:
+        return {match.skill for match in self.find(text)}
+
+    def __contains__(self, skill):
+        return skill in self._known
+
+# ---------------------- Skills Dictionary ----------------------
+# Loaded from resumentor/data/skills.json (or $RESUMENTOR_SKILLS_FILE), see resumentor.taxonomy
+skill_taxonomy = default_taxonomy()
+predefined_skills = skill_taxonomy.names
+skill_matcher = skill_taxonomy.matcher
+
+@traced()
+def highlight_missing_skills(resume_text: str, job_desc: str, jd_skills=None):
+    # Only check dictionary skills (prevents common stopwords); jd_skills skips re-scanning a precomputed JD
+    jd_mask = skill_taxonomy.mask(jd_skills) if jd_skills is not None else skill_taxonomy.mask_in(job_desc)
+    resume_mask = skill_taxonomy.with_ancestors(skill_taxonomy.mask_in(resume_text))
+    matched = skill_taxonomy.names_of(jd_mask & resume_mask)
+    missing = skill_taxonomy.names_of(jd_mask & ~resume_mask)
+    return matched, missing
+
+# ---------------------- Highlighting ----------------------
+# (open, close) markers per output target
+HIGHLIGHT_STYLES = {
+    "markdown": ("**", "**"),
+    "html": ("<mark>", "</mark>"),
+    "ansi": ("\x1b[1;32m", "\x1b[0m"),
+}
+
+def merge_spans(spans):
+    # Keep non-overlapping spans; where spans overlap the longest one wins
+    starts, chosen = [], []
+    for span in sorted(spans, key=lambda s: (s.start - s.end, s.start)):
+        i = bisect.bisect_left(starts, span.start)
+        if i and chosen[i - 1].end > span.start:
+            continue
+        if i < len(chosen) and chosen[i].start < span.end:
+            continue
+        starts.insert(i, span.start)
+        chosen.insert(i, span)
+    return chosen
+
+def highlight_spans(text: str, spans, style: str = "markdown") -> str:
+    open_tag, close_tag = HIGHLIGHT_STYLES[style]
+    escape = html.escape if style == "html" else (lambda s: s)
+    parts = []
+    pos = 0
+    for span in merge_spans(spans):
+        parts += [escape(text[pos:span.start]), open_tag, escape(text[span.start:span.end]), close_tag]
+        pos = span.end
+    parts.append(escape(text[pos:]))
+    return "".join(parts)
+
+@traced()
+def highlight_resume_text(resume_text: str, matched_skills, style: str = "markdown"):
+    # Mark matched skills in resume text using one scan over the text
+    wanted = {skill.lower() for skill in matched_skills}
+    matcher = skill_matcher if all(skill in skill_matcher for skill in wanted) else SkillMatcher(wanted)
+    spans = [m for m in matcher.find(resume_text) if m.skill in wanted]
+    return highlight_spans(resume_text, spans, style)
@@ -0,0 +1,158 @@
+"""
+Rule-based improvement suggestions.
+
+Each document is reduced once to a feature record (score, JD/resume cue flags, missing skills per
+taxonomy category); a table of rules is then evaluated over a column-oriented batch of those records.
+Suggestions come back as structured codes plus rendered text.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from resumentor.skills import skill_taxonomy
+from resumentor.tracing import traced
+
+# JD cues (substring match, case-insensitive)
+SENIORITY_CUES = ["lead", "mentor", "architecture", "design scalable", "ownership"]
+CLOUD_CUES = ["aws", "azure", "gcp"]
+AGILE_CUES = ["agile", "scrum"]
+JD_FLAG_NAMES = ("seniority", "cloud", "agile")
+# Resume cues
+PROJECT_CUES = ["project", "capstone", "case study"]
+CERTIFICATION_CUES = ["certified", "certificate"]
+RESUME_FLAG_NAMES = ("projects", "certification", "agile")
+# Taxonomy categories whose missing skills get an "add evidence" nudge, in output order
+EVIDENCE_CATEGORIES = ["cloud/devops", "data/ML", "web/full-stack", "databases", "security"]
+MAX_SUGGESTIONS = 10
+
+class CueScanner:
+    """
+    Reports which named cue groups occur in a text (substring match, case-insensitive).
+    The text is lowercased once for all groups.
+    """
+
+    def __init__(self, groups: dict):
+        self.groups = {name: [cue.lower() for cue in cues] for name, cues in groups.items()}
+
+    def flags(self, text: str) -> dict:
+        text_l = (text or "").lower()
+        return {name: any(cue in text_l for cue in cues) for name, cues in self.groups.items()}
+
+_JD_CUES = CueScanner({"seniority": SENIORITY_CUES, "cloud": CLOUD_CUES, "agile": AGILE_CUES})
+_RESUME_CUES = CueScanner({"projects": PROJECT_CUES, "certification": CERTIFICATION_CUES, "agile": AGILE_CUES})
+
+def compute_jd_flags(job_desc: str) -> dict:
+    # JD-only inputs to the suggestion rules; precomputed per JD by the JD index
+    return _JD_CUES.flags(job_desc)
+
+def compute_resume_flags(resume_text: str) -> dict:
+    # Resume-only inputs to the suggestion rules; cached with the resume-side analysis artifacts
+    return _RESUME_CUES.flags(resume_text)
+
+# ---------------------- Features ----------------------
+def suggestion_features(scores, missing_masks, jd_flags, resume_flags, taxonomy=skill_taxonomy) -> dict:
+    """
+    Column-oriented feature record for N documents.
+    - scores: N match scores
+    - missing_masks: N × len(taxonomy) boolean matrix of missing skills
+    - jd_flags / resume_flags: N dicts from compute_jd_flags / compute_resume_flags
+    """
+    missing = np.asarray(missing_masks, dtype=bool).reshape(len(scores), len(taxonomy))
+    counts = taxonomy.category_counts(missing)
+    features = {
+        "score": np.asarray(scores, dtype=float),
+        "missing": missing,
+        "missing_by_category": {c: counts[:, j] for j, c in enumerate(taxonomy.categories)},
+    }
+    for name in JD_FLAG_NAMES:
+        features[f"jd_{name}"] = np.array([flags[name] for flags in jd_flags], dtype=bool)
+    for name in RESUME_FLAG_NAMES:
+        features[f"resume_{name}"] = np.array([flags[name] for flags in resume_flags], dtype=bool)
+    return features
+
+# ---------------------- Rules ----------------------
+# when(features) -> N booleans; text is formatted with the rule's params ("label"/"skills" for evidence rules)
+Rule = namedtuple("Rule", ["code", "when", "text"])
+Suggestion = namedtuple("Suggestion", ["code", "text", "skills"])
+
+def _missing_in(category):
+    def when(f):
+        counts = f["missing_by_category"].get(category)
+        return counts > 0 if counts is not None else np.zeros(len(f["score"]), dtype=bool)
+    return when
+
+RULES = [
+    # Score-based guidance
+    Rule("score_low", lambda f: f["score"] < 50,
+         "Your score is low. Rewrite key sections with clear, keyword-rich bullet points aligned to the JD (Skills, Experience, Projects)."),
+    Rule("measurable_achievements", lambda f: f["score"] < 50,
+         "Add 2–3 recent, measurable achievements (e.g., 'Improved API latency by 35% using Redis cache')."),
+    Rule("score_medium", lambda f: (f["score"] >= 50) & (f["score"] < 75),
+         "Good start. Add missing keywords and strengthen project descriptions with metrics and tooling details."),
+    Rule("score_high", lambda f: f["score"] >= 75,
+         "Strong overall match. Do a final pass to mirror JD phrasing and tighten bullets."),
+    # Missing skills clustering (categories come from the skill taxonomy)
+    *[Rule(f"missing_skills:{category}", _missing_in(category),
+           "Add {label} evidence: **{skills}** in Projects/Experience/Skills.") for category in EVIDENCE_CATEGORIES],
+    # JD seniority cues
+    Rule("seniority", lambda f: f["jd_seniority"],
+         "JD hints seniority: highlight leadership, system design decisions, and mentoring impact."),
+    # Projects & certification nudges
+    Rule("projects_section", lambda f: ~f["resume_projects"],
+         "Add a Projects section with 2–3 bullets per project focusing on problem → solution → impact."),
+    Rule("cloud_certification", lambda f: f["jd_cloud"] & ~f["resume_certification"],
+         "Consider listing relevant cloud certifications (e.g., AWS CCP/Associate, Azure Fundamentals)."),
+    # Soft skills if JD mentions agile/scrum
+    Rule("agile_collaboration", lambda f: f["jd_agile"] & ~f["resume_agile"],
+         "Mention Agile/Scrum collaboration (ceremonies, cross-functional teamwork) where applicable."),
+    # Formatting hygiene
+    Rule("formatting", lambda f: np.ones(len(f["score"]), dtype=bool),
+         "Ensure consistent formatting: section headings, bullet alignment, and unified tense per section."),
+]
+
+def evaluate_rules(features: dict, rules=RULES, taxonomy=skill_taxonomy, limit: int = MAX_SUGGESTIONS):
+    # -> one list of Suggestion per document, in rule order, at most `limit` each
+    fired = np.empty((len(rules), len(features["score"])), dtype=bool)
+    for j, rule in enumerate(rules):
+        fired[j] = rule.when(features)
+    results = []
+    for row, hits in enumerate(fired.T):
+        suggestions = []
+        groups = None
+        for j in np.flatnonzero(hits)[:limit].tolist():
+            rule = rules[j]
+            skills = ()
+            if rule.code.startswith("missing_skills:"):
+                if groups is None:
+                    groups = taxonomy.group(features["missing"][row])
+                label = rule.code.split(":", 1)[1]
+                skills = tuple(groups[label][:6])
+                text = rule.text.format(label=label, skills=", ".join(skills))
+            else:
+                text = rule.text
+            suggestions.append(Suggestion(rule.code, text, skills))
+        results.append(suggestions)
+    return results
+
+def suggest(score: float, missing, job_desc: str, resume_text: str, jd_flags=None, resume_flags=None):
+    # Structured suggestions for one document; flags skip re-scanning a precomputed JD/resume
+    features = suggestion_features(
+        [score], [skill_taxonomy.mask(missing)],
+        [jd_flags if jd_flags is not None else compute_jd_flags(job_desc)],
+        [resume_flags if resume_flags is not None else compute_resume_flags(resume_text)],
+    )
+    return evaluate_rules(features)[0]
+
+@traced(size_arg=4)
+def generate_ai_suggestions(score: float, matched, missing, job_desc: str, resume_text: str, jd_flags=None,
+                            resume_flags=None):
+    """
+    Lightweight rule-based 'AI' suggestions based on:
+    - score thresholds
+    - missing skills grouping
+    - presence of project/certification terms
+    - seniority cues in JD
+    Pass `jd_flags` / `resume_flags` (see compute_jd_flags / compute_resume_flags) to skip re-scanning.
+    Returns the rendered text; see suggest() for codes.
+    """
+    return [s.text for s in suggest(score, missing, job_desc, resume_text, jd_flags, resume_flags)]
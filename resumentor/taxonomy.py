@@ -0,0 +1,144 @@
+"""
+Skill taxonomy: canonical skills with aliases, categories and parent links, loaded from a file.
+
+Skills are interned as integer ids (their position in `names`) and skill sets are numpy boolean
+masks over those ids, so matched/missing set algebra and category grouping stay vectorized for
+dictionaries with tens of thousands of entries.
+"""
+import os
+import json
+import functools
+
+import numpy as np
+
+# JSON/JSONL taxonomy to use instead of the bundled resumentor/data/skills.json
+SKILLS_FILE_ENV = "RESUMENTOR_SKILLS_FILE"
+DEFAULT_SKILLS_FILE = os.path.join(os.path.dirname(__file__), "data", "skills.json")
+
+class SkillTaxonomy:
+    """
+    - names: canonical skill names; a skill's id is its index
+    - aliases: {surface form: id}, e.g. "k8s" -> id of "kubernetes" (canonical names included)
+    - categories: category names; `category` holds each skill's category index (-1 = none)
+    - parent: each skill's parent id (-1 = root)
+    """
+
+    def __init__(self, names, aliases: dict, categories, category, parent):
+        self.names = list(names)
+        self.aliases = dict(aliases)
+        self.categories = list(categories)
+        self.category = np.asarray(category, dtype=np.int32)
+        self.parent = np.asarray(parent, dtype=np.int32)
+        self._matcher = None
+        self._parent_matrix = None
+
+    @classmethod
+    def from_records(cls, records, categories=()):
+        """
+        records: iterable of {"name", "aliases" (optional list), "category" (optional), "parent" (optional)}.
+        Categories keep the order of `categories`, then first appearance.
+        """
+        records = list(records)
+        names = list(dict.fromkeys(r["name"].strip().lower() for r in records))
+        ids = {name: i for i, name in enumerate(names)}
+        category_ids = {c: i for i, c in enumerate(dict.fromkeys(categories))}
+        aliases = dict(ids)
+        category = np.full(len(names), -1, dtype=np.int32)
+        parent = np.full(len(names), -1, dtype=np.int32)
+        for r in records:
+            i = ids[r["name"].strip().lower()]
+            for alias in r.get("aliases", ()):
+                aliases.setdefault(alias.strip().lower(), i)
+            if r.get("category"):
+                category[i] = category_ids.setdefault(r["category"], len(category_ids))
+            if r.get("parent"):
+                p = r["parent"].strip().lower()
+                if p not in ids:
+                    raise ValueError(f"Skill {r['name']!r} has unknown parent {r['parent']!r}")
+                parent[i] = ids[p]
+        return cls(names, aliases, list(category_ids), category, parent)
+
+    @classmethod
+    def load(cls, path):
+        """
+        - .json: {"categories": [...], "skills": [record, ...]} or a bare list of records
+        - .jsonl: one record per line
+        """
+        with open(path, encoding="utf-8") as fh:
+            if path.lower().endswith(".jsonl"):
+                return cls.from_records(json.loads(line) for line in fh if line.strip())
+            data = json.load(fh)
+        if isinstance(data, list):
+            return cls.from_records(data)
+        return cls.from_records(data["skills"], data.get("categories", ()))
+
+    def __len__(self):
+        return len(self.names)
+
+    def resolve(self, name: str):
+        # Skill id for a canonical name or alias, else None
+        return self.aliases.get(name.strip().lower())
+
+    @property
+    def matcher(self):
+        # Shared SkillMatcher over every name and alias; aliases are reported as their canonical skill
+        if self._matcher is None:
+            from resumentor.skills import SkillMatcher
+            aliases = {alias: self.names[i] for alias, i in self.aliases.items() if alias != self.names[i]}
+            self._matcher = SkillMatcher(self.names, aliases)
+        return self._matcher
+
+    # ---------------------- Skill Sets ----------------------
+    def mask(self, skills) -> np.ndarray:
+        # Boolean mask over skill ids; unknown names are ignored
+        mask = np.zeros(len(self.names), dtype=bool)
+        ids = [i for i in map(self.resolve, skills) if i is not None]
+        mask[ids] = True
+        return mask
+
+    def mask_in(self, text: str) -> np.ndarray:
+        return self.mask(match.skill for match in self.matcher.find(text))
+
+    def names_of(self, mask) -> list:
+        return sorted(self.names[i] for i in np.flatnonzero(mask))
+
+    def group(self, mask) -> dict:
+        # {category: sorted skill names} for the skills in `mask`, in category order
+        ids = np.flatnonzero(mask)
+        by_category = {}
+        for i, c in zip(ids.tolist(), self.category[ids].tolist()):
+            if c >= 0:
+                by_category.setdefault(c, []).append(self.names[i])
+        return {self.categories[c]: sorted(by_category[c]) for c in sorted(by_category)}
+
+    def category_counts(self, masks) -> np.ndarray:
+        # N × len(categories) skill counts for an N × len(self) stack of masks
+        masks = np.atleast_2d(masks)
+        n_rows, n_categories = masks.shape[0], len(self.categories)
+        rows, ids = np.nonzero(masks)
+        categories = self.category[ids]
+        keep = categories >= 0
+        counts = np.bincount(rows[keep] * n_categories + categories[keep], minlength=n_rows * n_categories)
+        return counts.reshape(n_rows, n_categories)
+
+    # ---------------------- Hierarchy ----------------------
+    def with_ancestors(self, mask) -> np.ndarray:
+        """
+        Close a skill set, or an N × len(self) stack of them, under "parent of": a resume listing postgresql
+        also has sql, so a JD asking for sql does not report it missing. One sparse product per level.
+        """
+        if self._parent_matrix is None:
+            from scipy import sparse
+            children = np.flatnonzero(self.parent >= 0)
+            self._parent_matrix = sparse.csr_matrix(
+                (np.ones(len(children), dtype=np.int32), (children, self.parent[children])), shape=(len(self), len(self)))
+        closed = np.array(mask, dtype=bool)
+        frontier = closed
+        while frontier.any():
+            frontier = (frontier.astype(np.int32) @ self._parent_matrix > 0) & ~closed
+            closed |= frontier
+        return closed
+
+@functools.lru_cache(maxsize=1)
+def default_taxonomy() -> SkillTaxonomy:
+    return SkillTaxonomy.load(os.environ.get(SKILLS_FILE_ENV) or DEFAULT_SKILLS_FILE)
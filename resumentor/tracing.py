@@ -0,0 +1,195 @@
+"""
+Lightweight tracing for the analysis pipeline.
+
+Every traced stage records wall time, CPU time (calling thread) and bytes processed into
+process-wide counters; stages that run inside `tracer.run(...)` are also kept per run, for the last N runs.
+Counters export in Prometheus text format. A run can optionally capture a cProfile/pyinstrument report.
+"""
+import io
+import os
+import time
+import pstats
+import cProfile
+import functools
+import threading
+from collections import deque, defaultdict
+from contextlib import contextmanager
+
+# RESUMENTOR_PROFILE=1|cprofile|pyinstrument profiles every traced run
+PROFILE_ENV = "RESUMENTOR_PROFILE"
+# When set, Prometheus text is rewritten here after each run (node_exporter textfile collector)
+METRICS_FILE_ENV = "RESUMENTOR_METRICS_FILE"
+
+_COUNTERS = [
+    ("calls_total", "counter", "Calls per pipeline stage."),
+    ("errors_total", "counter", "Calls per pipeline stage that raised."),
+    ("wall_seconds_total", "counter", "Wall-clock seconds spent per pipeline stage."),
+    ("cpu_seconds_total", "counter", "CPU seconds (calling thread) spent per pipeline stage."),
+    ("bytes_total", "counter", "Input bytes processed per pipeline stage."),
+]
+
+def profile_engine(value) -> str:
+    # Normalise a query param / env value to None, "cprofile" or "pyinstrument"
+    value = (value or "").strip().lower()
+    if value in {"", "0", "false", "no", "off"}:
+        return None
+    return "pyinstrument" if value == "pyinstrument" else "cprofile"
+
+def _nbytes(obj) -> int:
+    if isinstance(obj, (str, bytes, bytearray)):
+        return len(obj)
+    if hasattr(obj, "getbuffer"):
+        return obj.getbuffer().nbytes
+    return getattr(obj, "size", 0) or 0
+
+class Tracer:
+    def __init__(self, max_runs: int = 50):
+        self.runs = deque(maxlen=max_runs)
+        self._counters = defaultdict(lambda: dict.fromkeys((name for name, _, _ in _COUNTERS), 0))
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def span(self, stage: str, nbytes: int = 0):
+        wall, cpu = time.perf_counter(), time.thread_time()
+        failed = False
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            wall, cpu = time.perf_counter() - wall, time.thread_time() - cpu
+            self.merge([{"stage": stage, "wall_ms": round(wall * 1000, 3), "cpu_ms": round(cpu * 1000, 3),
+                         "bytes": nbytes, "error": failed}])
+
+    def merge(self, stages, count: bool = True):
+        """
+        Add stage records ({stage, wall_ms, cpu_ms, bytes, error}) to the current run, if any, and with
+        count=True to the counters. Used by span() and for stages recorded in another process (see capture()).
+        """
+        if count:
+            with self._lock:
+                for record in stages:
+                    counters = self._counters[record["stage"]]
+                    counters["calls_total"] += 1
+                    counters["errors_total"] += record["error"]
+                    counters["wall_seconds_total"] += record["wall_ms"] / 1000
+                    counters["cpu_seconds_total"] += record["cpu_ms"] / 1000
+                    counters["bytes_total"] += record["bytes"]
+        current = getattr(self._local, "run", None)
+        if current is not None:
+            current["stages"].extend(stages)
+
+    @contextmanager
+    def capture(self, profile=None):
+        """
+        Collect the stage records of a block without keeping a run (e.g. in a worker process).
+        Yields {"stages", "profile"}; `profile` works as in run() and the report is filled in on exit.
+        """
+        engine = profile_engine(profile) if profile is not None else profile_engine(os.environ.get(PROFILE_ENV))
+        record = {"stages": [], "profile": None}
+        previous, self._local.run = getattr(self._local, "run", None), record
+        profiler = _start_profiler(engine)
+        try:
+            yield record
+        finally:
+            record["profile"] = _stop_profiler(engine, profiler)
+            self._local.run = previous
+
+    @contextmanager
+    def run(self, label: str, profile=None):
+        """
+        Group the spans of one analysis. `profile` is "cprofile", "pyinstrument" or None
+        (None falls back to $RESUMENTOR_PROFILE). Yields the run record; set its "keep" to False
+        inside the block to drop the run (e.g. a poll that did no work).
+        """
+        engine = profile_engine(profile) if profile is not None else profile_engine(os.environ.get(PROFILE_ENV))
+        record = {"label": label, "started_at": time.time(), "stages": [], "wall_ms": 0.0, "profile": None,
+                  "keep": True}
+        previous, self._local.run = getattr(self._local, "run", None), record
+        profiler = _start_profiler(engine)
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["wall_ms"] = round((time.perf_counter() - start) * 1000, 3)
+            record["profile"] = _stop_profiler(engine, profiler)
+            self._local.run = previous
+            if record.pop("keep"):
+                self._keep(record)
+
+    def record_run(self, label: str, started_at: float, wall_ms: float, stages, profile=None):
+        # Keep a run timed elsewhere (e.g. a background job, from submission to result); stages are not counted
+        self._keep({"label": label, "started_at": started_at, "stages": list(stages),
+                    "wall_ms": round(wall_ms, 3), "profile": profile})
+
+    def _keep(self, record):
+        with self._lock:
+            self.runs.append(record)
+        metrics_file = os.environ.get(METRICS_FILE_ENV)
+        if metrics_file:
+            self.write_prometheus(metrics_file)
+
+    def counters(self) -> dict:
+        with self._lock:
+            return {stage: dict(values) for stage, values in self._counters.items()}
+
+    def prometheus_text(self, prefix: str = "resumentor_stage") -> str:
+        counters = self.counters()
+        lines = []
+        for name, kind, help_text in _COUNTERS:
+            metric = f"{prefix}_{name}"
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} {kind}"]
+            for stage in sorted(counters):
+                lines.append(f'{metric}{{stage="{stage}"}} {counters[stage][name]:g}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        # Write-then-rename so scrapers never read a half-written file
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            fh.write(self.prometheus_text())
+        os.replace(tmp, path)
+
+def _start_profiler(engine):
+    if engine == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            engine = "cprofile"
+        else:
+            profiler = Profiler()
+            profiler.start()
+            return profiler
+    if engine == "cprofile":
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return profiler
+    return None
+
+def _stop_profiler(engine, profiler):
+    if profiler is None:
+        return None
+    if isinstance(profiler, cProfile.Profile):
+        profiler.disable()
+        out = io.StringIO()
+        pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(30)
+        return out.getvalue()
+    profiler.stop()
+    return profiler.output_text(unicode=True, color=False)
+
+tracer = Tracer()
+
+def traced(stage: str = None, size_arg: int = 0):
+    # Decorator: time every call as `stage` (default: function name); bytes = size of positional arg `size_arg`
+    def decorate(fn):
+        name = stage or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            nbytes = _nbytes(args[size_arg]) if len(args) > size_arg else 0
+            with tracer.span(name, nbytes):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
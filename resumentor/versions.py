@@ -0,0 +1,201 @@
+"""
+Copy-on-write dataset versions for the Dashboard.
+
+A version is its parent plus one operation. Operations run on a TableView: an immutable base frame, the
+base rows still selected, and the columns that were replaced. Unchanged columns are never copied, a
+version only becomes a DataFrame when something needs one, and resetting is a pointer swap.
+"""
+import itertools
+
+import numpy as np
+import pandas as pd
+
+class TableView:
+    """
+    Rows `rows` (base positions; None = all) of an immutable `base` frame, with `overrides`
+    ({column: values aligned to the selected rows}) in place of base columns.
+    Every method returns a new view; the base is never modified.
+    """
+
+    def __init__(self, base: pd.DataFrame, rows=None, overrides=None, columns=None):
+        self.base = base
+        self.rows = rows
+        self.overrides = dict(overrides or {})
+        self.columns = list(base.columns if columns is None else columns)
+
+    def __len__(self):
+        return len(self.base) if self.rows is None else len(self.rows)
+
+    def dtype(self, name):
+        return self.overrides[name].dtype if name in self.overrides else self.base[name].dtype
+
+    def column_map(self, name, fn) -> np.ndarray:
+        # fn(values) -> one value per row, for the selected rows, without first copying a filtered base column
+        if name in self.overrides:
+            return np.asarray(fn(self.overrides[name]))
+        result = np.asarray(fn(self.base[name]))
+        return result if self.rows is None else result[self.rows]
+
+    def column(self, name) -> pd.Series:
+        # Values of one column for the selected rows (a copy only if rows were filtered)
+        if name in self.overrides:
+            return self.overrides[name]
+        values = self.base[name]
+        if self.rows is not None:
+            values = values.take(self.rows)
+        return values.reset_index(drop=True)
+
+    def with_columns(self, values: dict) -> "TableView":
+        # Replace or add columns; values must have one entry per selected row
+        overrides = dict(self.overrides)
+        columns = list(self.columns)
+        for name, column in values.items():
+            overrides[name] = pd.Series(column, name=name).reset_index(drop=True)
+            if name not in columns:
+                columns.append(name)
+        return TableView(self.base, self.rows, overrides, columns)
+
+    def drop(self, names) -> "TableView":
+        names = set(names)
+        overrides = {k: v for k, v in self.overrides.items() if k not in names}
+        return TableView(self.base, self.rows, overrides, [c for c in self.columns if c not in names])
+
+    def filter(self, keep) -> "TableView":
+        # Keep the selected rows where the boolean mask `keep` is True
+        keep = np.asarray(keep, dtype=bool)
+        if keep.all():
+            return self
+        rows = np.flatnonzero(keep) if self.rows is None else self.rows[keep]
+        overrides = {k: v[keep].reset_index(drop=True) for k, v in self.overrides.items()}
+        return TableView(self.base, rows, overrides, self.columns)
+
+    def dropna(self, subset=None) -> "TableView":
+        keep = np.ones(len(self), dtype=bool)
+        for name in subset or self.columns:
+            keep &= self.column_map(name, pd.notna)
+        return self.filter(keep)
+
+    def row_codes(self, subset=None) -> np.ndarray:
+        # One integer per row, equal for rows with equal values in `subset` (NaN equals NaN), built column by column
+        codes = np.zeros(len(self), dtype=np.int64)
+        n_codes = 1
+        for name in subset or self.columns:
+            column_codes = self.column_map(name, lambda values: pd.factorize(values, use_na_sentinel=False)[0])
+            n_column = int(column_codes.max(initial=0)) + 1
+            if n_codes * n_column >= 2 ** 63:
+                # Compress to dense codes only when the combined code could overflow
+                codes, uniques = pd.factorize(codes)
+                n_codes = len(uniques)
+            codes = codes * n_column + column_codes
+            n_codes *= n_column
+        return codes
+
+    def duplicated(self, subset=None) -> np.ndarray:
+        # Same as DataFrame.duplicated(subset, keep="first")
+        return pd.Series(self.row_codes(subset)).duplicated().to_numpy()
+
+    def drop_duplicates(self, subset=None) -> "TableView":
+        return self.filter(~self.duplicated(subset))
+
+    def to_frame(self, columns=None) -> pd.DataFrame:
+        # Unfiltered, unchanged columns are shared with the base (pandas 3 copy-on-write protects it)
+        columns = list(self.columns if columns is None else columns)
+        if self.rows is None and not self.overrides and columns == list(self.base.columns):
+            return self.base
+        return pd.DataFrame({name: self.column(name) for name in columns}, columns=columns)
+
+_version_ids = itertools.count(1)
+
+class DatasetVersion:
+    """
+    One immutable state of a dataset: the base (`parent` None) or `op` applied to `parent`.
+    - op: callable TableView -> TableView, run the first time the view is needed
+    - id: unique per process; key for anything derived from this version (charts, profiles)
+    """
+
+    def __init__(self, parent=None, op=None, label: str = "", view: TableView = None):
+        self.id = next(_version_ids)
+        self.parent = parent
+        self.op = op
+        self.label = label
+        self._view = view
+        self._frame = None
+        self._derived = {}
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, label: str = "original") -> "DatasetVersion":
+        return cls(label=label, view=TableView(df))
+
+    def then(self, op, label: str = "") -> "DatasetVersion":
+        # Lazy: nothing runs until the new version's view or frame is used
+        return DatasetVersion(self, op, label)
+
+    @property
+    def view(self) -> TableView:
+        if self._view is None:
+            self._view = self.op(self.parent.view)
+        return self._view
+
+    def frame(self) -> pd.DataFrame:
+        if self._frame is None:
+            self._frame = self.view.to_frame()
+        return self._frame
+
+    def cached(self, key, compute):
+        # Memoize compute(frame) under `key` (chart aggregates, profiles); small results survive release()
+        if key not in self._derived:
+            self._derived[key] = compute(self.frame())
+        return self._derived[key]
+
+    def peek(self, key):
+        # A result cached() already holds, or None (never computes)
+        return self._derived.get(key)
+
+    def release(self):
+        # Drop cached data; a derived version recomputes it from its parent when asked again
+        if self.parent is not None:
+            self._view = None
+        self._frame = None
+
+    @property
+    def root(self) -> "DatasetVersion":
+        version = self
+        while version.parent is not None:
+            version = version.parent
+        return version
+
+    def history(self) -> list:
+        versions = []
+        version = self
+        while version is not None:
+            versions.append(version)
+            version = version.parent
+        return versions[::-1]
+
+class DatasetHistory:
+    """
+    The Dashboard's dataset: an original version plus a pointer to the current one.
+    Moving the pointer releases the old current version, so only the base and one derived
+    version hold data at a time.
+    """
+
+    def __init__(self, df: pd.DataFrame, label: str = "original"):
+        self.original = DatasetVersion.from_frame(df, label)
+        self.current = self.original
+
+    def _move(self, version: DatasetVersion) -> DatasetVersion:
+        if version is not self.current:
+            # Compute the new view before letting go of the one it is derived from
+            version.view
+            self.current.release()
+            self.current = version
+        return version
+
+    def apply(self, op, label: str = "") -> DatasetVersion:
+        return self._move(self.current.then(op, label))
+
+    def reset(self) -> DatasetVersion:
+        return self._move(self.original)
+
+    def frame(self) -> pd.DataFrame:
+        return self.current.frame()
@@ -0,0 +1,36 @@
+"""Optional background warm-up of the other pages' imports after first paint."""
+import os
+import importlib
+import threading
+
+_started = False
+_lock = threading.Lock()
+
+def warmup_enabled() -> bool:
+    # RESUMENTOR_WARMUP=0 turns the background thread off (e.g. on memory-tight replicas)
+    return os.environ.get("RESUMENTOR_WARMUP", "1").strip().lower() not in {"0", "false", "no", "off"}
+
+def _import_all(modules):
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            # Warm-up is best effort; the page will surface the real import error
+            pass
+
+def start_warmup(page_modules: dict, first_page=None):
+    """
+    Import every page's modules ({page: [module, ...]}, declared by the app) on a daemon thread, once per
+    process. Modules for `first_page` are warmed first. Returns the thread, or None if already started/disabled.
+    """
+    global _started
+    with _lock:
+        if _started or not warmup_enabled():
+            return None
+        _started = True
+    order = list(page_modules.get(first_page, []))
+    for modules in page_modules.values():
+        order += [m for m in modules if m not in order]
+    thread = threading.Thread(target=_import_all, args=(order,), name="resumentor-warmup", daemon=True)
+    thread.start()
+    return thread